@@ -1,6 +1,7 @@
-import pickle
+import os
 import tempfile
 from pathlib import Path
+from typing import Optional
 from unittest import mock
 
 from toposort import CircularDependencyError
@@ -16,11 +17,13 @@ from xsdata.codegen.mappers import (
 )
 from xsdata.codegen.parsers import DefinitionsParser, DtdParser
 from xsdata.codegen.transformer import ResourceTransformer
+from xsdata.codegen.transformer import map_schema as transformer_map_schema
 from xsdata.codegen.utils import ClassUtils
 from xsdata.codegen.writer import CodeWriter
 from xsdata.formats.dataclass.models.generics import AnyElement
 from xsdata.formats.dataclass.parsers import TreeParser
 from xsdata.models.config import GeneratorConfig
+from xsdata.models.enums import Namespace
 from xsdata.models.wsdl import Binding, Definitions, Types
 from xsdata.models.xsd import Import, Include, Override, Schema
 from xsdata.utils.testing import ClassFactory, DtdFactory, FactoryTestCase
@@ -67,44 +70,20 @@ class ResourceTransformerTests(FactoryTestCase):
         mock_process_dtds.assert_called_once_with(uris[8:])
         mock_process_classes.assert_called_once_with()
 
+    @mock.patch.object(ResourceTransformer, "prune_cache")
     @mock.patch.object(ResourceTransformer, "process_classes")
     @mock.patch.object(ResourceTransformer, "process_sources")
-    @mock.patch.object(ResourceTransformer, "get_cache_file")
-    def test_process_from_cache(
-        self, mock_get_cache_file, mock_process_sources, mock_process_classes
-    ):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            cache = Path(tmpdir).joinpath("foo.cache")
-            classes = ClassFactory.list(2)
-            cache.write_bytes(pickle.dumps(classes))
-
-            mock_get_cache_file.return_value = cache
-            uris = ["a.xml", "b.xml"]
-
-            self.transformer.process(uris, cache=True)
-
-            self.assertEqual(classes, self.transformer.classes)
-            self.assertEqual(0, mock_process_sources.call_count)
-            mock_process_classes.assert_called_once_with()
-
-    @mock.patch.object(ResourceTransformer, "process_classes")
-    @mock.patch.object(ResourceTransformer, "process_sources")
-    @mock.patch.object(ResourceTransformer, "get_cache_file")
     def test_process_with_cache(
-        self, mock_get_cache_file, mock_process_sources, mock_process_classes
+        self, mock_process_sources, mock_process_classes, mock_prune_cache
     ):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            cache = Path(tmpdir).joinpath("foo.cache")
-            classes = ClassFactory.list(2)
-            self.transformer.classes = classes
-            mock_get_cache_file.return_value = cache
-            uris = ["a.xml", "b.xml"]
+        uris = ["a.xsd", "b.xsd"]
 
-            self.transformer.process(uris, cache=True)
-            self.assertEqual(1, mock_process_sources.call_count)
+        self.transformer.process(uris, cache=True)
 
-            self.assertEqual(classes, pickle.loads(cache.read_bytes()))
-            mock_process_classes.assert_called_once_with()
+        self.assertTrue(self.transformer.cache)
+        mock_process_sources.assert_called_once_with(uris)
+        mock_process_classes.assert_called_once_with()
+        mock_prune_cache.assert_called_once_with()
 
     @mock.patch.object(ResourceTransformer, "process_classes")
     def test_process_with_circular_dependencies_error(self, mock_process_classes):
@@ -145,6 +124,107 @@ class ResourceTransformerTests(FactoryTestCase):
 
         mock_process_schema.assert_has_calls([mock.call(uri) for uri in uris])
 
+    @mock.patch.object(ResourceTransformer, "process_schema")
+    @mock.patch.object(ResourceTransformer, "process_schemas_concurrently")
+    def test_process_schemas_with_workers(
+        self, mock_process_schemas_concurrently, mock_process_schema
+    ):
+        uris = ["http://xsdata/foo.xsd", "http://xsdata/bar.xsd"]
+
+        self.transformer.workers = 2
+        self.transformer.process_schemas([])
+        self.transformer.process_schemas(uris)
+
+        mock_process_schemas_concurrently.assert_called_once_with(uris)
+        self.assertEqual(0, mock_process_schema.call_count)
+
+    def test_process_schemas_concurrently(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmp_dir = Path(tmpdir)
+            write_schema(
+                tmp_dir.joinpath("main.xsd"),
+                '<xs:include schemaLocation="common.xsd"/>'
+                '<xs:import namespace="urn:other" schemaLocation="other.xsd"/>'
+                '<xs:element name="main" type="xs:string"/>',
+                "urn:main",
+            )
+            write_schema(
+                tmp_dir.joinpath("other.xsd"),
+                '<xs:include schemaLocation="common.xsd"/>'
+                '<xs:include schemaLocation="missing.xsd"/>'
+                '<xs:element name="other" type="xs:int"/>',
+                "urn:other",
+            )
+            write_schema(
+                tmp_dir.joinpath("common.xsd"),
+                '<xs:element name="common" type="xs:string"/>',
+            )
+            write_schema(
+                tmp_dir.joinpath("last.xsd"),
+                '<xs:element name="last" type="xs:int"/>',
+            )
+
+            uris = [tmp_dir.joinpath(x).as_uri() for x in ("main.xsd", "last.xsd")]
+            uris.append(uris[-1])
+
+            serial = ResourceTransformer(print=True, config=GeneratorConfig())
+            serial.process_schemas(uris)
+            concurrent = ResourceTransformer(
+                print=True, config=serial.config, workers=2
+            )
+            concurrent.process_schemas(uris)
+
+        actual = [(x.qname, x.location) for x in concurrent.classes]
+        self.assertEqual([(x.qname, x.location) for x in serial.classes], actual)
+        self.assertEqual(serial.classes, concurrent.classes)
+        self.assertEqual(set(serial.processed), set(concurrent.processed))
+        self.assertEqual(4, len(actual))
+        self.assertEqual("{urn:other}common", actual[0][0])
+
+    def test_process_schemas_with_cache(self):
+        def process(workers: int) -> ResourceTransformer:
+            transformer = ResourceTransformer(
+                print=True, config=GeneratorConfig(), workers=workers
+            )
+            transformer.cache = True
+            transformer.process_schemas([main.as_uri()])
+            return transformer
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmp_dir = Path(tmpdir)
+            main = tmp_dir.joinpath("main.xsd")
+            common = tmp_dir.joinpath("common.xsd")
+            write_schema(
+                main,
+                '<xs:include schemaLocation="common.xsd"/>'
+                '<xs:element name="main" type="xs:string"/>',
+                "urn:main",
+            )
+            write_schema(common, '<xs:element name="common" type="xs:int"/>')
+
+            with mock.patch.object(tempfile, "gettempdir", return_value=tmpdir):
+                first = process(1)
+                self.assertEqual(2, len(list(tmp_dir.joinpath("xsdata").iterdir())))
+
+                with mock.patch("xsdata.codegen.transformer.map_schema") as mock_map:
+                    self.assertEqual(first.classes, process(1).classes)
+                    self.assertEqual(first.classes, process(2).classes)
+                    self.assertEqual(0, mock_map.call_count)
+
+                common.write_text(common.read_text().replace("common", "changed"))
+                with mock.patch(
+                    "xsdata.codegen.transformer.map_schema",
+                    wraps=transformer_map_schema,
+                ) as mock_map:
+                    second = process(1)
+                    mock_map.assert_called_once_with(
+                        common.read_bytes(), common.as_uri(), "urn:main"
+                    )
+
+                self.assertEqual(["changed", "main"], [x.name for x in second.classes])
+                self.assertEqual(second.classes, process(2).classes)
+                self.assertEqual(3, len(list(tmp_dir.joinpath("xsdata").iterdir())))
+
     @mock.patch.object(ClassUtils, "reduce_classes")
     @mock.patch.object(ElementMapper, "map")
     @mock.patch.object(TreeParser, "from_bytes")
@@ -480,9 +560,48 @@ class ResourceTransformerTests(FactoryTestCase):
         mock_process.assert_called_once()
 
     def test_get_cache_file(self):
-        uris = ["a.xml", "b.json"]
-        actual = self.transformer.get_cache_file(uris)
-        tempdir = Path(tempfile.gettempdir())
-        expected = tempdir.joinpath("ae1bed744d3d3611e698a2d2ef5335d2.cache")
+        uris = ["a.xsd", "b.xsd"]
+        with self.assertWarns(DeprecationWarning):
+            actual = self.transformer.get_cache_file(uris)
 
+        expected = Path(tempfile.gettempdir()).joinpath(
+            "6564a0ff07a61e6f3b89c8452b310165.cache"
+        )
         self.assertEqual(expected, actual)
+
+    @mock.patch("xsdata.codegen.transformer.__version__", "1.0")
+    def test_get_schema_cache_file(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with mock.patch.object(tempfile, "gettempdir", return_value=tmpdir):
+                actual = self.transformer.get_schema_cache_file(b"foo", "a.xsd", None)
+                other = self.transformer.get_schema_cache_file(b"foo", "a.xsd", "bar")
+
+            digest = "e5c39ee5931629bc070ffaf4e95bf24308b40d414ecfd35446776db2b92f3997"
+            expected = Path(tmpdir).joinpath("xsdata", f"{digest}.cache")
+
+            self.assertEqual(expected, actual)
+            self.assertNotEqual(actual, other)
+
+    def test_prune_cache(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache_dir = Path(tmpdir).joinpath("xsdata")
+            cache_dir.mkdir()
+            files = [cache_dir.joinpath(f"{i}.cache") for i in range(4)]
+            for mtime, file in zip((4, 1, 3, 2), files):
+                file.write_bytes(b"")
+                os.utime(file, (mtime, mtime))
+
+            other = cache_dir.joinpath("other.txt")
+            other.write_bytes(b"")
+            os.utime(other, (0, 0))
+
+            with mock.patch.object(tempfile, "gettempdir", return_value=tmpdir):
+                self.transformer.prune_cache(max_files=2)
+
+            actual = sorted(path.name for path in cache_dir.iterdir())
+            self.assertEqual(["0.cache", "2.cache", "other.txt"], actual)
+
+
+def write_schema(path: Path, body: str, namespace: Optional[str] = None):
+    tns = f' targetNamespace="{namespace}"' if namespace else ""
+    path.write_text(f'<xs:schema xmlns:xs="{Namespace.XS.uri}"{tns}>{body}</xs:schema>')
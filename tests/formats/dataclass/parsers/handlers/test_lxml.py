@@ -62,6 +62,27 @@ class LxmlEventHandlerTests(TestCase):
 
         self.assertEqual("Unhandled event: `reverse`.", str(cm.exception))
 
+    def test_iterparse(self):
+        path = fixtures_dir.joinpath("books/books.xml")
+        handler = self.parser.handler(clazz=Books, parser=self.parser)
+        result = list(handler.iterparse(str(path), self.parser.ns_map))
+
+        self.assertEqual(("start", "{urn:books}books"), result[0])
+        self.assertEqual(("start", "book"), result[1])
+        self.assertEqual(("end", "{urn:books}books"), result[-1])
+        self.assertEqual(books, handler.objects[-1][1])
+        self.assertEqual(events, self.parser.events)
+
+    def test_iterparse_with_element_or_tree(self):
+        path = fixtures_dir.joinpath("books/books.xml")
+        tree = etree.parse(str(path))
+        handler = self.parser.handler(clazz=BookForm, parser=self.parser)
+        result = list(handler.iterparse(tree.find(".//book"), {}))
+
+        self.assertEqual(("start", "book"), result[0])
+        self.assertEqual(("end", "book"), result[-1])
+        self.assertEqual(books.book[0], handler.objects[-1][1])
+
     def test_parse_with_xml_syntax_error(self):
         with self.assertRaises(ParserError):
             self.parser.from_string("<", Books)
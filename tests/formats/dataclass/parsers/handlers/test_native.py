@@ -1,4 +1,5 @@
 import sys
+from unittest import mock
 from unittest.case import TestCase
 from xml import etree
 
@@ -38,6 +39,49 @@ class XmlEventHandlerTests(TestCase):
 
         self.assertEqual("Unhandled event: `reverse`.", str(cm.exception))
 
+    def test_iterparse(self):
+        path = fixtures_dir.joinpath("books/books.xml")
+        handler = self.parser.handler(clazz=Books, parser=self.parser)
+        result = list(handler.iterparse(str(path), self.parser.ns_map))
+
+        self.assertEqual(("start", "{urn:books}books"), result[0])
+        self.assertEqual(("start", "book"), result[1])
+        self.assertEqual(("end", "{urn:books}books"), result[-1])
+        self.assertEqual(books, handler.objects[-1][1])
+        self.assertEqual(events, self.parser.events)
+
+    def test_iterparse_detaches_the_cleared_elements(self):
+        path = fixtures_dir.joinpath("books/books.xml")
+        handler = self.parser.handler(clazz=Books, parser=self.parser)
+        context = handler.build_context(str(path))
+        elements = []
+
+        def record_context():
+            for event, element in context:
+                elements.append(element)
+                yield event, element
+
+        root_sizes = []
+        with mock.patch.object(handler, "build_context", return_value=record_context()):
+            for event, qname in handler.iterparse(str(path), {}):
+                if event == "end" and qname == "book":
+                    root_sizes.append(len(elements[1]))
+
+        # The parser reads ahead, the second book is already in the tree
+        self.assertEqual([1, 0], root_sizes)
+        self.assertEqual(books, handler.objects[-1][1])
+
+    def test_iterparse_with_element_or_tree(self):
+        path = fixtures_dir.joinpath("books/books.xml")
+        tree = etree.ElementTree.parse(str(path))
+        handler = self.parser.handler(clazz=BookForm, parser=self.parser)
+        result = list(handler.iterparse(tree.find(".//book"), {}))
+
+        self.assertEqual(("start", "book"), result[0])
+        self.assertEqual(("end", "book"), result[-1])
+        self.assertEqual(books.book[0], handler.objects[-1][1])
+        self.assertEqual(2, len(tree.getroot()))
+
     def test_parse_with_xml_syntax_error(self):
         with self.assertRaises(ParserError):
             self.parser.from_string("<", Books)
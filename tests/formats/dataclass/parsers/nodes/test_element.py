@@ -193,6 +193,26 @@ class ElementNodeTests(FactoryTestCase):
         expected = {"attrs": {"extended": "attr", "{what}ever": "qname"}, "index": 0}
         self.assertEqual(expected, params)
 
+    def test_bind_with_compiled_plan(self):
+        self.context.compile_plans = True
+        node = ElementNode(
+            position=0,
+            meta=self.context.build(SequentialType),
+            context=self.context,
+            config=ParserConfig(),
+            attrs={"a": "b", "a0": "0"},
+            ns_map={"ns0": "xsdata"},
+        )
+        self.assertIs(self.context.compile(node.meta), node.plan)
+
+        objects = [("x1", 1), ("x2", 2), ("x2", 3)]
+        expected = SequentialType(a0="0", a1={"a": "b"}, x0=1, x1=[1], x2=[2, 3])
+
+        self.assertTrue(node.bind("foo", "1", "tail", objects))
+        self.assertEqual("foo", objects[-1][0])
+        self.assertEqual(expected, objects[-1][1])
+        self.assertEqual({"x1", "x2"}, set(node.meta.child_matches))
+
     def test_bind_attrs_with_fail_on_unknown_attributes(self):
         self.node.meta = self.context.build(AttrsType)
         self.node.config.fail_on_unknown_attributes = True
@@ -295,7 +315,9 @@ class ElementNodeTests(FactoryTestCase):
         attrs = {"a": "b"}
         ns_map = {"ns0": "xsdata"}
         position = 1
-        self.meta.elements[var.qname] = [var]
+        self.node.meta = XmlMetaFactory.create(
+            clazz=TypeC, qname="foo", elements={var.qname: [var]}
+        )
 
         actual = self.node.child("a", attrs, ns_map, position)
         self.assertIsInstance(actual, ElementNode)
@@ -310,8 +332,12 @@ class ElementNodeTests(FactoryTestCase):
         wildcard = XmlVarFactory.create(
             index=2, xml_type=XmlType.WILDCARD, qname="cc", types=(object,)
         )
-        self.meta.elements[single.qname] = [single]
-        self.meta.wildcards.append(wildcard)
+        self.node.meta = XmlMetaFactory.create(
+            clazz=TypeC,
+            qname="foo",
+            elements={single.qname: [single]},
+            wildcards=[wildcard],
+        )
 
         attrs = {"a": "b"}
         ns_map = {"ns0": "xsdata"}
@@ -331,8 +357,12 @@ class ElementNodeTests(FactoryTestCase):
         element = XmlVarFactory.create(xml_type=XmlType.ELEMENT, qname="a")
         wildcard = XmlVarFactory.create(xml_type=XmlType.WILDCARD, qname="a")
 
-        self.meta.elements[element.qname] = [element]
-        self.meta.wildcards.append(wildcard)
+        self.node.meta = XmlMetaFactory.create(
+            clazz=TypeC,
+            qname="foo",
+            elements={element.qname: [element]},
+            wildcards=[wildcard],
+        )
 
         with self.assertRaises(ParserError) as cm:
             self.node.child("a", {}, {}, 0)
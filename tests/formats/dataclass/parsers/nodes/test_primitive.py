@@ -28,6 +28,8 @@ class PrimitiveNodeTests(TestCase):
             ns_map=ns_map,
             tokens_factory=var.tokens_factory,
             format=var.format,
+            cache=None,
+            converters=var.converters,
         )
 
     def test_bind_nillable_content(self):
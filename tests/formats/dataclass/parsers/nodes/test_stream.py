@@ -0,0 +1,19 @@
+from unittest import TestCase
+
+from xsdata.formats.dataclass.parsers.nodes import SkipNode, StreamNode
+
+
+class StreamNodeTests(TestCase):
+    def test_child(self):
+        skip = SkipNode()
+        node = StreamNode(skip, 1)
+
+        self.assertIs(skip.ns_map, node.ns_map)
+        self.assertIs(skip, node.child("foo", {}, {}, 1))
+
+    def test_bind(self):
+        node = StreamNode(SkipNode(), 1)
+        objects = [("a", 1), ("b", 2), ("c", 3)]
+
+        self.assertFalse(node.bind("foo", None, None, objects))
+        self.assertEqual([("a", 1)], objects)
@@ -1,6 +1,7 @@
 from dataclasses import make_dataclass
 from typing import Union
-from unittest import TestCase
+from unittest import TestCase, mock
+from xml.etree.ElementTree import QName
 
 from tests.fixtures.models import UnionType
 from xsdata.exceptions import ParserError
@@ -8,7 +9,8 @@ from xsdata.formats.dataclass.context import XmlContext
 from xsdata.formats.dataclass.models.elements import XmlType
 from xsdata.formats.dataclass.parsers.config import ParserConfig
 from xsdata.formats.dataclass.parsers.nodes import UnionNode
-from xsdata.models.mixins import attribute
+from xsdata.models.enums import QNames
+from xsdata.models.mixins import attribute, element
 from xsdata.utils.testing import XmlVarFactory
 
 
@@ -97,6 +99,145 @@ class UnionNodeTests(TestCase):
         self.assertTrue(node.bind("item", "a", None, objects))
         self.assertEqual("a", objects[-1][1])
 
+    def test_bind_skips_types_that_do_not_accept_the_children(self):
+        first = make_dataclass("First", [("x", str, element())])
+        second = make_dataclass("Second", [("y", str, element())])
+        root = make_dataclass("Root", [("item", Union[first, second])])
+
+        meta = self.context.build(root)
+        var = next(meta.find_children("item"))
+        node = UnionNode(
+            position=0,
+            var=var,
+            config=self.config,
+            context=self.context,
+            attrs={},
+            ns_map={},
+        )
+        objects = []
+
+        self.assertIs(node, node.child("y", {}, {}, 0))
+        self.assertFalse(node.bind("y", "foo", None, objects))
+        self.assertEqual({"y": None}, node.children)
+
+        with mock.patch.object(UnionNode, "parse_class") as mock_parse_class:
+            self.assertTrue(node.bind("item", None, None, objects))
+
+        self.assertEqual(0, mock_parse_class.call_count)
+        self.assertEqual(second(y="foo"), objects[-1][1])
+
+    def test_bind_single_candidate_raises_the_parser_errors(self):
+        first = make_dataclass("First", [("x", int, element())])
+        second = make_dataclass("Second", [("y", str, element())])
+        root = make_dataclass("Root", [("item", Union[first, second])])
+
+        self.config.fail_on_converter_warnings = True
+        meta = self.context.build(root)
+        var = next(meta.find_children("item"))
+        node = UnionNode(
+            position=0,
+            var=var,
+            config=self.config,
+            context=self.context,
+            attrs={},
+            ns_map={},
+        )
+
+        node.child("x", {}, {}, 0)
+        node.bind("x", "foo", None, [])
+        with self.assertRaises(ParserError):
+            node.bind("item", None, None, [])
+
+    def test_bind_single_candidate_with_converter_warnings(self):
+        first = make_dataclass("First", [("x", int, element())])
+        second = make_dataclass("Second", [("y", str, element())])
+        root = make_dataclass("Root", [("item", Union[first, second])])
+
+        meta = self.context.build(root)
+        var = next(meta.find_children("item"))
+        node = UnionNode(
+            position=0,
+            var=var,
+            config=self.config,
+            context=self.context,
+            attrs={},
+            ns_map={},
+        )
+
+        node.child("x", {}, {}, 0)
+        node.bind("x", "oops", None, [])
+        with self.assertRaises(ParserError) as cm:
+            node.bind("item", None, None, [])
+
+        self.assertEqual(
+            "Failed to convert value `oops` to one of (<class 'int'>,)",
+            str(cm.exception),
+        )
+
+    def test_find_candidates(self):
+        first = make_dataclass("First", [("x", str, element())])
+        second = make_dataclass("Second", [("y", str, element())])
+        root = make_dataclass("Root", [("item", Union[first, int, second])])
+
+        meta = self.context.build(root)
+        var = next(meta.find_children("item"))
+        node = UnionNode(
+            position=0,
+            var=var,
+            config=self.config,
+            context=self.context,
+            attrs={"a": "1"},
+            ns_map={},
+        )
+        node.children = {"x": None}
+        self.assertEqual([first, int], node.find_candidates("item"))
+
+        self.config.fail_on_unknown_attributes = True
+        self.assertEqual([int], node.find_candidates("item"))
+
+        self.config.fail_on_unknown_attributes = False
+        self.config.fail_on_unknown_properties = False
+        self.assertEqual([first, second, int], node.find_candidates("item"))
+
+        node.attrs.clear()
+        self.assertEqual([first, int], node.find_candidates("item"))
+
+    def test_accepts(self):
+        item = make_dataclass("Item", [("a", int, attribute()), ("b", str, element())])
+        meta = self.context.build(item)
+        var = XmlVarFactory.create(xml_type=XmlType.ELEMENT, name="foo", qname="foo")
+        node = UnionNode(
+            position=0,
+            var=var,
+            config=self.config,
+            context=self.context,
+            attrs={"a": "1", "c": "2"},
+            ns_map={},
+        )
+
+        self.assertFalse(node.accepts(meta))
+        self.assertTrue(node.tolerates(meta))
+
+        self.config.fail_on_unknown_attributes = True
+        self.assertFalse(node.tolerates(meta))
+
+        node.attrs[QNames.XSI_TYPE] = "foo"
+        self.assertTrue(node.accepts(meta))
+        self.assertTrue(node.tolerates(meta))
+
+        node.attrs = {"a": "1", QNames.XSI_NIL: "false"}
+        node.children = {"b": None}
+        self.assertTrue(node.accepts(meta))
+        self.assertTrue(node.tolerates(meta))
+
+        node.children["c"] = None
+        self.assertFalse(node.accepts(meta))
+        self.assertFalse(node.tolerates(meta))
+
+        self.config.fail_on_unknown_properties = False
+        self.assertFalse(node.accepts(meta))
+        self.assertTrue(node.tolerates(meta))
+
     def test_bind_raises_parser_error_on_failure(self):
         meta = self.context.build(UnionType)
         var = next(meta.find_children("element"))
@@ -114,3 +255,19 @@ class UnionNodeTests(TestCase):
             node.bind("element", None, None, [])
 
         self.assertEqual("Failed to parse union node: element", str(cm.exception))
+
+    def test_parse_value(self):
+        var = XmlVarFactory.create(xml_type=XmlType.TEXT, name="foo", qname="foo")
+        node = UnionNode(
+            position=0,
+            var=var,
+            config=self.config,
+            context=self.context,
+            attrs={},
+            ns_map={"a": "aa"},
+        )
+
+        self.assertIsNone(node.parse_value(None, [int]))
+        self.assertIsNone(node.parse_value("a", [int, float]))
+        self.assertEqual(1, node.parse_value("1", [int]))
+        self.assertEqual("{aa}b", node.parse_value("a:b", [QName]).text)
@@ -1,5 +1,6 @@
 from tests import fixtures_dir
 from tests.fixtures.books import Books
+from xsdata.formats.dataclass.backends import OrjsonBackend, StdlibJsonBackend
 from xsdata.formats.dataclass.parsers.json import JsonParser
 from xsdata.utils.testing import FactoryTestCase
 
@@ -24,3 +25,15 @@ class JsonParserTests(FactoryTestCase):
 
         books = self.parser.parse(str(path), Books)
         self.assertIsInstance(books, Books)
+
+    def test_parser_entry_points_with_backend(self):
+        path = fixtures_dir.joinpath("books/books.json")
+        expected = self.parser.from_path(path, Books)
+
+        for backend in (StdlibJsonBackend(), OrjsonBackend()):
+            self.parser.backend = backend
+            self.assertEqual(expected, self.parser.from_path(path, Books))
+            self.assertEqual(expected, self.parser.from_string(path.read_text()))
+            self.assertEqual(expected, self.parser.from_bytes(path.read_bytes()))
+            with path.open("rb") as fp:
+                self.assertEqual(expected, self.parser.parse(fp, Books))
@@ -1,14 +1,23 @@
+import functools
+import io
+import multiprocessing
+from concurrent import futures
 from dataclasses import make_dataclass
 from typing import Any, Dict
 from unittest import mock
 from unittest.case import TestCase
 
+from tests import fixtures_dir
 from tests.fixtures.books import BookForm, Books
+from tests.fixtures.books.fixtures import books
 from tests.fixtures.models import TypeA
 from xsdata.exceptions import ParserError
+from xsdata.formats.converter import ConverterCache
+from xsdata.formats.dataclass.context import XmlContext
 from xsdata.formats.dataclass.models.elements import XmlType
 from xsdata.formats.dataclass.models.generics import DerivedElement
-from xsdata.formats.dataclass.parsers.bases import NodeParser
+from xsdata.formats.dataclass.parsers.bases import NodeParser, parse_worker_source
+from xsdata.formats.dataclass.parsers.config import ParserConfig
 from xsdata.formats.dataclass.parsers.handlers import XmlEventHandler
 from xsdata.formats.dataclass.parsers.mixins import XmlHandler
 from xsdata.formats.dataclass.parsers.nodes.primitive import PrimitiveNode
@@ -51,6 +60,133 @@ class NodeParserTests(TestCase):
             str(cm.exception),
         )
 
+    def test_parse_with_compiled_plans(self):
+        context = XmlContext(compile_plans=True)
+        parser = NodeParser(context=context, handler=XmlEventHandler)
+        path = fixtures_dir.joinpath("books/books.xml")
+
+        self.assertEqual(books, parser.from_path(path, Books))
+        self.assertEqual({Books, BookForm}, set(context.plans))
+
+    def test_parse_with_converter_cache(self):
+        path = fixtures_dir.joinpath("books/books.xml")
+        for compile_plans in (False, True):
+            cache = ConverterCache()
+            parser = NodeParser(
+                config=ParserConfig(converter_cache=cache),
+                context=XmlContext(compile_plans=compile_plans),
+                handler=XmlEventHandler,
+            )
+
+            self.assertEqual(books, parser.from_path(path, Books))
+            self.assertEqual(books, parser.from_path(path, Books))
+            self.assertEqual(4, len(cache.values))
+
+    def test_iterparse(self):
+        parser = NodeParser(handler=XmlEventHandler)
+        path = str(fixtures_dir.joinpath("books/books.xml"))
+
+        result = parser.iterparse(path, Books, "book")
+        self.assertEqual(books.book[0], next(result))
+        self.assertEqual(books.book[1:], list(result))
+        self.assertEqual({"brk": "urn:books"}, parser.ns_map)
+
+        result = parser.iterparse(path, Books, ["book", "author"])
+        self.assertEqual([x.author for x in books.book], list(result))
+
+        result = parser.iterparse(path, Books, ["{urn:books}book"])
+        self.assertEqual([], list(result))
+
+        with self.assertRaises(ParserError) as cm:
+            next(parser.iterparse(path, Books, []))
+
+        self.assertEqual("Empty iterparse path", str(cm.exception))
+
+    def test_iterparse_with_fail_on_converter_warnings(self):
+        parser = NodeParser(handler=XmlEventHandler)
+        parser.config.fail_on_converter_warnings = True
+
+        xml = b"<Books><book><price>foo</price></book></Books>"
+        with self.assertRaises(ParserError) as cm:
+            list(parser.iterparse(io.BytesIO(xml), Books, "book"))
+
+        self.assertEqual(
+            "Failed to convert value `foo` to one of (<class 'float'>,)",
+            str(cm.exception),
+        )
+
+    def test_iterparse_with_syntax_error(self):
+        parser = NodeParser(handler=XmlEventHandler)
+
+        with self.assertRaises(ParserError):
+            list(parser.iterparse(io.BytesIO(b"<Books><book>"), Books, "book"))
+
+    def test_parse_many(self):
+        path = fixtures_dir.joinpath("books/books.xml")
+        sources = [path, str(path), path.read_bytes(), io.BytesIO(path.read_bytes())]
+        parser = NodeParser(handler=XmlEventHandler)
+
+        result = parser.parse_many(sources, Books, workers=2)
+        self.assertIn(Books, parser.context.cache)
+        self.assertEqual([books] * 4, list(result))
+
+        result = parser.parse_many(sources[:3], Books, workers=2, ordered=False)
+        self.assertEqual([books] * 3, list(result))
+        self.assertEqual({}, parser.ns_map)
+
+    def test_parse_many_with_process_executor(self):
+        path = fixtures_dir.joinpath("books/books.xml")
+        parser = NodeParser(handler=XmlEventHandler)
+
+        result = parser.parse_many([path, path], Books, workers=2, executor="process")
+        self.assertEqual([books, books], list(result))
+
+    def test_parse_many_with_spawned_process_executor(self):
+        path = fixtures_dir.joinpath("books/books.xml")
+        context = XmlContext(compile_plans=True)
+        parser = NodeParser(context=context, handler=XmlEventHandler)
+        executor = functools.partial(
+            futures.ProcessPoolExecutor, mp_context=multiprocessing.get_context("spawn")
+        )
+
+        with mock.patch.object(futures, "ProcessPoolExecutor", executor):
+            result = parser.parse_many([path, path], Books, executor="process")
+            self.assertEqual([books, books], list(result))
+
+    def test_parse_worker_source_without_parser(self):
+        with self.assertRaises(ParserError) as cm:
+            parse_worker_source(Books, b"<books/>")
+
+        self.assertEqual(
+            "The process worker was not initialized with a parser", str(cm.exception)
+        )
+
+    def test_parse_many_with_unknown_executor(self):
+        with self.assertRaises(ParserError) as cm:
+            self.parser.parse_many([], Books, executor="foo")
+
+        self.assertEqual("Unknown executor `foo`", str(cm.exception))
+
+    def test_warm_up(self):
+        self.parser.context.compile_plans = True
+        self.parser.warm_up(Books)
+
+        self.assertIn(BookForm, self.parser.context.cache)
+        self.assertIn(BookForm, self.parser.context.plans)
+
+        with mock.patch.object(XmlContext, "build_xsi_cache") as mock_build_xsi_cache:
+            self.parser.warm_up(None)
+
+        mock_build_xsi_cache.assert_called_once_with()
+
+    def test_match_path_name(self):
+        self.assertTrue(NodeParser.match_path_name("book", "book"))
+        self.assertTrue(NodeParser.match_path_name("book", "{urn:books}book"))
+        self.assertTrue(NodeParser.match_path_name("{a}book", "{a}book"))
+        self.assertFalse(NodeParser.match_path_name("{a}book", "{b}book"))
+        self.assertFalse(NodeParser.match_path_name("{a}book", "book"))
+        self.assertFalse(NodeParser.match_path_name("book", "{a}books"))
+
     def test_start(self):
         queue = []
         objects = []
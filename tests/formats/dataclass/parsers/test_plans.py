@@ -0,0 +1,100 @@
+import pickle
+import warnings
+from unittest import mock
+
+from tests.fixtures.models import AttrsType, ChoiceType, TypeA
+from xsdata.formats.converter import ConverterCache
+from xsdata.formats.dataclass.context import XmlContext
+from xsdata.formats.dataclass.parsers.plans import BindingPlan
+from xsdata.formats.dataclass.parsers.utils import ParserUtils
+from xsdata.utils.testing import FactoryTestCase, XmlVarFactory
+
+
+class BindingPlanTests(FactoryTestCase):
+    def setUp(self):
+        super().setUp()
+        self.context = XmlContext()
+
+    def test_init(self):
+        meta = self.context.build(ChoiceType)
+        plan = BindingPlan(meta)
+
+        self.assertIs(meta, plan.meta)
+        self.assertEqual(meta.attributes, plan.attributes)
+
+        indexes = {var.index for var in meta.get_all_vars()}
+        indexes.update(
+            choice.index
+            for var in meta.get_all_vars()
+            for choice in var.elements.values()
+        )
+        self.assertEqual(indexes, set(plan.values))
+
+    def test_find_children(self):
+        meta = self.context.build(ChoiceType)
+        plan = BindingPlan(meta)
+
+        actual = plan.find_children("a")
+        self.assertEqual(tuple(meta.find_children("a")), actual)
+        self.assertIs(actual, plan.find_children("a"))
+        self.assertIs(actual, meta.child_matches["a"])
+        self.assertEqual((), plan.find_children("unknown"))
+
+    def test_find_attribute(self):
+        meta = self.context.build(AttrsType)
+        plan = BindingPlan(meta)
+
+        self.assertEqual(meta.find_attribute("index"), plan.find_attribute("index"))
+        self.assertIsNone(plan.find_attribute("unknown"))
+
+    def test_find_any_attributes(self):
+        meta = self.context.build(AttrsType)
+        plan = BindingPlan(meta)
+
+        expected = meta.find_any_attributes("{what}ever")
+        self.assertIsNotNone(expected)
+        self.assertEqual(expected, plan.find_any_attributes("{what}ever"))
+        self.assertEqual({"{what}ever": expected}, plan.any_attributes)
+
+    def test_parse_value(self):
+        meta = self.context.build(TypeA)
+        plan = BindingPlan(meta)
+        var = meta.text
+
+        self.assertEqual(1, plan.parse_value(var, "1", {}))
+
+        plan.values.clear()
+        self.assertEqual(2, plan.parse_value(var, "2", {}))
+        self.assertIn(var.index, plan.values)
+
+    def test_pickle(self):
+        plan = pickle.loads(pickle.dumps(BindingPlan(self.context.build(TypeA))))
+        var = plan.meta.get_all_vars()[0]
+
+        self.assertEqual(1, plan.parse_value(var, "1", {}))
+
+    @mock.patch.object(ParserUtils, "parse_value", side_effect=ParserUtils.parse_value)
+    def test_build_value_parser(self, mock_parse_value):
+        single = XmlVarFactory.create(name="a", types=(int,))
+        tokens = XmlVarFactory.create(name="b", types=(int,), tokens_factory=tuple)
+        union = XmlVarFactory.create(name="c", types=(int, str))
+
+        parser = BindingPlan.build_value_parser(single)
+        self.assertEqual(1, parser("1", {}, None))
+        tokens_parser = BindingPlan.build_value_parser(tokens)
+        self.assertEqual((1, 2), tokens_parser(" 1 2", {}, None))
+        self.assertEqual(0, mock_parse_value.call_count)
+
+        self.assertEqual("a", BindingPlan.build_value_parser(union)("a", {}, None))
+        self.assertIsNone(parser(None, {}, None))
+        self.assertEqual(1, parser("1", {}, ConverterCache()))
+        self.assertEqual((1, 2), tokens_parser(["1", "2"], {}, ConverterCache()))
+        self.assertEqual(4, mock_parse_value.call_count)
+
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            self.assertEqual("a", parser("a", {}, None))
+            self.assertEqual(("a", 1), tokens_parser("a 1", {}, None))
+
+        self.assertEqual(2, len(w))
+        self.assertEqual(6, mock_parse_value.call_count)
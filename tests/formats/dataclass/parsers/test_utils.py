@@ -1,6 +1,6 @@
 from unittest import mock
 
-from xsdata.formats.converter import ConverterFactory
+from xsdata.formats.converter import ConverterCache, ConverterFactory
 from xsdata.formats.dataclass.context import XmlContext
 from xsdata.formats.dataclass.parsers.utils import ParserUtils
 from xsdata.models.enums import Namespace, QNames
@@ -39,7 +39,16 @@ class ParserUtilsTests(FactoryTestCase):
         self.assertIsNone(ParserUtils.parse_value(None, [int], lambda: 1))
 
         self.assertTrue(2, ParserUtils.parse_value("1", [int], None))
-        mock_deserialize.assert_called_once_with("1", [int], ns_map=None, format=None)
+        mock_deserialize.assert_called_once_with(
+            "1", [int], None, ns_map=None, format=None
+        )
+
+    def test_parse_value_with_cache(self):
+        cache = ConverterCache()
+        actual = ParserUtils.parse_value("1 2 1", [int], None, None, list, cache=cache)
+
+        self.assertEqual([1, 2, 1], actual)
+        self.assertEqual(2, len(cache.values))
 
     def test_parse_value_with_tokens_true(self):
         actual = ParserUtils.parse_value(" 1 2 3", [int], list, None, list)
@@ -51,28 +60,30 @@ class ParserUtilsTests(FactoryTestCase):
         actual = ParserUtils.parse_value(None, [int], lambda: [1, 2, 3], None, list)
         self.assertEqual([1, 2, 3], actual)
 
+    @mock.patch.object(ConverterFactory, "deserialize_many", return_value=[2])
     @mock.patch.object(ConverterFactory, "deserialize", return_value=2)
-    def test_parse_value_with_ns_map(self, mock_to_python):
+    def test_parse_value_with_ns_map(self, mock_to_python, mock_to_python_many):
         ns_map = {"a": 1}
         ParserUtils.parse_value(" 1 2 3", [int], list, ns_map, list)
         ParserUtils.parse_value(" 1 2 3", [str], None, ns_map)
 
-        self.assertEqual(4, mock_to_python.call_count)
-        mock_to_python.assert_has_calls(
-            [
-                mock.call("1", [int], ns_map=ns_map, format=None),
-                mock.call("2", [int], ns_map=ns_map, format=None),
-                mock.call("3", [int], ns_map=ns_map, format=None),
-                mock.call(" 1 2 3", [str], ns_map=ns_map, format=None),
-            ]
+        mock_to_python_many.assert_called_once_with(
+            ["1", "2", "3"], [int], None, ns_map=ns_map, format=None
         )
+        mock_to_python.assert_called_once_with(
+            " 1 2 3", [str], None, ns_map=ns_map, format=None
+        )
+
+    def test_parse_value_with_mixed_tokens(self):
+        actual = ParserUtils.parse_value("1 2.5", [int, float], None, None, list)
+        self.assertEqual([1, 2.5], actual)
 
     @mock.patch.object(ConverterFactory, "deserialize", return_value=2)
     def test_parse_value_with_format(self, mock_to_python):
         ParserUtils.parse_value(" 1 2 3", [str], list, format="Nope")
         self.assertEqual(1, mock_to_python.call_count)
         mock_to_python.assert_called_once_with(
-            " 1 2 3", [str], ns_map=None, format="Nope"
+            " 1 2 3", [str], None, ns_map=None, format="Nope"
         )
 
     def test_parse_any_attributes(self):
@@ -107,3 +107,22 @@ class DictEncoderTests(TestCase):
         expected = expected[:-1]
         actual = [name for name, value in self.encoder.next_value(book)]
         self.assertEqual(expected, actual)
+
+    def test_encode_dataclass(self):
+        book = self.books.book[0]
+        actual = self.encoder.encode_dataclass(book)
+        self.assertEqual(self.expected["book"][0], actual)
+
+        self.encoder.dict_factory = dict
+        actual = self.encoder.encode_dataclass(book)
+        self.assertEqual(dict(self.encoder.next_value(book)), actual)
+        self.assertEqual("en", actual["lang"])
+
+        self.encoder.config.ignore_default_attributes = True
+        actual = self.encoder.encode_dataclass(book)
+        self.assertEqual(dict(self.encoder.next_value(book)), actual)
+        self.assertNotIn("lang", actual)
+
+        obj = Wrapper(alpha=["value"])
+        actual = self.encoder.encode_dataclass(obj)
+        self.assertEqual({"alpha": ["value"]}, actual["alphas"])
@@ -1,7 +1,9 @@
 import json
+from io import BytesIO, StringIO
 from unittest.case import TestCase
 
 from tests.fixtures.books import BookForm, Books
+from xsdata.formats.dataclass.backends import OrjsonBackend, StdlibJsonBackend
 from xsdata.formats.dataclass.serializers import DictFactory
 from xsdata.formats.dataclass.serializers.config import SerializerConfig
 from xsdata.formats.dataclass.serializers.json import JsonSerializer
@@ -61,6 +63,53 @@ class JsonSerializerTests(TestCase):
 
         self.assertEqual(self.expected, json.loads(actual))
 
+    def test_render_bytes(self):
+        serializer = JsonSerializer()
+        actual = serializer.render_bytes(self.books)
+
+        self.assertEqual(serializer.render(self.books).encode(), actual)
+
+    def test_write_binary(self):
+        self.books.book[0].author = "Δ"
+        serializer = JsonSerializer(
+            dump_factory=lambda obj, fp, **kwargs: json.dump(
+                obj, fp, ensure_ascii=False, **kwargs
+            )
+        )
+        output = BytesIO()
+        serializer.write_binary(output, self.books)
+
+        self.assertFalse(output.closed)
+        self.assertIn('"author": "Δ"'.encode(), output.getvalue())
+
+    def test_render_with_backend(self):
+        for backend in (StdlibJsonBackend(), OrjsonBackend()):
+            serializer = JsonSerializer(
+                dict_factory=DictFactory.FILTER_NONE, backend=backend
+            )
+
+            actual = serializer.render(self.books)
+            self.assertEqual(self.expected, json.loads(actual))
+
+            actual = serializer.render_bytes(self.books)
+            self.assertEqual(self.expected, json.loads(actual))
+
+            output = StringIO()
+            serializer.write(output, self.books)
+            self.assertEqual(self.expected, json.loads(output.getvalue()))
+
+            output = BytesIO()
+            serializer.write_binary(output, self.books)
+            self.assertEqual(self.expected, json.loads(output.getvalue()))
+
+    def test_render_bytes_with_backend_and_encoding(self):
+        self.books.book[0].author = "Δ"
+        config = SerializerConfig(encoding="UTF-16")
+        serializer = JsonSerializer(config=config, backend=OrjsonBackend())
+
+        actual = serializer.render_bytes(self.books)
+        self.assertIn('"author":"Δ"', actual.decode("UTF-16"))
+
     def test_indent(self):
         config = SerializerConfig(indent="    ")
         serializer = JsonSerializer(config=config)
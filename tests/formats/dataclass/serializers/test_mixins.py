@@ -6,9 +6,15 @@ from xml.etree.ElementTree import QName
 from xml.sax import ContentHandler
 from xml.sax.saxutils import XMLGenerator
 
-from tests.fixtures.books import BookForm
+from tests.fixtures.books import BookForm, Books
 from tests.fixtures.datatypes import Telephone
-from tests.fixtures.models import Paragraph, SequentialType, Span, TypeA
+from tests.fixtures.models import (
+    ChoiceType,
+    Paragraph,
+    SequentialType,
+    Span,
+    TypeA,
+)
 from xsdata.exceptions import SerializerError, XmlContextError, XmlWriterError
 from xsdata.formats.dataclass.models.elements import XmlType
 from xsdata.formats.dataclass.models.generics import AnyElement, DerivedElement
@@ -345,6 +351,73 @@ class EventGeneratorTests(TestCase):
         self.assertIsInstance(result, Generator)
         self.assertEqual(expected, list(result))
 
+    def test_generate_stream(self):
+        obj = Books()
+        values = (BookForm(id=str(i)) for i in range(2))
+        result = self.generator.generate_stream(obj, "book", values)
+        expected = [
+            ("start", "{urn:books}books"),
+            ("start", "book"),
+            ("attr", "id", "0"),
+            ("attr", "lang", "en"),
+            ("end", "book"),
+            ("start", "book"),
+            ("attr", "id", "1"),
+            ("attr", "lang", "en"),
+            ("end", "book"),
+            ("end", "{urn:books}books"),
+        ]
+        self.assertEqual(expected, list(result))
+        self.assertEqual([], obj.book)
+
+        obj = ChoiceType(choice=[])
+        values = [TypeA(x=1), 2]
+        result = self.generator.generate_stream(obj, "choice", values)
+        expected = [
+            ("start", "ChoiceType"),
+            ("start", "a"),
+            ("data", "1"),
+            ("end", "a"),
+            ("start", "int"),
+            ("data", "2"),
+            ("end", "int"),
+            ("end", "ChoiceType"),
+        ]
+        self.assertEqual(expected, list(result))
+
+    def test_generate_stream_with_frozen_model(self):
+        @dataclass(frozen=True)
+        class Envelope:
+            version: int = field(default=1, metadata={"type": "Attribute"})
+            item: List[int] = field(default_factory=list, metadata={"type": "Element"})
+
+        obj = Envelope()
+        result = self.generator.generate_stream(obj, "item", iter([1, 2]))
+        expected = [
+            ("start", "Envelope"),
+            ("attr", "version", "1"),
+            ("start", "item"),
+            ("data", "1"),
+            ("end", "item"),
+            ("start", "item"),
+            ("data", "2"),
+            ("end", "item"),
+            ("end", "Envelope"),
+        ]
+        self.assertEqual(expected, list(result))
+        self.assertEqual([], obj.item)
+
+    def test_generate_stream_with_invalid_field(self):
+        cases = [(Books(), "foo"), (BookForm(), "author"), (SequentialType(), "x1")]
+        for obj, name in cases:
+            with self.assertRaises(SerializerError) as cm:
+                self.generator.generate_stream(obj, name, [])
+
+            self.assertEqual(
+                f"{type(obj).__name__}.{name} is not a repeating element field",
+                str(cm.exception),
+            )
+
     def test_convert_dataclass_can_overwrite_params(self):
         book = BookForm(id="123", title="Misterioso: A Crime Novel", price=19.5)
         result = self.generator.convert_dataclass(
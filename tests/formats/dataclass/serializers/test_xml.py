@@ -1,8 +1,15 @@
+from dataclasses import replace
+from io import BytesIO, StringIO
 from unittest import TestCase
 
+from tests.fixtures.books import Books
 from tests.fixtures.books.fixtures import books
 from xsdata.formats.dataclass.serializers import XmlSerializer
 from xsdata.formats.dataclass.serializers.config import SerializerConfig
+from xsdata.formats.dataclass.serializers.writers import (
+    LxmlEventWriter,
+    XmlEventWriter,
+)
 
 
 class XmlSerializerTests(TestCase):
@@ -36,3 +43,28 @@ class XmlSerializerTests(TestCase):
         )
 
         self.assertEqual(expected, result)
+
+    def test_write_stream(self):
+        expected = self.serializer.render(books)
+        for writer in (XmlEventWriter, LxmlEventWriter):
+            self.serializer.writer = writer
+            output = StringIO()
+            values = iter(books.book)
+            self.serializer.write_stream(output, Books(), "book", values)
+
+            self.assertEqual(expected, output.getvalue())
+
+    def test_render_bytes(self):
+        expected = self.serializer.render(books).encode()
+        self.assertEqual(expected, self.serializer.render_bytes(books))
+
+    def test_write_binary(self):
+        obj = Books(book=[replace(books.book[0], author="Δ")])
+        self.serializer.config.encoding = "US-ASCII"
+        output = BytesIO()
+        self.serializer.write_binary(output, obj)
+
+        self.assertFalse(output.closed)
+        result = output.getvalue()
+        self.assertIn(b'encoding="US-ASCII"', result)
+        self.assertIn(b"<author>&#916;</author>", result)
@@ -0,0 +1,118 @@
+import io
+from dataclasses import make_dataclass
+from typing import List
+from unittest import TestCase, mock
+from xml.etree.ElementTree import QName
+
+from tests import fixtures_dir
+from tests.fixtures.books.fixtures import books
+from tests.fixtures.models import ChoiceType, NillableType, Paragraph, Span, TypeNS1
+from xsdata.formats.dataclass.models.generics import AnyElement, DerivedElement
+from xsdata.formats.dataclass.serializers import XmlSerializer
+from xsdata.formats.dataclass.serializers.config import SerializerConfig
+from xsdata.formats.dataclass.serializers.writers import FastXmlWriter, XmlEventWriter
+from xsdata.models.mixins import attribute
+
+
+class FastXmlWriterTests(TestCase):
+    def setUp(self):
+        config = SerializerConfig(indent="  ")
+        self.serializer = XmlSerializer(config=config, writer=FastXmlWriter)
+
+    def test_render(self):
+        actual = self.serializer.render(books)
+        expected = fixtures_dir.joinpath("books/books_auto_ns.xml").read_text()
+        self.assertEqual(expected, actual)
+
+    def test_render_with_provided_namespaces(self):
+        ns_map = {"brk": "urn:books"}
+        actual = self.serializer.render(books, ns_map)
+        expected = fixtures_dir.joinpath("books/books.xml").read_text()
+        self.assertEqual(expected, actual)
+        self.assertEqual({"brk": "urn:books"}, ns_map)
+
+    def test_render_with_default_namespace_prefix(self):
+        actual = self.serializer.render(books, {None: "urn:books"})
+        expected = fixtures_dir.joinpath("books/books_default_ns.xml").read_text()
+        self.assertEqual(expected, actual)
+
+    def test_encoding(self):
+        self.serializer.config.encoding = "ISO-8859-1"
+        x = make_dataclass("x", [("value", str)])
+        obj = x("á, é, í, ó")
+        actual = self.serializer.render(obj)
+        expected = '<?xml version="1.0" encoding="ISO-8859-1"?>\n<x>á, é, í, ó</x>\n'
+        self.assertEqual(expected, actual)
+
+    def test_no_indent(self):
+        self.serializer.config.indent = None
+        actual = self.serializer.render(books)
+        expected = fixtures_dir.joinpath("books/books_auto_ns.xml").read_text()
+
+        _, actual = actual.split("\n", 1)
+        _, expected = expected.split("\n", 1)
+        self.assertEqual(expected.replace("  ", "").replace("\n", ""), actual)
+
+    def test_render_matches_xml_event_writer(self):
+        item = make_dataclass(
+            "item",
+            [
+                ("values", List[QName]),
+                ("text", str),
+                (
+                    "lang",
+                    str,
+                    attribute(namespace="http://www.w3.org/XML/1998/namespace"),
+                ),
+                ("note", str, attribute()),
+            ],
+        )
+        objects = [
+            item(
+                values=[QName("{a}b"), QName("{c}d")],
+                text="<&>",
+                lang="en",
+                note="\"\n'",
+            ),
+            ChoiceType(choice=[QName("{a}b"), 1, 1.5, QName("c")]),
+            Paragraph(
+                content=["a", Span(content="b"), "c", AnyElement(qname="d", tail="e")]
+            ),
+            NillableType(value=None),
+            DerivedElement(qname="{xsdata}TypeNS2", value=TypeNS1(x1=1, x2=2)),
+            AnyElement(
+                qname="{a}root",
+                children=[
+                    AnyElement(qname="unqualified", text="1"),
+                    AnyElement(qname="{b}child", attributes={"{c}attr": "1"}),
+                ],
+            ),
+        ]
+
+        for indent in (None, "  "):
+            config = SerializerConfig(indent=indent)
+            fast = XmlSerializer(config=config, writer=FastXmlWriter)
+            native = XmlSerializer(config=config, writer=XmlEventWriter)
+
+            for obj in objects:
+                for ns_map in (None, {None: "a"}, {"ns9": "c"}):
+                    self.assertEqual(
+                        native.render(obj, ns_map), fast.render(obj, ns_map)
+                    )
+
+    def test_write_flushes_the_buffer_in_chunks(self):
+        output = io.StringIO()
+        writer = FastXmlWriter(self.serializer.config, output, {})
+        events = self.serializer.generate(books)
+
+        mock_write = mock.Mock(wraps=output.write)
+        with mock.patch.object(FastXmlWriter, "FLUSH_SIZE", 1), mock.patch.object(
+            output, "write", mock_write
+        ):
+            writer.write(events)
+
+        self.assertGreater(mock_write.call_count, 5)
+
+        expected = fixtures_dir.joinpath("books/books_auto_ns.xml").read_text()
+        self.assertEqual(expected, output.getvalue())
+        self.assertEqual([], writer.buffer)
@@ -0,0 +1,37 @@
+from io import BytesIO
+from unittest import TestCase
+
+from xsdata.formats.dataclass.backends import OrjsonBackend, StdlibJsonBackend
+
+
+class JsonBackendTests(TestCase):
+    def setUp(self):
+        self.data = {"a": ["Δ", 1, 2.5, None, True], "b": {"c": "d"}}
+
+    def test_stdlib_backend(self):
+        backend = StdlibJsonBackend()
+        actual = backend.dumps(self.data)
+
+        self.assertEqual(
+            b'{"a": ["\\u0394", 1, 2.5, null, true], "b": {"c": "d"}}', actual
+        )
+        self.assertEqual(self.data, backend.loads(actual))
+        self.assertEqual(self.data, backend.loads(actual.decode()))
+        self.assertEqual(self.data, backend.load(BytesIO(actual)))
+        self.assertEqual(
+            b'{\n  "b": {\n    "c": "d"\n  }\n}',
+            backend.dumps({"b": {"c": "d"}}, indent="  "),
+        )
+
+    def test_orjson_backend(self):
+        backend = OrjsonBackend()
+        actual = backend.dumps(self.data)
+
+        self.assertEqual('{"a":["Δ",1,2.5,null,true],"b":{"c":"d"}}'.encode(), actual)
+        self.assertEqual(self.data, backend.loads(actual))
+        self.assertEqual(self.data, backend.loads(actual.decode()))
+        self.assertEqual(self.data, backend.load(BytesIO(actual)))
+        self.assertEqual(
+            b'{\n  "b": {\n    "c": "d"\n  }\n}',
+            backend.dumps({"b": {"c": "d"}}, indent="    "),
+        )
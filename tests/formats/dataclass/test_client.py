@@ -1,3 +1,7 @@
+import asyncio
+import io
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict
 from unittest import TestCase, mock
 
 from tests.fixtures.calculator import (
@@ -8,10 +12,19 @@ from tests.fixtures.calculator import (
 )
 from tests.fixtures.hello import HelloGetHelloAsString
 from xsdata.exceptions import ClientValueError
-from xsdata.formats.dataclass.client import Client, Config, TransportTypes
+from xsdata.formats.dataclass.client import (
+    AsyncClient,
+    Client,
+    Config,
+    TransportTypes,
+)
 from xsdata.formats.dataclass.parsers import XmlParser
 from xsdata.formats.dataclass.serializers import XmlSerializer
-from xsdata.formats.dataclass.transports import DefaultTransport
+from xsdata.formats.dataclass.transports import (
+    AsyncTransport,
+    DefaultTransport,
+    default_async_transport,
+)
 
 response = """
 <?xml version="1.0" encoding="utf-8"?>
@@ -103,6 +116,77 @@ class ClientTests(TestCase):
             },
         )
 
+    @mock.patch.object(DefaultTransport, "post_stream")
+    def test_send_with_stream(self, mock_post_stream):
+        mock_post_stream.return_value = io.BytesIO(response.encode())
+
+        client = Client.from_service(CalculatorSoapAdd)
+        params = {"Body": {"Add": {"intA": 3, "intB": 4}}}
+        result = client.send(params, stream=True)
+
+        self.assertIsInstance(result, CalculatorSoapAddOutput)
+        self.assertEqual(7, result.body.add_response.add_result)
+        self.assertTrue(mock_post_stream.return_value.closed)
+        mock_post_stream.assert_called_once_with(
+            "http://www.dneonline.com/calculator.asmx",
+            data=client.prepare_payload(params),
+            headers={
+                "content-type": "text/xml",
+                "SOAPAction": "http://tempuri.org/Add",
+            },
+        )
+
+    @mock.patch.object(DefaultTransport, "post_stream")
+    def test_send_iter(self, mock_post_stream):
+        mock_post_stream.return_value = io.BytesIO(response.encode())
+
+        client = Client.from_service(CalculatorSoapAdd)
+        params = {"Body": {"Add": {"intA": 3, "intB": 4}}}
+        result = list(client.send_iter(params, ["Body", "AddResponse"]))
+
+        self.assertEqual(1, len(result))
+        self.assertEqual(7, result[0].add_result)
+        self.assertTrue(mock_post_stream.return_value.closed)
+
+    @mock.patch.object(DefaultTransport, "post")
+    def test_send_many(self, mock_post):
+        mock_post.return_value = response.encode()
+
+        client = Client.from_service(CalculatorSoapAdd)
+        objs = [
+            CalculatorSoapAddInput(body=CalculatorSoapAddInput.Body(add=Add(i, 4)))
+            for i in range(5)
+        ]
+        params = {"Body": {"Add": {"intA": 3, "intB": 4}}}
+
+        parsers = []
+        from_bytes = XmlParser.from_bytes
+
+        def record_parser(parser, *args):
+            parsers.append(parser)
+            return from_bytes(parser, *args)
+
+        with mock.patch.object(XmlParser, "from_bytes", autospec=True) as mock_parse:
+            mock_parse.side_effect = record_parser
+            results = list(client.send_many([*objs, params], concurrency=2))
+
+        self.assertEqual(6, len({id(parser) for parser in parsers}))
+        self.assertTrue(all(x is not client.parser for x in parsers))
+        self.assertTrue(all(x.context is client.parser.context for x in parsers))
+        self.assertEqual(6, len(results))
+        for result in results:
+            self.assertIsInstance(result, CalculatorSoapAddOutput)
+            self.assertEqual(7, result.body.add_response.add_result)
+
+        self.assertEqual(6, mock_post.call_count)
+        headers = {"content-type": "text/xml", "SOAPAction": "http://tempuri.org/Add"}
+        mock_post.assert_any_call(
+            "http://www.dneonline.com/calculator.asmx",
+            data=client.serializer.render(objs[2]),
+            headers=headers,
+        )
+        self.assertEqual({}, client.parser.ns_map)
+
     def test_prepare_payload_with_encoding(self):
         client = Client.from_service(HelloGetHelloAsString, encoding="utf-8")
         result = client.prepare_payload(
@@ -151,3 +235,90 @@ class ClientTests(TestCase):
             client.prepare_headers({})
 
         self.assertEqual("Unsupported binding transport: `foobar`", str(cm.exception))
+
+
+class StubTransport(AsyncTransport):
+    def __init__(self):
+        self.requests = []
+        self.closed = False
+
+    async def get(self, url: str, params: Dict, headers: Dict) -> bytes:
+        raise NotImplementedError
+
+    async def aclose(self):
+        self.closed = True
+
+    async def post(self, url: str, data: Any, headers: Dict) -> bytes:
+        self.requests.append((url, data, headers))
+        return response.encode()
+
+
+class AsyncClientTests(TestCase):
+    def test__init__(self):
+        client = AsyncClient.from_service(CalculatorSoapAdd)
+
+        self.assertIsInstance(client, AsyncClient)
+        self.assertIsInstance(client.transport, type(default_async_transport()))
+        self.assertTrue(client.owns_transport)
+        self.assertIs(client.parser.context, client.serializer.context)
+
+    def test_aclose(self):
+        async def run(client):
+            async with client as actual:
+                self.assertIs(client, actual)
+
+        config = Config.from_service(CalculatorSoapAdd)
+        transport = StubTransport()
+        asyncio.run(run(AsyncClient(config, transport)))
+        self.assertFalse(transport.closed)
+
+        target = "xsdata.formats.dataclass.client.default_async_transport"
+        with mock.patch(target, return_value=transport):
+            asyncio.run(run(AsyncClient(config)))
+
+        self.assertTrue(transport.closed)
+
+    def test_send(self):
+        transport = StubTransport()
+        client = AsyncClient(Config.from_service(CalculatorSoapAdd), transport)
+        params = {"Body": {"Add": {"intA": 3, "intB": 4}}}
+
+        async def send_all():
+            return await asyncio.gather(*(client.send(params) for _ in range(3)))
+
+        results = asyncio.run(send_all())
+
+        self.assertEqual(3, len(transport.requests))
+        for result in results:
+            self.assertIsInstance(result, CalculatorSoapAddOutput)
+            self.assertEqual(7, result.body.add_response.add_result)
+
+        obj = CalculatorSoapAddInput(body=CalculatorSoapAddInput.Body(add=Add(3, 4)))
+        expected = (
+            "http://www.dneonline.com/calculator.asmx",
+            client.serializer.render(obj),
+            {"content-type": "text/xml", "SOAPAction": "http://tempuri.org/Add"},
+        )
+        self.assertEqual(expected, transport.requests[0])
+
+    @mock.patch.object(XmlParser, "from_bytes")
+    def test_parse_response(self, mock_from_bytes):
+        config = Config.from_service(CalculatorSoapAdd)
+        content = response.encode()
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            client = AsyncClient(config, StubTransport(), executor=executor)
+            client.offload_size = len(content)
+            asyncio.run(client.parse_response(content[:-1]))
+            asyncio.run(client.parse_response(content))
+
+            client.offload_size = None
+            asyncio.run(client.parse_response(content))
+
+        mock_from_bytes.assert_has_calls(
+            [
+                mock.call(content[:-1], CalculatorSoapAddOutput),
+                mock.call(content, CalculatorSoapAddOutput),
+                mock.call(content, CalculatorSoapAddOutput),
+            ]
+        )
@@ -1,13 +1,17 @@
 import copy
+import sys
+import tempfile
 from dataclasses import make_dataclass
 from pathlib import Path
 from unittest import mock
 
+from tests.fixtures import models
 from tests.fixtures.artists import Artist, BeginArea
 from tests.fixtures.books import BookForm, BooksForm
-from tests.fixtures.models import BaseType, ChoiceType, UnionType
+from tests.fixtures.models import BaseType, ChoiceType, Parent, UnionType
 from xsdata.formats.dataclass.context import XmlContext
 from xsdata.models.enums import DataType
+from xsdata.utils import text
 from xsdata.utils.testing import FactoryTestCase, XmlMetaFactory
 
 
@@ -67,6 +71,78 @@ class XmlContextTests(FactoryTestCase):
         self.ctx.xsi_cache["{urn:books}BookForm"].append(BooksForm)
         self.assertEqual(BooksForm, self.ctx.find_type("{urn:books}BookForm"))
 
+    def test_build_xsi_cache(self):
+        self.ctx.build_xsi_cache()
+        self.assertEqual(len(sys.modules), self.ctx.sys_modules)
+        self.assertEqual(set(sys.modules), self.ctx.xsi_modules)
+        self.assertEqual([BookForm], self.ctx.xsi_cache["{urn:books}BookForm"])
+
+        self.ctx.xsi_cache.clear()
+        self.ctx.build_xsi_cache()
+        self.assertEqual({}, self.ctx.xsi_cache)
+
+        self.ctx.xsi_modules.remove(models.__name__)
+        self.ctx.sys_modules = 0
+        self.ctx.build_xsi_cache()
+        self.assertEqual([ChoiceType], self.ctx.xsi_cache["{xsdata}ChoiceType"])
+        self.assertNotIn("{urn:books}BookForm", self.ctx.xsi_cache)
+
+    def test_build_xsi_cache_with_models_package(self):
+        self.ctx.models_package = "tests.fixtures.books"
+        self.ctx.build_xsi_cache()
+
+        self.assertIn("{urn:books}BookForm", self.ctx.xsi_cache)
+        self.assertNotIn("{xsdata}ChoiceType", self.ctx.xsi_cache)
+
+    def test_walk_xsi_cache(self):
+        dynamic = make_dataclass("Dynamic", [])
+        self.ctx.build_xsi_cache()
+        self.assertNotIn("Dynamic", self.ctx.xsi_cache)
+        book_forms = list(self.ctx.xsi_cache["{urn:books}BookForm"])
+
+        self.ctx.walk_xsi_cache()
+        self.assertEqual([dynamic], self.ctx.xsi_cache["Dynamic"])
+        self.assertEqual(book_forms, self.ctx.xsi_cache["{urn:books}BookForm"])
+
+        self.ctx.walk_xsi_cache()
+        self.assertEqual([dynamic], self.ctx.xsi_cache["Dynamic"])
+
+        self.ctx.reset()
+        self.assertEqual(dynamic, self.ctx.find_type("Dynamic"))
+
+    @mock.patch.object(XmlContext, "walk_xsi_cache")
+    def test_find_types_remembers_misses(self, mock_walk_xsi_cache):
+        self.assertEqual([], self.ctx.find_types("{urn:missing}Type"))
+        self.assertEqual([], self.ctx.find_types("{urn:missing}Type"))
+        self.assertEqual({"{urn:missing}Type"}, self.ctx.xsi_misses)
+        mock_walk_xsi_cache.assert_called_once_with()
+
+        self.ctx.reset()
+        self.assertEqual(set(), self.ctx.xsi_misses)
+
+    def test_add_xsi_type_clears_the_misses(self):
+        self.ctx.xsi_misses.add("{urn:missing}Type")
+        builder = self.ctx.get_builder()
+
+        self.ctx.add_xsi_type(builder, int)
+        self.assertEqual({"{urn:missing}Type"}, self.ctx.xsi_misses)
+        self.assertNotIn(int, self.ctx.xsi_classes)
+
+        self.ctx.add_xsi_type(builder, BookForm)
+        self.assertEqual(set(), self.ctx.xsi_misses)
+        self.assertIn(BookForm, self.ctx.xsi_classes)
+
+    def test_get_module_classes(self):
+        namespace = {
+            "Parent": Parent,
+            "Alias": Parent,
+            "TypeA": models.TypeA,
+            "Books": BookForm,
+            "value": 1,
+        }
+        result = list(self.ctx.get_module_classes(models.__name__, namespace))
+        self.assertEqual([Parent, models.TypeA], result)
+
     def test_find_type_by_fields(self):
         field_names = {"id", "name", "sort-name"}
         self.assertEqual(BeginArea, self.ctx.find_type_by_fields(field_names))
@@ -74,6 +150,60 @@ class XmlContextTests(FactoryTestCase):
         field_names.update({"please", "dont", "exist"})  # Test matching with more
         self.assertIsNone(self.ctx.find_type_by_fields(field_names))
 
+    def test_find_type_by_fields_with_dynamic_class(self):
+        self.ctx.build_xsi_cache()
+        dynamic = make_dataclass("FooDyn", [("foo_dyn", int), ("bar_dyn", str)])
+
+        self.assertEqual(dynamic, self.ctx.find_type_by_fields({"foo_dyn"}))
+
+    @mock.patch.object(XmlContext, "walk_xsi_cache")
+    def test_find_type_by_fields_with_no_fields(self, mock_walk_xsi_cache):
+        self.ctx.xsi_modules.update(sys.modules)
+        self.ctx.sys_modules = len(sys.modules)
+        self.assertIsNone(self.ctx.find_type_by_fields(set()))
+        mock_walk_xsi_cache.assert_called_once_with()
+
+        builder = self.ctx.get_builder()
+        self.ctx.add_xsi_type(builder, ChoiceType)
+        self.ctx.add_xsi_type(builder, BookForm)
+        self.assertEqual(ChoiceType, self.ctx.find_type_by_fields(set()))
+
+    def test_build_fields_index(self):
+        unsupported = make_dataclass("Unsupported", [("content", Path)])
+        builder = self.ctx.get_builder()
+        self.ctx.add_xsi_type(builder, BookForm)
+        self.ctx.add_xsi_type(builder, unsupported)
+        self.ctx.build_fields_index()
+
+        self.assertEqual({BookForm: 8}, self.ctx.fields_count)
+        self.assertEqual([BookForm], list(self.ctx.fields_index["author"]))
+        self.assertEqual([], self.ctx.xsi_cache["Unsupported"])
+        self.assertEqual([], self.ctx.fields_pending)
+
+        with mock.patch.object(XmlContext, "build") as mock_build:
+            self.ctx.build_fields_index()
+            self.assertEqual(0, mock_build.call_count)
+
+        self.ctx.reset()
+        self.assertEqual({}, self.ctx.fields_count)
+        self.assertEqual({}, self.ctx.fields_index)
+
+    def test_remove_xsi_type(self):
+        self.ctx.xsi_modules.update(sys.modules)
+        self.ctx.sys_modules = len(sys.modules)
+        builder = self.ctx.get_builder()
+        self.ctx.add_xsi_type(builder, BookForm)
+        self.ctx.build_fields_index()
+        self.assertEqual(BookForm, self.ctx.find_type_by_fields({"author"}))
+
+        self.ctx.remove_xsi_type(BookForm)
+        self.assertEqual([], self.ctx.xsi_cache["{urn:books}BookForm"])
+        self.assertEqual({}, self.ctx.fields_count)
+        self.assertEqual({}, self.ctx.fields_index["author"])
+
+        self.assertNotEqual(BookForm, self.ctx.find_type_by_fields({"author"}))
+        self.assertNotIn(BookForm, self.ctx.xsi_cache["{urn:books}BookForm"])
+
     def test_local_names_match_remove_clazz_from_cache_on_error(self):
         undefined = make_dataclass("UndefinedType", [("content", "Literal['yes']")])
         unsupported = make_dataclass("UndefinedType", [("content", Path)])
@@ -124,6 +254,67 @@ class XmlContextTests(FactoryTestCase):
         self.assertFalse(self.ctx.is_derived(a(), d))
         self.assertFalse(self.ctx.is_derived(None, d))
 
+    def test_compile(self):
+        meta = self.ctx.build(BookForm)
+        plan = self.ctx.compile(meta)
+
+        self.assertIs(meta, plan.meta)
+        self.assertIs(plan, self.ctx.compile(meta))
+        self.assertEqual({BookForm: plan}, self.ctx.plans)
+
+        other = copy.deepcopy(meta)
+        self.assertIsNot(plan, self.ctx.compile(other))
+
+        self.ctx.reset()
+        self.assertEqual({}, self.ctx.plans)
+
+    def test_save_and_load_cache(self):
+        local = make_dataclass("Local", [("x", int)])
+        self.ctx.build_recursive(ChoiceType)
+        self.ctx.build(local)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp).joinpath("cache.pkl")
+            self.assertEqual(6, self.ctx.save_cache(path))
+
+            ctx = XmlContext()
+            self.assertEqual(6, ctx.load_cache(path))
+            self.assertNotIn(local, ctx.cache)
+            self.assertEqual(self.ctx.build(ChoiceType), ctx.cache[ChoiceType])
+            self.assertEqual(0, ctx.load_cache(path))
+
+            ctx = XmlContext(element_name_generator=text.camel_case)
+            self.assertEqual(0, ctx.load_cache(path))
+
+            with mock.patch.object(XmlContext, "module_digest", return_value="a"):
+                self.assertEqual(0, XmlContext().load_cache(path))
+
+            with mock.patch("xsdata.formats.dataclass.context.__version__", "0"):
+                self.assertEqual(0, XmlContext().load_cache(path))
+
+            path.write_bytes(b"foo")
+            self.assertEqual(0, XmlContext().load_cache(path))
+            self.assertEqual(0, XmlContext().load_cache(path.with_name("missing")))
+
+    def test_save_cache_skips_inherited_namespaces(self):
+        self.ctx.build(models.TypeA)
+        self.ctx.build(models.TypeB, parent_ns="urn:parent")
+        self.assertEqual("urn:parent", self.ctx.cache[models.TypeB].namespace)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp).joinpath("cache.pkl")
+            self.assertEqual(1, self.ctx.save_cache(path))
+
+            ctx = XmlContext()
+            self.assertEqual(1, ctx.load_cache(path))
+            self.assertIn(models.TypeA, ctx.cache)
+            self.assertNotIn(models.TypeB, ctx.cache)
+
+    def test_module_digest(self):
+        self.assertIsNone(XmlContext.module_digest("builtins"))
+        self.assertIsNone(XmlContext.module_digest("foo.bar.thug"))
+        self.assertEqual(32, len(XmlContext.module_digest("tests.fixtures.models")))
+
     def test_build_recursive(self):
         self.ctx.build_recursive(ChoiceType)
         self.assertEqual(6, len(self.ctx.cache))
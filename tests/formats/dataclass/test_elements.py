@@ -1,5 +1,7 @@
+import pickle
 from dataclasses import make_dataclass
 from decimal import Decimal
+from types import MappingProxyType
 from unittest import mock
 from unittest.case import TestCase
 from xml.etree.ElementTree import QName
@@ -8,6 +10,7 @@ from tests.fixtures.models import (
     ChoiceType,
     ExtendedType,
     Paragraph,
+    SequentialType,
     TypeA,
     TypeB,
     TypeC,
@@ -15,6 +18,8 @@ from tests.fixtures.models import (
     TypeDuplicate,
     UnionType,
 )
+from tests.fixtures.wrapper import Wrapper
+from xsdata.formats.converter import converter
 from xsdata.formats.dataclass.context import XmlContext
 from xsdata.formats.dataclass.models.elements import XmlType, XmlVar
 from xsdata.utils.testing import XmlMetaFactory, XmlVarFactory
@@ -49,6 +54,26 @@ class XmlValTests(TestCase):
             {TypeA, TypeB, int, float, QName, UnionType, Decimal}, var.element_types
         )
 
+    def test_get_converters(self):
+        class Celsius(float):
+            pass
+
+        var = XmlVarFactory.create(name="foo", types=(Celsius, int))
+        float_converter = converter.type_converter(float)
+        int_converter = converter.type_converter(int)
+        expected = ((Celsius, float_converter), (int, int_converter))
+        self.assertEqual(expected, var.get_converters())
+
+        converter.register_converter(Celsius, lambda x: float(x) + 273.15)
+        try:
+            celsius_converter = converter.registry[Celsius]
+            self.assertEqual(celsius_converter, var.get_converters()[0][1])
+            self.assertEqual(converter.version, var.converters_version)
+        finally:
+            converter.unregister_converter(Celsius)
+
+        self.assertEqual(expected, var.get_converters())
+
     def test_find_choice(self):
         var = XmlVarFactory.create(
             xml_type=XmlType.ELEMENTS,
@@ -162,14 +187,22 @@ class XmlMetaTests(TestCase):
             "target_qname='a', "
             "nillable=False, "
             "text=None, "
-            "choices=[], "
-            "elements={}, "
-            "wildcards=[], "
-            "attributes={}, "
-            "any_attributes=[], "
-            "wrappers={}, "
+            "choices=(), "
+            "elements=mappingproxy({}), "
+            "wildcards=(), "
+            "attributes=mappingproxy({}), "
+            "any_attributes=(), "
+            "wrappers=mappingproxy({}), "
             "namespace=None, "
-            "mixed_content=False)"
+            "mixed_content=False, "
+            "element_vars=(), "
+            "attribute_vars=(), "
+            "all_vars=(), "
+            "element_groups=(), "
+            "key_vars={}, "
+            "local_names=frozenset(), "
+            "element_types=frozenset(), "
+            "child_matches={})"
         )
         self.assertEqual(expected, repr(self.meta))
 
@@ -177,15 +210,53 @@ class XmlMetaTests(TestCase):
         meta = self.context.build(UnionType)
         self.assertEqual({TypeA, TypeB, TypeC, TypeD}, meta.element_types)
 
+    def test_sorted_vars(self):
+        meta = self.context.build(SequentialType)
+
+        self.assertEqual(
+            ["x0", "x1", "x2", "x3", "x4"], [var.name for var in meta.element_vars]
+        )
+        self.assertEqual(["a0", "a1", "a2"], [var.name for var in meta.attribute_vars])
+        self.assertEqual(
+            ["a0", "a1", "a2", "x0", "x1", "x2", "x3", "x4"],
+            [var.name for var in meta.all_vars],
+        )
+        self.assertEqual(list(meta.element_vars), meta.get_element_vars())
+        self.assertEqual(list(meta.attribute_vars), meta.get_attribute_vars())
+        self.assertEqual(list(meta.all_vars), meta.get_all_vars())
+
+    def test_element_groups(self):
+        meta = self.context.build(SequentialType)
+        groups = [[var.name for var in group] for group in meta.element_groups]
+
+        self.assertEqual([["x0"], ["x1", "x2"], ["x3", "x4"]], groups)
+
+    def test_find_key_vars(self):
+        meta = self.context.build(SequentialType)
+        x0, x1 = meta.element_vars[:2]
+
+        self.assertEqual((x0,), meta.find_key_vars("x0", False))
+        self.assertEqual((), meta.find_key_vars("x0", True))
+        self.assertEqual((x1,), meta.find_key_vars("x1", True))
+        self.assertEqual((), meta.find_key_vars("x1", False))
+        self.assertEqual((), meta.find_key_vars("unknown", False))
+
+        meta = self.context.build(Wrapper)
+        alpha = meta.element_vars[0]
+        self.assertEqual((alpha,), meta.find_key_vars("alphas", False))
+        self.assertEqual((), meta.find_key_vars("alphas", True))
+        self.assertEqual((alpha,), meta.find_key_vars("alpha", False))
+
     def test_find_attribute(self):
         a = XmlVarFactory.create(xml_type=XmlType.ATTRIBUTE, name="a")
         b = XmlVarFactory.create(xml_type=XmlType.ATTRIBUTE, name="b")
 
-        self.meta.attributes[a.qname] = a
-        self.meta.attributes[b.qname] = b
+        meta = XmlMetaFactory.create(clazz=TypeA, attributes={a.qname: a, b.qname: b})
 
-        self.assertEqual(a, self.meta.find_attribute("a"))
-        self.assertEqual(b, self.meta.find_attribute("b"))
+        self.assertEqual(a, meta.find_attribute("a"))
+        self.assertEqual(b, meta.find_attribute("b"))
+        with self.assertRaises(TypeError):
+            meta.attributes["c"] = a  # type: ignore
 
     @mock.patch.object(XmlVar, "match_namespace")
     def test_find_any_attributes(self, mock_match_namespace):
@@ -254,3 +325,32 @@ class XmlMetaTests(TestCase):
         meta = self.context.build(Paragraph)
         self.assertEqual("content", next(meta.find_children("404")).qname)
         self.assertTrue(next(meta.find_children("content")).is_wildcard)
+
+    def test_match_children(self):
+        meta = self.context.build(ChoiceType)
+
+        actual = meta.match_children("a")
+        self.assertEqual(tuple(meta.find_children("a")), actual)
+        self.assertIs(actual, meta.match_children("a"))
+        self.assertEqual((), meta.match_children("404"))
+        self.assertEqual({"a"}, set(meta.child_matches))
+
+        meta = self.context.build(Paragraph)
+        self.assertTrue(meta.match_children("404")[0].is_wildcard)
+        self.assertEqual({}, meta.child_matches)
+
+    def test_pickle(self):
+        meta = self.context.build(ChoiceType)
+        meta.match_children("a")
+
+        actual = pickle.loads(pickle.dumps(meta))
+        self.assertEqual({}, actual.child_matches)
+        actual.match_children("a")
+        self.assertEqual(meta, actual)
+        self.assertIsInstance(actual.elements, MappingProxyType)
+
+    def test_local_names(self):
+        meta = self.context.build(SequentialType)
+        expected = {"a0", "a1", "a2", "x0", "x1", "x2", "x3", "x4"}
+
+        self.assertEqual(expected, meta.local_names)
@@ -1,8 +1,24 @@
+import asyncio
+import io
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict
 from unittest import TestCase, mock
 
+import pytest
 from requests import HTTPError, Response, Session
 
-from xsdata.formats.dataclass.transports import DefaultTransport
+from xsdata.formats.dataclass import transports
+from xsdata.formats.dataclass.transports import (
+    DefaultTransport,
+    ExecutorTransport,
+    Transport,
+    default_async_transport,
+)
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None
 
 
 class DefaultTransportTest(TestCase):
@@ -49,6 +65,81 @@ class DefaultTransportTest(TestCase):
             url, data=data, headers=headers, timeout=transport.timeout
         )
 
+    @mock.patch.object(Session, "post")
+    def test_post_stream(self, mock_post):
+        transport = DefaultTransport()
+        url = "http://endpoint.stub/action"
+        headers = {"content-type": "text/xml"}
+
+        response = Response()
+        response.status_code = 200
+        response.raw = io.BytesIO(b"foobar")
+        mock_post.return_value = response
+
+        with transport.post_stream(url, "data", headers) as stream:
+            self.assertEqual(b"foo", stream.read(3))
+            self.assertEqual(b"bar", stream.read())
+
+        self.assertTrue(response.raw.decode_content)
+        self.assertTrue(response.raw.closed)
+        mock_post.assert_called_once_with(
+            url, data="data", headers=headers, timeout=transport.timeout, stream=True
+        )
+
+    @mock.patch.object(Response, "close")
+    def test_handle_stream(self, mock_close):
+        response = Response()
+        response.status_code = 401
+        response.reason = "Nope"
+        response.url = "xsdata"
+        response.raw = io.BytesIO(b"foobar")
+
+        with self.assertRaises(HTTPError):
+            DefaultTransport.handle_stream(response)
+
+        self.assertEqual(1, mock_close.call_count)
+
+        response.status_code = 302
+        with self.assertRaises(HTTPError) as cm:
+            DefaultTransport.handle_stream(response)
+
+        self.assertEqual(
+            "302 Unexpected Status: Nope for url: xsdata", str(cm.exception)
+        )
+        self.assertEqual(2, mock_close.call_count)
+
+        for status_code in (202, 500):
+            response.status_code = status_code
+            response.raw = io.BytesIO(b"foobar")
+            with DefaultTransport.handle_stream(response) as stream:
+                self.assertEqual(b"foobar", stream.read())
+
+        stream.close()
+        self.assertTrue(stream.closed)
+        self.assertEqual(4, mock_close.call_count)
+
+    def test_transport_post_stream(self):
+        class StubTransport(Transport):
+            def get(self, url: str, params: Dict, headers: Dict) -> bytes:
+                raise NotImplementedError
+
+            def post(self, url: str, data: Any, headers: Dict) -> bytes:
+                return data.encode()
+
+        stream = StubTransport().post_stream("http://endpoint.stub", "foo", {})
+        self.assertEqual(b"foo", stream.read())
+
+    def test_pool_size(self):
+        transport = DefaultTransport()
+        adapter = transport.session.get_adapter("https://endpoint.stub")
+        self.assertEqual(10, adapter._pool_maxsize)
+
+        transport = DefaultTransport(pool_size=32)
+        for url in ("http://endpoint.stub", "https://endpoint.stub"):
+            adapter = transport.session.get_adapter(url)
+            self.assertEqual(32, adapter._pool_connections)
+            self.assertEqual(32, adapter._pool_maxsize)
+
     @mock.patch.object(Response, "content", new_callable=mock.PropertyMock)
     def test_handle_response(self, mock_content):
         response = Response()
@@ -58,8 +149,9 @@ class DefaultTransportTest(TestCase):
         transport = DefaultTransport()
         self.assertEqual(b"foobar", transport.handle_response(response))
 
-        response.status_code = 500
-        self.assertEqual(b"foobar", transport.handle_response(response))
+        for status_code in (202, 500):
+            response.status_code = status_code
+            self.assertEqual(b"foobar", transport.handle_response(response))
 
         response.status_code = 401
         response.reason = "Nope"
@@ -68,3 +160,113 @@ class DefaultTransportTest(TestCase):
             transport.handle_response(response)
 
         self.assertEqual("401 Client Error: Nope for url: xsdata", str(cm.exception))
+
+        response.status_code = 302
+        with self.assertRaises(HTTPError) as cm:
+            transport.handle_response(response)
+
+        self.assertEqual(
+            "302 Unexpected Status: Nope for url: xsdata", str(cm.exception)
+        )
+
+
+class ExecutorTransportTests(TestCase):
+    @mock.patch.object(DefaultTransport, "get", return_value=b"foo")
+    def test_get(self, mock_get):
+        transport = ExecutorTransport()
+        params = {"a": "b"}
+        headers = {"content-type": "text/xml"}
+
+        result = asyncio.run(transport.get("http://endpoint.stub", params, headers))
+        self.assertEqual(b"foo", result)
+        mock_get.assert_called_once_with("http://endpoint.stub", params, headers)
+
+    @mock.patch.object(DefaultTransport, "post", return_value=b"bar")
+    def test_post(self, mock_post):
+        headers = {"content-type": "text/xml"}
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            transport = ExecutorTransport(executor=executor)
+            result = asyncio.run(
+                transport.post("http://endpoint.stub", "data", headers)
+            )
+
+        self.assertEqual(b"bar", result)
+        mock_post.assert_called_once_with(
+            "http://endpoint.stub", data="data", headers=headers
+        )
+
+    def test_async_context(self):
+        async def run():
+            async with ExecutorTransport() as transport:
+                return transport
+
+        self.assertIsInstance(asyncio.run(run()), ExecutorTransport)
+
+    @pytest.mark.skipif(httpx is not None, reason="httpx is installed")
+    def test_default_async_transport(self):
+        self.assertIsInstance(default_async_transport(), ExecutorTransport)
+
+
+@pytest.mark.skipif(httpx is None, reason="requires httpx")
+class HttpxTransportTests(TestCase):
+    def setUp(self):
+        self.requests = []
+
+    def handler(self, request):
+        self.requests.append(request)
+        status_code = int(request.url.params.get("status", 200))
+        return httpx.Response(status_code, content=b"<result/>")
+
+    def create_transport(self):
+        client = httpx.AsyncClient(transport=httpx.MockTransport(self.handler))
+        return transports.HttpxTransport(client=client)
+
+    def test_get(self):
+        transport = self.create_transport()
+        headers = {"content-type": "text/xml"}
+
+        result = asyncio.run(transport.get("http://endpoint.stub", {"a": "b"}, headers))
+        self.assertEqual(b"<result/>", result)
+        self.assertEqual("GET", self.requests[0].method)
+        self.assertEqual("http://endpoint.stub?a=b", str(self.requests[0].url))
+        self.assertEqual("text/xml", self.requests[0].headers["content-type"])
+
+    def test_post(self):
+        transport = self.create_transport()
+        headers = {"content-type": "text/xml"}
+
+        result = asyncio.run(transport.post("http://endpoint.stub", b"data", headers))
+        self.assertEqual(b"<result/>", result)
+        self.assertEqual("POST", self.requests[0].method)
+        self.assertEqual(b"data", self.requests[0].content)
+
+    def test_handle_response(self):
+        transport = self.create_transport()
+        url = "http://endpoint.stub"
+
+        for status in ("202", "500"):
+            result = asyncio.run(transport.get(url, {"status": status}, {}))
+            self.assertEqual(b"<result/>", result)
+
+        for status in ("302", "404"):
+            with self.assertRaises(httpx.HTTPStatusError):
+                asyncio.run(transport.get(url, {"status": status}, {}))
+
+    def test_aclose(self):
+        async def run(transport):
+            async with transport:
+                pass
+
+            return transport.client.is_closed
+
+        transport = self.create_transport()
+        self.assertFalse(transport.owns_client)
+        self.assertFalse(asyncio.run(run(transport)))
+
+        transport = transports.HttpxTransport()
+        self.assertTrue(transport.owns_client)
+        self.assertTrue(asyncio.run(run(transport)))
+
+    def test_default_async_transport(self):
+        self.assertIsInstance(default_async_transport(), transports.HttpxTransport)
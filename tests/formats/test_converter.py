@@ -1,18 +1,28 @@
+import pickle
 import sys
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime, time
 from decimal import Decimal
 from enum import Enum
 from typing import Any
-from unittest import TestCase
+from unittest import TestCase, mock
 from xml.etree.ElementTree import QName
 
 import pytest
 
 from tests.fixtures.datatypes import Telephone
+from tests.fixtures.models import TypeA
 from xsdata.exceptions import ConverterError
-from xsdata.formats.converter import Converter, ProxyConverter, converter
-from xsdata.models.datatype import XmlDuration, XmlPeriod
+from xsdata.formats.converter import (
+    UNCONVERTED,
+    Converter,
+    ConverterCache,
+    ConverterFactory,
+    ProxyConverter,
+    converter,
+)
+from xsdata.models.datatype import XmlDate, XmlDuration, XmlPeriod
 from xsdata.models.enums import UseType
 
 
@@ -28,6 +38,43 @@ class ConverterFactoryTests(TestCase):
         self.assertFalse(converter.deserialize("false", [int, bool]))
         self.assertEqual(1, converter.deserialize("1", [int, bool]))
 
+    def test_deserialize_many(self):
+        self.assertEqual([1, 2], converter.deserialize_many(["1", "2"], [int, float]))
+        self.assertEqual(
+            [1, 2.5], converter.deserialize_many(["1", "2.5"], [int, float])
+        )
+        self.assertEqual(
+            [XmlDate(2024, 1, 1)], converter.deserialize_many(["2024-01-01"], [XmlDate])
+        )
+
+        with warnings.catch_warnings(record=True) as w:
+            self.assertEqual(["a", 1], converter.deserialize_many(["a", "1"], [int]))
+
+        self.assertEqual(1, len(w))
+        self.assertEqual([], converter.deserialize_many([], [int]))
+
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            self.assertEqual(
+                ["a", "b"], converter.deserialize_many(["a", "b"], [TypeA])
+            )
+
+        self.assertEqual(2, len(w))
+        for warning in w:
+            self.assertIn("No converter registered", str(warning.message))
+
+    def test_try_deserialize(self):
+        class A:
+            pass
+
+        with warnings.catch_warnings(record=True) as w:
+            self.assertIs(UNCONVERTED, converter.try_deserialize("a", [int]))
+            self.assertIs(UNCONVERTED, converter.try_deserialize("a", [A]))
+            self.assertEqual("a", converter.try_deserialize("a", [A, str]))
+            self.assertEqual(1, converter.try_deserialize("1", [bool, int]))
+
+        self.assertEqual(0, len(w))
+
     def test_serialize(self):
         self.assertEqual(None, converter.serialize(None))
         self.assertEqual("1", converter.serialize(1))
@@ -57,6 +104,15 @@ class ConverterFactoryTests(TestCase):
         self.assertFalse(converter.test(".0", [float], strict=True))
         self.assertTrue(converter.test("1.0", [float]))
 
+        class A:
+            pass
+
+        with warnings.catch_warnings(record=True) as w:
+            self.assertFalse(converter.test("a", [A]))
+            self.assertFalse(converter.test("a", [int, float]))
+
+        self.assertEqual(0, len(w))
+
     def test_unknown_converter(self):
         class A:
             pass
@@ -88,6 +144,48 @@ class ConverterFactoryTests(TestCase):
         self.assertEqual("3", converter.serialize(MinusOneInt("3")))
         converter.unregister_converter(MinusOneInt)
 
+    def test_type_converter_memoizes_mro_matches(self):
+        class MinusOneInt(int):
+            pass
+
+        int_converter = converter.type_converter(int)
+        self.assertIs(int_converter, converter.type_converter(MinusOneInt))
+        self.assertIs(int_converter, converter.mro_cache[MinusOneInt])
+
+        converter.register_converter(MinusOneInt, lambda x: int(x) - 1)
+        self.assertNotIn(MinusOneInt, converter.mro_cache)
+        self.assertEqual(1, converter.deserialize("2", [MinusOneInt]))
+
+        converter.unregister_converter(MinusOneInt)
+        self.assertEqual(2, converter.deserialize("2", [MinusOneInt]))
+
+        converter.mro_cache[MinusOneInt] = converter.type_converter(str)
+        converter.clear_cache()
+        self.assertEqual({}, converter.mro_cache)
+
+    def test_resolve_converters(self):
+        class MinusOneInt(int):
+            pass
+
+        int_converter = converter.type_converter(int)
+        version = converter.version
+        converters = converter.resolve_converters([MinusOneInt, TypeA])
+        self.assertEqual(((MinusOneInt, int_converter), (TypeA, None)), converters)
+
+        converter.register_converter(MinusOneInt, lambda x: int(x) - 1)
+        self.assertEqual(version + 1, converter.version)
+        converter.unregister_converter(MinusOneInt)
+        self.assertEqual(version + 2, converter.version)
+
+    @mock.patch.object(ConverterFactory, "type_converter")
+    def test_deserialize_with_converters(self, mock_type_converter):
+        converters = ((int, converter.registry[int]),)
+        self.assertEqual(1, converter.deserialize("1", [int], converters))
+        self.assertEqual(
+            [1, 2], converter.deserialize_many(["1", "2"], [int], converters)
+        )
+        self.assertEqual(0, mock_type_converter.call_count)
+
     def test_register_converter_with_lambda(self):
         class MinusOneInt(int):
             pass
@@ -98,6 +196,119 @@ class ConverterFactoryTests(TestCase):
         converter.unregister_converter(MinusOneInt)
 
 
+class ConverterCacheTests(TestCase):
+    def setUp(self):
+        self.cache = ConverterCache(maxsize=2)
+
+    def test_deserialize(self):
+        first = self.cache.deserialize("2024-01-01", [XmlDate])
+        self.assertEqual(XmlDate(2024, 1, 1), first)
+        self.assertIs(first, self.cache.deserialize("2024-01-01", (XmlDate,)))
+        self.assertEqual(1, len(self.cache.values))
+
+        self.assertEqual(
+            UseType.OPTIONAL, self.cache.deserialize("optional", [UseType])
+        )
+        self.assertEqual(2, len(self.cache.values))
+
+        self.assertTrue(self.cache.deserialize("true", [bool]))
+        self.assertEqual(2, len(self.cache.values))
+        self.assertNotIn(("2024-01-01", (XmlDate,), None, None), self.cache.values)
+
+        self.cache.clear()
+        self.assertEqual(0, len(self.cache.values))
+
+    def test_deserialize_with_ns_map(self):
+        cache = ConverterCache(types=[QName])
+        first = cache.deserialize("a:b", [QName], ns_map={"a": "foo"})
+        second = cache.deserialize("a:b", [QName], ns_map={"a": "bar"})
+        default = cache.deserialize("b", [QName], ns_map={None: "foo"})
+
+        self.assertEqual(QName("{foo}b"), first)
+        self.assertEqual(QName("{bar}b"), second)
+        self.assertEqual(QName("{foo}b"), default)
+        self.assertEqual(3, len(cache.values))
+
+        self.cache.deserialize("a:b", [QName], ns_map={"a": "foo"})
+        self.assertEqual(0, len(self.cache.values))
+
+    def test_deserialize_skips_mutable_types_and_failures(self):
+        self.assertEqual("a", self.cache.deserialize("a", [str]))
+        self.assertEqual(1, self.cache.deserialize(1, [int]))
+
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            self.assertEqual("a", self.cache.deserialize("a", [int]))
+            self.assertEqual("a", self.cache.deserialize("a", [int]))
+
+        self.assertEqual(2, len(w))
+        self.assertEqual(0, len(self.cache.values))
+
+        cache = ConverterCache(types=[str])
+        self.assertEqual("a", cache.deserialize("a", [str]))
+        self.assertEqual(1, len(cache.values))
+
+        class MinusOneInt(int):
+            pass
+
+        cache = ConverterCache(types=[MinusOneInt])
+        self.assertEqual(1, cache.deserialize("1", [MinusOneInt]))
+        self.assertEqual(0, len(cache.values))
+
+    def test_deserialize_from_threads(self):
+        values = [str(i % 8) for i in range(1000)]
+
+        def run(offset):
+            return [self.cache.deserialize(value, [int]) for value in values]
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(run, range(4)))
+
+        expected = [int(value) for value in values]
+        self.assertEqual([expected] * 4, results)
+        self.assertEqual(2, len(self.cache.values))
+
+    def test_pickle(self):
+        self.cache.deserialize("1", [int])
+        actual = pickle.loads(pickle.dumps(self.cache))
+
+        self.assertEqual(self.cache.maxsize, actual.maxsize)
+        self.assertEqual(self.cache.types, actual.types)
+        self.assertEqual(0, len(actual.values))
+        self.assertEqual(1, actual.deserialize("1", [int]))
+
+    def test_deserialize_after_the_converters_change(self):
+        class Weight(int):
+            pass
+
+        cache = ConverterCache(types=[int, Weight])
+        self.assertEqual(1, cache.deserialize("1", [Weight]))
+        self.assertEqual(1, len(cache.values))
+
+        converter.register_converter(Weight, lambda x: Weight(int(x) * 10))
+        try:
+            self.assertEqual(10, cache.deserialize("1", [Weight]))
+        finally:
+            converter.unregister_converter(Weight)
+
+        self.assertEqual(1, cache.deserialize("1", [Weight]))
+        self.assertEqual(converter.version, cache.version)
+
+    def test_is_cacheable(self):
+        self.assertTrue(self.cache.is_cacheable((int, UseType)))
+        self.assertFalse(self.cache.is_cacheable((int, str)))
+        self.assertEqual(
+            {(int, UseType): True, (int, str): False}, self.cache.cacheable
+        )
+
+    def test_resolve_namespace(self):
+        ns_map = {None: "foo", "a": "bar"}
+        self.assertIsNone(ConverterCache.resolve_namespace("a:b", None))
+        self.assertEqual("foo", ConverterCache.resolve_namespace("b", ns_map))
+        self.assertEqual("bar", ConverterCache.resolve_namespace(" a:b", ns_map))
+        self.assertIsNone(ConverterCache.resolve_namespace("c:b", ns_map))
+
+
 class StrConverterTests(TestCase):
     def setUp(self):
         self.converter = converter.type_converter(str)
@@ -142,6 +353,16 @@ class BoolConverterTests(TestCase):
         self.assertTrue(self.converter.deserialize(True))
         self.assertFalse(self.converter.deserialize(False))
 
+    def test_try_deserialize(self):
+        for invalid in ("True", "False", 1, 0):
+            self.assertIs(UNCONVERTED, self.converter.try_deserialize(invalid))
+
+        self.assertTrue(self.converter.try_deserialize(" true"))
+        self.assertTrue(self.converter.try_deserialize("1"))
+        self.assertFalse(self.converter.try_deserialize("false "))
+        self.assertFalse(self.converter.try_deserialize("0"))
+        self.assertFalse(self.converter.try_deserialize(False))
+
     def test_serialize(self):
         self.assertEqual("true", self.converter.serialize(True))
         self.assertEqual("false", self.converter.serialize(False))
@@ -159,6 +380,16 @@ class IntConverterTests(TestCase):
         self.assertEqual(2, self.converter.deserialize("+2"))
         self.assertEqual(-2, self.converter.deserialize("-2"))
 
+    def test_try_deserialize(self):
+        self.assertIs(UNCONVERTED, self.converter.try_deserialize("a"))
+        self.assertIs(UNCONVERTED, self.converter.try_deserialize(None))
+        self.assertEqual(2, self.converter.try_deserialize("+2"))
+
+    def test_try_deserialize_many(self):
+        self.assertIs(UNCONVERTED, self.converter.try_deserialize_many(["1", "a"]))
+        self.assertIs(UNCONVERTED, self.converter.try_deserialize_many([None]))
+        self.assertEqual([1, -2], self.converter.try_deserialize_many(["1", "-2"]))
+
     def test_serialize(self):
         self.assertEqual("2", self.converter.serialize(2))
 
@@ -174,6 +405,14 @@ class FloatConverterTests(TestCase):
         self.assertEqual(2.0, self.converter.deserialize("2"))
         self.assertEqual(2.1, self.converter.deserialize("2.1"))
 
+    def test_try_deserialize(self):
+        self.assertIs(UNCONVERTED, self.converter.try_deserialize("a"))
+        self.assertEqual(2.1, self.converter.try_deserialize("2.1"))
+
+    def test_try_deserialize_many(self):
+        self.assertIs(UNCONVERTED, self.converter.try_deserialize_many(["1", "a"]))
+        self.assertEqual([1.0, 2.1], self.converter.try_deserialize_many(["1", "2.1"]))
+
     def test_serialize(self):
         self.assertEqual("2.1", self.converter.serialize(2.1))
         self.assertEqual("INF", self.converter.serialize(float("inf")))
@@ -221,6 +460,10 @@ class BytesConverterTests(TestCase):
         with self.assertRaises(ConverterError):
             self.converter.deserialize("AA~AA", format="base64")
 
+        for value in ("AA==AA", "MS0y LTM=", "MS0yLTM=\n", "MS0yLTM\u00e9"):
+            with self.assertRaises(ConverterError):
+                self.converter.deserialize(value, format="base64")
+
     def test_unknown_formats(self):
         with self.assertRaises(ConverterError):
             self.converter.serialize("foo")
@@ -247,6 +490,17 @@ class DecimalConverterTests(TestCase):
 
         self.assertEqual(Decimal(1), self.converter.deserialize("1"))
 
+    def test_try_deserialize(self):
+        self.assertIs(UNCONVERTED, self.converter.try_deserialize("a"))
+        self.assertEqual(Decimal(1), self.converter.try_deserialize("1"))
+
+    def test_try_deserialize_many(self):
+        self.assertIs(UNCONVERTED, self.converter.try_deserialize_many(["1", "a"]))
+        self.assertEqual(
+            [Decimal(1), Decimal("2.1")],
+            self.converter.try_deserialize_many(["1", "2.1"]),
+        )
+
     def test_serialize(self):
         self.assertEqual("2.1", self.converter.serialize(Decimal("2.1")))
         self.assertEqual("INF", self.converter.serialize(Decimal("inf")))
@@ -333,6 +587,12 @@ class QNameConverterTests(TestCase):
         self.assertEqual(QName("a"), convert("a", ns_map={}))
         self.assertEqual(QName("aa", "b"), convert("a:b", ns_map={"a": "aa"}))
 
+    def test_try_deserialize(self):
+        convert = self.converter.try_deserialize
+
+        self.assertIs(UNCONVERTED, convert("a:b"))
+        self.assertEqual(QName("aa", "b"), convert("a:b", ns_map={"a": "aa"}))
+
     def test_serialize(self):
         ns_map = {"c_prefix": "c"}
         convert = self.converter.serialize
@@ -401,6 +661,21 @@ class ProxyConverterTests(TestCase):
 
         self.assertEqual(1, self.converter.deserialize("1"))
 
+    def test_try_deserialize(self):
+        self.assertIs(UNCONVERTED, self.converter.try_deserialize("a"))
+        self.assertEqual(1, self.converter.try_deserialize("1"))
+
+    def test_try_deserialize_many(self):
+        self.assertEqual([1, 2], self.converter.try_deserialize_many(["1", "2"]))
+        self.assertIs(UNCONVERTED, self.converter.try_deserialize_many(["1", "a"]))
+
+        proxy = converter.type_converter(XmlDate)
+        self.assertEqual(
+            [XmlDate(2024, 1, 1), XmlDate(2024, 1, 2)],
+            proxy.try_deserialize_many(["2024-01-01", "2024-01-02"]),
+        )
+        self.assertIs(UNCONVERTED, proxy.try_deserialize_many(["2024-01-01", "a"]))
+
     def test_serialize(self):
         self.assertEqual("1", self.converter.serialize(1))
 
@@ -35,6 +35,14 @@ class XmlDateTests(TestCase):
             with self.assertRaises(ValueError, msg=example):
                 XmlDate.from_string(example)
 
+    def test_from_strings(self):
+        values = ["2002-01-01Z", " -2002-01-01+02:15", "12002-01-01"]
+        expected = [XmlDate.from_string(value) for value in values]
+        self.assertEqual(expected, XmlDate.from_strings(values))
+
+        with self.assertRaises(ValueError):
+            XmlDate.from_strings([values[0], "2002/01/01"])
+
     def test_str(self):
         examples = {
             "2002-01-01-00:00": "2002-01-01Z",
@@ -150,6 +158,18 @@ class XmlDateTimeTests(TestCase):
             with self.assertRaises(ValueError, msg=example):
                 XmlDateTime.from_string(example)
 
+    def test_from_strings(self):
+        values = [
+            "2002-01-01T12:01:01.010Z",
+            "2010-09-19T24:00:00Z",
+            "-2002-01-01T12:01:01",
+        ]
+        expected = [XmlDateTime.from_string(value) for value in values]
+        self.assertEqual(expected, XmlDateTime.from_strings(values))
+
+        with self.assertRaises(ValueError):
+            XmlDateTime.from_strings([values[0], "2002-02-30T12:01:01"])
+
     def test_str(self):
         examples = {
             "2002-01-01T12:01:01-00:00": "2002-01-01T12:01:01Z",
@@ -304,6 +324,14 @@ class XmlTimeTests(TestCase):
             with self.assertRaises(ValueError, msg=example):
                 XmlTime.from_string(example)
 
+    def test_from_strings(self):
+        values = ["12:01:01.010Z", "24:00:00", " 12:01:01-02:15"]
+        expected = [XmlTime.from_string(value) for value in values]
+        self.assertEqual(expected, XmlTime.from_strings(values))
+
+        with self.assertRaises(ValueError):
+            XmlTime.from_strings([values[0], "25:01:01"])
+
     def test_str(self):
         examples = {
             "12:01:01-00:00": "12:01:01Z",
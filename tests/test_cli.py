@@ -96,6 +96,21 @@ class CliTests(TestCase):
         self.assertEqual([source.as_uri()], mock_process.call_args[0][0])
         self.assertTrue(mock_init.call_args[1]["print"])
 
+    @mock.patch.object(ResourceTransformer, "process")
+    @mock.patch.object(ResourceTransformer, "__init__", return_value=None)
+    def test_generate_with_workers(self, mock_init, mock_process):
+        source = fixtures_dir.joinpath("defxmlschema/chapter03.xsd")
+        result = self.runner.invoke(cli, [str(source), "--package", "foo"])
+
+        self.assertIsNone(result.exception)
+        self.assertEqual(1, mock_init.call_args[1]["workers"])
+
+        result = self.runner.invoke(
+            cli, [str(source), "--package", "foo", "--workers", "4"]
+        )
+        self.assertIsNone(result.exception)
+        self.assertEqual(4, mock_init.call_args[1]["workers"])
+
     @mock.patch.object(ResourceTransformer, "process")
     @mock.patch.object(ResourceTransformer, "__init__", return_value=None)
     def test_generate_with_debug_mode(self, *args):
@@ -1,6 +1,12 @@
 from unittest import TestCase
 
-from xsdata.utils.dates import parse_date_args, validate_date, validate_time
+from xsdata.utils.dates import (
+    DateTimeParser,
+    parse_date_args,
+    parse_many_date_args,
+    validate_date,
+    validate_time,
+)
 
 
 class DatesUtilsTests(TestCase):
@@ -98,6 +104,45 @@ class DatesUtilsTests(TestCase):
                 f"String '{value}' does not match format '{fmt}'", str(cm.exception)
             )
 
+    def test_parse_date_args_canonical_forms(self):
+        cases = {
+            "2002-01-02T12:14:30-01:22": "%Y-%m-%dT%H:%M:%S%z",
+            "2002-01-02T12:14:30.1Z": "%Y-%m-%dT%H:%M:%S%z",
+            " 2002-01-02T12:14:30.123456789+14:00 ": "%Y-%m-%dT%H:%M:%S%z",
+            "-2002-01-02T12:14:30": "%Y-%m-%dT%H:%M:%S%z",
+            "0000-01-02": "%Y-%m-%d%z",
+            "12002-01-02Z": "%Y-%m-%d%z",
+            "12:14:30.": "%H:%M:%S%z",
+            "12:14:30.000-00:00": "%H:%M:%S%z",
+        }
+
+        for value, fmt in cases.items():
+            expected = tuple(DateTimeParser(value.strip(), fmt).parse())
+            self.assertEqual(expected, tuple(parse_date_args(value, fmt)), value)
+
+        with self.assertRaises(ValueError) as cm:
+            list(parse_date_args("12:14:30.1234567891", "%H:%M:%S%z"))
+
+        self.assertEqual(
+            "String '12:14:30.1234567891' does not match format '%H:%M:%S%z'",
+            str(cm.exception),
+        )
+
+    def test_parse_many_date_args(self):
+        values = ["2002-01-02", " -2002-01-02+01:00", "2002-01-02Z"]
+        expected = [(2002, 1, 2, None), (-2002, 1, 2, 60), (2002, 1, 2, 0)]
+        self.assertEqual(expected, parse_many_date_args(values, "%Y-%m-%d%z"))
+
+        values = ["2002-01", "-2002-01+01:00"]
+        expected = [(2002, 1, None), (-2002, 1, 60)]
+        self.assertEqual(expected, parse_many_date_args(values, "%Y-%m%z"))
+
+        with self.assertRaises(ValueError):
+            parse_many_date_args(["2002-01-02", "2002-1-02"], "%Y-%m-%d%z")
+
+        with self.assertRaises(ValueError):
+            parse_many_date_args([1], "%Y-%m-%d%z")
+
     def test_validate_date(self):
         invalid = {
             (0, 0, 0): "Month must be in 1..12",
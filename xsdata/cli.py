@@ -113,7 +113,21 @@ def download(source: str, output: str):
 )
 @click.option("-c", "--config", default=".xsdata.xml", help="Project configuration")
 @click.option("-pp", "--print", is_flag=True, default=False, help="Print output")
-@click.option("--cache", is_flag=True, default=False, help="Cache sources loading")
+@click.option(
+    "--cache",
+    is_flag=True,
+    default=False,
+    help=(
+        "Cache the mapped xsd sources by their content, "
+        "remove the xsdata directory under the system temp directory to clear it"
+    ),
+)
+@click.option(
+    "--workers",
+    type=int,
+    default=1,
+    help="Number of processes to parse the xsd sources",
+)
 @click.option("--debug", is_flag=True, default=False, help="Show debug messages")
 @model_options(GeneratorOutput)
 def generate(**kwargs: Any):
@@ -129,6 +143,7 @@ def generate(**kwargs: Any):
     source = kwargs.pop("source")
     stdout = kwargs.pop("print")
     cache = kwargs.pop("cache")
+    workers = kwargs.pop("workers")
     recursive = kwargs.pop("recursive")
     config_file = Path(kwargs.pop("config")).resolve()
 
@@ -136,7 +151,7 @@ def generate(**kwargs: Any):
     config = GeneratorConfig.read(config_file)
     config.output.update(**params)
 
-    transformer = ResourceTransformer(config=config, print=stdout)
+    transformer = ResourceTransformer(config=config, print=stdout, workers=workers)
     uris = sorted(resolve_source(source, recursive=recursive))
     transformer.process(uris, cache=cache)
 
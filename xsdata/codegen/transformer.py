@@ -4,12 +4,15 @@ import json
 import os
 import pickle
 import tempfile
+import warnings
 from collections import defaultdict
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
 from pathlib import Path
-from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+from typing import Callable, Dict, List, NamedTuple, Optional, Set, Tuple
 
 from toposort import CircularDependencyError
 
+from xsdata import __version__
 from xsdata.codegen import opener
 from xsdata.codegen.container import ClassContainer
 from xsdata.codegen.exceptions import CodegenError
@@ -41,6 +44,8 @@ TYPE_DTD = 3
 TYPE_XML = 4
 TYPE_JSON = 5
 
+CACHE_MAX_FILES = 1024
+
 
 class SupportedType(NamedTuple):
     """A supported resource model representation.
@@ -92,6 +97,31 @@ supported_types = [
 ]
 
 
+def map_schema(
+    content: bytes, uri: str, namespace: Optional[str]
+) -> Tuple[Optional[str], List[str], List[Class]]:
+    """Parse and convert the schema content to codegen classes.
+
+    The function runs in the process pool workers, it returns only
+    what the transformer needs to walk the includes graph, in order
+    to avoid sending back the whole schema instance.
+
+    Args:
+        content: The schema raw bytes content
+        uri: The schema URI location
+        namespace: The target namespace, if the URI is
+            from an inline import
+
+    Returns:
+        A tuple of the schema target namespace, the included
+        schema locations and the generated classes.
+    """
+    parser = SchemaParser(target_namespace=namespace, location=uri)
+    schema = parser.from_bytes(content, Schema)
+    locations = [sub.location for sub in schema.included() if sub.location]
+    return schema.target_namespace, locations, SchemaMapper.map(schema)
+
+
 class ResourceTransformer:
     """Orchestrate the code generation from a list of sources.
 
@@ -100,18 +130,31 @@ class ResourceTransformer:
     Args:
         print: Print to stdout the generated output
         config: Generator configuration
+        workers: The number of processes to parse and map
+            the xsd resources, one means no process pool
 
     Attributes:
+        cache: Specifies whether to cache the mapped classes per xsd resource
         classes: A list of class instances
         processed: A list of processed uris
         preloaded: A uri/content map used as cache
     """
 
-    __slots__ = ("print", "config", "classes", "processed", "preloaded")
-
-    def __init__(self, print: bool, config: GeneratorConfig):
+    __slots__ = (
+        "print",
+        "config",
+        "workers",
+        "cache",
+        "classes",
+        "processed",
+        "preloaded",
+    )
+
+    def __init__(self, print: bool, config: GeneratorConfig, workers: int = 1):
         self.print = print
         self.config = config
+        self.workers = workers
+        self.cache = False
         self.classes: List[Class] = []
         self.processed: List[str] = []
         self.preloaded: Dict = {}
@@ -121,18 +164,13 @@ class ResourceTransformer:
 
         Args:
             uris: A list of absolute URI strings to process
-            cache: Specifies whether to catch the initial parsed classes
+            cache: Specifies whether to cache the mapped classes
+                of every xsd resource by its content
         """
-        cache_file = self.get_cache_file(uris) if cache else None
-        if cache_file and cache_file.exists():
-            logger.info(f"Loading from cache {cache_file}")
-
-            self.classes = pickle.loads(cache_file.read_bytes())
-        else:
-            self.process_sources(uris)
-
-        if cache_file and not cache_file.exists():
-            cache_file.write_bytes(pickle.dumps(self.classes))
+        self.cache = cache
+        self.process_sources(uris)
+        if cache:
+            self.prune_cache()
 
         try:
             self.process_classes()
@@ -186,8 +224,101 @@ class ResourceTransformer:
         Args:
             uris: A list of xsd URI strings to process
         """
+        if self.workers > 1 and uris:
+            self.process_schemas_concurrently(uris)
+        else:
+            for uri in uris:
+                self.process_schema(uri)
+
+    def process_schemas_concurrently(self, uris: List[str]):
+        """Process a list of xsd resources with a process pool.
+
+        The schemas are parsed and mapped in the pool, as soon as
+        their including schemas are done and their locations are
+        known. The classes are then collected in the same order
+        and from the same schema instances as the serial run, in
+        order to produce the same output.
+
+        Args:
+            uris: A list of xsd URI strings to process
+        """
+        futures: Dict[Tuple[str, Optional[str]], Optional[Future]] = {}
+        contents: Dict[str, Optional[bytes]] = {}
+        cache_files: Dict[Future, Path] = {}
+
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+
+            def submit(uri: str, namespace: Optional[str]) -> Optional[Future]:
+                key = (uri, namespace)
+                if key in futures:
+                    return None
+
+                if uri not in contents:
+                    contents[uri] = self.load_resource(uri)
+
+                content = contents[uri]
+                if content is None:
+                    futures[key] = None
+                    return None
+
+                cache_file = None
+                if self.cache:
+                    cache_file = self.get_schema_cache_file(content, uri, namespace)
+                    if cache_file.exists():
+                        logger.info("Loading from cache %s", uri)
+                        cache_file.touch()
+                        future = futures[key] = Future()
+                        future.set_result(pickle.loads(cache_file.read_bytes()))
+                        return future
+
+                logger.info("Parsing schema %s", uri)
+                future = futures[key] = executor.submit(
+                    map_schema, content, uri, namespace
+                )
+                if cache_file:
+                    cache_files[future] = cache_file
+
+                return future
+
+            pending = set(filter(None, (submit(uri, None) for uri in uris)))
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    target_namespace, locations, _ = future.result()
+                    if future in cache_files:
+                        result = pickle.dumps(future.result())
+                        cache_files.pop(future).write_bytes(result)
+
+                    pending.update(
+                        filter(None, (submit(x, target_namespace) for x in locations))
+                    )
+
+        visited: Set[str] = set()
+
+        def collect(uri: str, namespace: Optional[str]):
+            if uri in visited:
+                return
+
+            visited.add(uri)
+            future = futures[(uri, namespace)]
+            if future is None:
+                return
+
+            target_namespace, locations, classes = future.result()
+            for location in locations:
+                collect(location, target_namespace)
+
+            logger.info("Compiling schema %s", uri)
+            class_num, inner_num = self.count_classes(classes)
+            if class_num > 0:
+                logger.info(
+                    "Builder: %d main and %d inner classes", class_num, inner_num
+                )
+
+            self.classes.extend(classes)
+
         for uri in uris:
-            self.process_schema(uri)
+            collect(uri, None)
 
     def process_dtds(self, uris: List[str]):
         """Process a list of dtd resources.
@@ -215,9 +346,44 @@ class ResourceTransformer:
             namespace: The target namespace, if the URI is
                 from an inline import
         """
-        schema = self.parse_schema(uri, namespace)
-        if schema:
-            self.convert_schema(schema)
+        if self.cache:
+            self.process_cached_schema(uri, namespace)
+        else:
+            schema = self.parse_schema(uri, namespace)
+            if schema:
+                self.convert_schema(schema)
+
+    def process_cached_schema(self, uri: str, namespace: Optional[str]):
+        """Load or parse and convert the schema to codegen models.
+
+        The mapped classes are cached by the schema content, the
+        included schemas are processed on their own, so a change
+        in a schema doesn't invalidate the rest of them.
+
+        Args:
+            uri: The schema URI location
+            namespace: The target namespace, if the URI is
+                from an inline import
+        """
+        content = self.load_resource(uri)
+        if content is None:
+            return
+
+        cache_file = self.get_schema_cache_file(content, uri, namespace)
+        if cache_file.exists():
+            logger.info("Loading from cache %s", uri)
+            cache_file.touch()
+            result = pickle.loads(cache_file.read_bytes())
+        else:
+            logger.info("Parsing schema %s", uri)
+            result = map_schema(content, uri, namespace)
+            cache_file.write_bytes(pickle.dumps(result))
+
+        target_namespace, locations, classes = result
+        for location in locations:
+            self.process_schema(location, target_namespace)
+
+        self.classes.extend(classes)
 
     def process_xml_documents(self, uris: List[str]):
         """Process a list of xml resources.
@@ -432,12 +598,76 @@ class ResourceTransformer:
     def get_cache_file(cls, uris: List[str]) -> Path:
         """Return the cache path for the raw mapped classes.
 
+        Deprecated, the classes are cached per schema, see the
+        `get_schema_cache_file` method.
+
         Args:
             uris: A list of URI strings
 
         Returns:
             A temporary file path instance
         """
+        warnings.warn(
+            "`get_cache_file` is deprecated, use `get_schema_cache_file` instead",
+            DeprecationWarning,
+        )
         key = hashlib.md5("".join(uris).encode()).hexdigest()
         tempdir = tempfile.gettempdir()
         return Path(tempdir).joinpath(f"{key}.cache")
+
+    @classmethod
+    def get_schema_cache_file(
+        cls, content: bytes, uri: str, namespace: Optional[str]
+    ) -> Path:
+        """Return the cache path for the mapped classes of a schema.
+
+        The key is the hash of the schema content, location and
+        target namespace and of the xsdata version.
+
+        Args:
+            content: The schema raw bytes content
+            uri: The schema URI location
+            namespace: The target namespace, if the URI is
+                from an inline import
+
+        Returns:
+            A temporary file path instance
+        """
+        digest = hashlib.sha256(content)
+        digest.update(f"{__version__}\0{uri}\0{namespace or ''}".encode())
+        return cls.get_cache_dir().joinpath(f"{digest.hexdigest()}.cache")
+
+    @classmethod
+    def get_cache_dir(cls) -> Path:
+        """Return the directory of the schema cache files.
+
+        It's the `xsdata` directory in the system temporary
+        directory, remove it to clear the cache.
+
+        Returns:
+            The cache directory path instance.
+        """
+        path = Path(tempfile.gettempdir()).joinpath("xsdata")
+        path.mkdir(exist_ok=True)
+        return path
+
+    @classmethod
+    def prune_cache(cls, max_files: int = CACHE_MAX_FILES):
+        """Remove the least recently used schema cache files over the limit.
+
+        The cache hits touch their files, so the modification
+        time is the last time a file was used.
+
+        Args:
+            max_files: The maximum number of cache files to keep
+        """
+        files = []
+        for path in cls.get_cache_dir().glob("*.cache"):
+            try:
+                files.append((path.stat().st_mtime, path))
+            except FileNotFoundError:
+                continue
+
+        files.sort()
+        for _, path in files[: max(len(files) - max_files, 0)]:
+            path.unlink(missing_ok=True)
@@ -2,7 +2,10 @@ import abc
 import base64
 import binascii
 import math
+import sys
+import threading
 import warnings
+from collections import OrderedDict
 from datetime import date, datetime, time
 from decimal import Decimal, InvalidOperation
 from enum import Enum, EnumMeta
@@ -10,6 +13,7 @@ from typing import (
     Any,
     Callable,
     Dict,
+    Iterable,
     List,
     Optional,
     Sequence,
@@ -32,6 +36,20 @@ from xsdata.models.datatype import (
 )
 from xsdata.utils import collections, namespaces, text
 
+UNCONVERTED: Any = object()
+
+if sys.version_info >= (3, 11):
+
+    def decode_base64(value: str) -> bytes:
+        """Validate and decode the base64 text without an ascii bytes copy."""
+        return binascii.a2b_base64(value, strict_mode=True)
+
+else:  # pragma: no cover
+
+    def decode_base64(value: str) -> bytes:
+        """Validate and decode the base64 text."""
+        return base64.b64decode(value, validate=True)
+
 
 class Converter(abc.ABC):
     """Abstract converter class."""
@@ -51,6 +69,48 @@ class Converter(abc.ABC):
             ConverterError: if the value can't be converted.
         """
 
+    def try_deserialize(self, value: Any, **kwargs: Any) -> Any:
+        """Convert a value to a python type without raising errors.
+
+        Converters should override this method when they can detect
+        invalid values without raising and catching exceptions.
+
+        Args:
+            value: The input value
+            **kwargs: Additional keyword arguments needed per converter
+
+        Returns:
+            The converted value or the `UNCONVERTED` sentinel.
+        """
+        try:
+            return self.deserialize(value, **kwargs)
+        except ConverterError:
+            return UNCONVERTED
+
+    def try_deserialize_many(self, values: Sequence, **kwargs: Any) -> Any:
+        """Convert a list of values to a python type without raising errors.
+
+        Converters should override this method when they can convert
+        the whole list at once, e.g. with a builtin type constructor.
+
+        Args:
+            values: The input values
+            **kwargs: Additional keyword arguments needed per converter
+
+        Returns:
+            The list of converted values or the `UNCONVERTED` sentinel,
+            if any of the values can't be converted.
+        """
+        result = []
+        for value in values:
+            converted = self.try_deserialize(value, **kwargs)
+            if converted is UNCONVERTED:
+                return UNCONVERTED
+
+            result.append(converted)
+
+        return result
+
     @abc.abstractmethod
     def serialize(self, value: Any, **kwargs: Any) -> str:
         """Convert value to string for serialization.
@@ -72,19 +132,32 @@ class Converter(abc.ABC):
             )
 
 
+ResolvedConverters = Tuple[Tuple[Type, Optional[Converter]], ...]
+
+
 class ConverterFactory:
     """Converter factory class.
 
     Attributes:
         registry: The registered converters
+        mro_cache: The resolved converters of unregistered subclasses
+        version: The registry version, it changes on every (un)registration
     """
 
-    __slots__ = "registry"
+    __slots__ = ("registry", "mro_cache", "version")
 
     def __init__(self):
         self.registry: Dict[Type, Converter] = {}
+        self.mro_cache: Dict[Type, Converter] = {}
+        self.version = 0
 
-    def deserialize(self, value: Any, types: Sequence[Type], **kwargs: Any) -> Any:
+    def deserialize(
+        self,
+        value: Any,
+        types: Sequence[Type],
+        converters: Optional[ResolvedConverters] = None,
+        **kwargs: Any,
+    ) -> Any:
         """Attempt to convert any value to one of the given types.
 
         If all attempts fail return the value input value and emit a
@@ -93,23 +166,95 @@ class ConverterFactory:
         Args:
             value: The input value
             types: The target candidate types
+            converters: The pre-resolved converters of the given types
             **kwargs: Additional keyword arguments needed per converter
 
         Returns:
             The converted value or the input value.
         """
-        for data_type in types:
-            try:
+        if converters is None:
+            converters = self.resolve_converters(types)
+
+        for data_type, instance in converters:
+            if instance is None:
                 instance = self.type_converter(data_type)
-                return instance.deserialize(value, data_type=data_type, **kwargs)
-            except ConverterError:
-                pass
+
+            result = instance.try_deserialize(value, data_type=data_type, **kwargs)
+            if result is not UNCONVERTED:
+                return result
 
         warnings.warn(
             f"Failed to convert value `{value}` to one of {types}", ConverterWarning
         )
         return value
 
+    def deserialize_many(
+        self,
+        values: Sequence,
+        types: Sequence[Type],
+        converters: Optional[ResolvedConverters] = None,
+        **kwargs: Any,
+    ) -> List:
+        """Convert a list of values to one of the given types.
+
+        The values are converted at once to the first type, which
+        covers homogeneous lists of numbers or dates. On failures
+        every value is converted on its own to any of the types.
+
+        Args:
+            values: The input values
+            types: The target candidate types
+            converters: The pre-resolved converters of the given types
+            **kwargs: Additional keyword arguments needed per converter
+
+        Returns:
+            The list of the converted values.
+        """
+        if converters is None:
+            converters = self.resolve_converters(types)
+
+        # Unregistered types warn on every value, skip the bulk attempt
+        data_type, instance = converters[0] if converters else (None, None)
+        if instance is not None:
+            result = instance.try_deserialize_many(
+                values, data_type=data_type, **kwargs
+            )
+            if result is not UNCONVERTED:
+                return result
+
+        return [
+            self.deserialize(value, types, converters, **kwargs) for value in values
+        ]
+
+    def try_deserialize(
+        self,
+        value: Any,
+        types: Sequence[Type],
+        **kwargs: Any,
+    ) -> Any:
+        """Attempt to convert any value to one of the given types.
+
+        Unlike the deserialize method, failures are silent, the types
+        without a registered converter are skipped and no warnings
+        are emitted.
+
+        Args:
+            value: The input value
+            types: The target candidate types
+            **kwargs: Additional keyword arguments needed per converter
+
+        Returns:
+            The converted value or the `UNCONVERTED` sentinel.
+        """
+        for data_type in types:
+            instance = self.find_converter(data_type)
+            if instance is not None:
+                result = instance.try_deserialize(value, data_type=data_type, **kwargs)
+                if result is not UNCONVERTED:
+                    return result
+
+        return UNCONVERTED
+
     def serialize(self, value: Any, **kwargs: Any) -> Any:
         """Convert the given value to string.
 
@@ -153,10 +298,8 @@ class ConverterFactory:
         if not isinstance(value, str):
             return False
 
-        with warnings.catch_warnings(record=True) as w:
-            decoded = self.deserialize(value, types, **kwargs)
-
-        if w and w[-1].category is ConverterWarning:
+        decoded = self.try_deserialize(value, types, **kwargs)
+        if decoded is UNCONVERTED:
             return False
 
         if strict and isinstance(decoded, (float, int, Decimal, XmlPeriod)):
@@ -177,6 +320,9 @@ class ConverterFactory:
         else:
             self.registry[data_type] = ProxyConverter(func)
 
+        self.version += 1
+        self.clear_cache()
+
     def unregister_converter(self, data_type: Type):
         """Unregister the converter for the given data type.
 
@@ -187,13 +333,19 @@ class ConverterFactory:
             KeyError: if the data type is not registered.
         """
         self.registry.pop(data_type)
+        self.version += 1
+        self.clear_cache()
+
+    def clear_cache(self):
+        """Clear the resolved subclasses converters cache."""
+        self.mro_cache.clear()
 
     def type_converter(self, data_type: Type) -> Converter:
         """Find a suitable converter for given data type.
 
         Iterate over all but last mro items and check for registered
         converters, fall back to str and issue a warning if there are
-        no matches.
+        no matches. The mro matches are memoized per data type.
 
         Args:
             data_type: The data type
@@ -201,19 +353,57 @@ class ConverterFactory:
         Returns:
             A converter instance
         """
+        instance = self.find_converter(data_type)
+        if instance is not None:
+            return instance
+
+        warnings.warn(f"No converter registered for `{data_type}`", ConverterWarning)
+        return self.registry[str]
+
+    def find_converter(self, data_type: Type) -> Optional[Converter]:
+        """Find the registered converter for the given data type or its mro.
+
+        Args:
+            data_type: The data type
+
+        Returns:
+            A converter instance or None if there are no matches.
+        """
         try:
             # Quick in and out, without checking the whole mro.
             return self.registry[data_type]
         except KeyError:
             pass
 
+        try:
+            return self.mro_cache[data_type]
+        except KeyError:
+            pass
+
         # We tested the first, ignore the object
         for mro in data_type.__mro__[1:-1]:
             if mro in self.registry:
-                return self.registry[mro]
+                instance = self.registry[mro]
+                self.mro_cache[data_type] = instance
+                return instance
 
-        warnings.warn(f"No converter registered for `{data_type}`", ConverterWarning)
-        return self.registry[str]
+        return None
+
+    def resolve_converters(self, types: Sequence[Type]) -> ResolvedConverters:
+        """Resolve the registered converters of the given types.
+
+        The types without a registered converter are paired with None,
+        the deserialize methods fall back to the str converter for
+        them and emit the warning on use. The result is only valid
+        while the registry version stays the same.
+
+        Args:
+            types: The target candidate types
+
+        Returns:
+            A tuple of data type and converter instance pairs.
+        """
+        return tuple((tp, self.find_converter(tp)) for tp in types)
 
     def value_converter(self, value: Any) -> Converter:
         """Get a suitable converter for the given value."""
@@ -233,6 +423,156 @@ class ConverterFactory:
         return __EXPLICIT_TYPES__
 
 
+class ConverterCache:
+    """Bounded LRU memo of converted lexical values.
+
+    The cache only memoizes the conversions to immutable types, the
+    results are shared between all the parsed objects. The values
+    that fail to convert are never memoized, they always go through
+    the converter factory, which emits the warnings.
+
+    The memoized values are dropped when a converter is registered or
+    unregistered, the results of the replaced converters are stale.
+
+    The cache is thread safe, the parsers can share it between threads.
+
+    Args:
+        maxsize: The max number of memoized values
+        types: The immutable types to memoize, enum types are
+            always included
+
+    Attributes:
+        values: The memoized values, in least recently used order
+        cacheable: The types sequences to whether they are cacheable
+        lock: The lock of the memoized values
+        version: The converter factory version of the memoized values
+    """
+
+    __slots__ = ("maxsize", "types", "values", "cacheable", "lock", "version")
+
+    def __init__(self, maxsize: int = 4096, types: Optional[Iterable[Type]] = None):
+        self.maxsize = maxsize
+        self.types = frozenset(__IMMUTABLE_TYPES__ if types is None else types)
+        self.values: OrderedDict = OrderedDict()
+        self.cacheable: Dict[Tuple[Type, ...], bool] = {}
+        self.lock = threading.Lock()
+        self.version = converter.version
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Return the cache settings as the pickle state."""
+        return {"maxsize": self.maxsize, "types": self.types}
+
+    def __setstate__(self, state: Dict[str, Any]):
+        """Create an empty cache with the pickled settings."""
+        ConverterCache.__init__(self, **state)
+
+    def deserialize(
+        self,
+        value: Any,
+        types: Sequence[Type],
+        ns_map: Optional[Dict] = None,
+        format: Optional[str] = None,
+    ) -> Any:
+        """Convert the value to one of the given types or return the memoized result.
+
+        The memo key includes the namespace of the value prefix, the
+        same qualified name might resolve differently per element.
+
+        Args:
+            value: The input value
+            types: The target candidate types
+            ns_map: The namespace prefix-URI map
+            format: The format argument for base64/hex values or dates
+
+        Returns:
+            The converted value or the input value.
+        """
+        if not isinstance(types, tuple):
+            types = tuple(types)
+
+        if not isinstance(value, str) or not self.is_cacheable(types):
+            return converter.deserialize(value, types, ns_map=ns_map, format=format)
+
+        key = (value, types, format, self.resolve_namespace(value, ns_map))
+        values = self.values
+        with self.lock:
+            if self.version != converter.version:
+                values.clear()
+                self.version = converter.version
+
+            try:
+                result = values[key]
+                values.move_to_end(key)
+                return result
+            except KeyError:
+                pass
+
+        result = converter.try_deserialize(value, types, ns_map=ns_map, format=format)
+        if result is UNCONVERTED:
+            return converter.deserialize(value, types, ns_map=ns_map, format=format)
+
+        if type(result) in self.types or isinstance(result, Enum):
+            with self.lock:
+                values[key] = result
+                if len(values) > self.maxsize:
+                    values.popitem(last=False)
+
+        return result
+
+    def is_cacheable(self, types: Tuple[Type, ...]) -> bool:
+        """Return whether all the given types are immutable.
+
+        Args:
+            types: The target candidate types
+
+        Returns:
+            The bool result.
+        """
+        try:
+            return self.cacheable[types]
+        except KeyError:
+            result = self.cacheable[types] = all(
+                tp in self.types or (isinstance(tp, type) and issubclass(tp, Enum))
+                for tp in types
+            )
+            return result
+
+    def clear(self):
+        """Remove all the memoized values."""
+        with self.lock:
+            self.values.clear()
+
+    @classmethod
+    def resolve_namespace(cls, value: str, ns_map: Optional[Dict]) -> Optional[str]:
+        """Return the namespace of the value prefix, if it has one.
+
+        Args:
+            value: The input value
+            ns_map: The namespace prefix-URI map
+
+        Returns:
+            The prefix or the default namespace or None.
+        """
+        if not ns_map:
+            return None
+
+        index = value.find(":")
+        return ns_map.get(value[:index].strip() if index > -1 else None)
+
+
+__IMMUTABLE_TYPES__ = (
+    bool,
+    int,
+    float,
+    Decimal,
+    date,
+    time,
+    datetime,
+    XmlDate,
+    XmlDateTime,
+    XmlTime,
+)
+
 __PYTHON_TYPES_SORTED__ = {
     int: 1,
     bool: 2,
@@ -250,6 +590,13 @@ __PYTHON_TYPES_SORTED__ = {
     str: 14,
 }
 
+__BOOL_LITERALS__ = {
+    "true": True,
+    "1": True,
+    "false": False,
+    "0": False,
+}
+
 __EXPLICIT_TYPES__ = (
     int,
     bool,
@@ -270,6 +617,10 @@ class StringConverter(Converter):
         """Convert a value to string."""
         return value if isinstance(value, str) else str(value)
 
+    def try_deserialize(self, value: Any, **kwargs: Any) -> Any:
+        """Convert a value to string."""
+        return value if isinstance(value, str) else str(value)
+
     def serialize(self, value: Any, **kwargs: Any) -> str:
         """Convert a value to string."""
         return value if isinstance(value, str) else str(value)
@@ -308,6 +659,24 @@ class BoolConverter(Converter):
 
         raise ConverterError(f"Invalid bool literal '{value}'")
 
+    def try_deserialize(self, value: Any, **kwargs: Any) -> Any:
+        """Convert a value to bool without raising errors.
+
+        Args:
+            value: The input value
+            **kwargs: Unused keyword arguments
+
+        Returns:
+            The bool value or the `UNCONVERTED` sentinel.
+        """
+        if isinstance(value, str):
+            return __BOOL_LITERALS__.get(value.strip(), UNCONVERTED)
+
+        if value is True or value is False:
+            return value
+
+        return UNCONVERTED
+
     def serialize(self, value: bool, **kwargs: Any) -> str:
         """Convert a bool value to string.
 
@@ -342,6 +711,36 @@ class IntConverter(Converter):
         except (ValueError, TypeError) as e:
             raise ConverterError(e)
 
+    def try_deserialize(self, value: Any, **kwargs: Any) -> Any:
+        """Convert a value to int without raising errors.
+
+        Args:
+            value: The input value
+            **kwargs: Unused keyword arguments
+
+        Returns:
+            The int value or the `UNCONVERTED` sentinel.
+        """
+        try:
+            return int(value)
+        except (ValueError, TypeError):
+            return UNCONVERTED
+
+    def try_deserialize_many(self, values: Sequence, **kwargs: Any) -> Any:
+        """Convert a list of values to int without raising errors.
+
+        Args:
+            values: The input values
+            **kwargs: Unused keyword arguments
+
+        Returns:
+            The list of int values or the `UNCONVERTED` sentinel.
+        """
+        try:
+            return list(map(int, values))
+        except (ValueError, TypeError):
+            return UNCONVERTED
+
     def serialize(self, value: int, **kwargs: Any) -> str:
         """Convert an int value sto string.
 
@@ -378,6 +777,36 @@ class FloatConverter(Converter):
         except ValueError as e:
             raise ConverterError(e)
 
+    def try_deserialize(self, value: Any, **kwargs: Any) -> Any:
+        """Convert a value to float without raising errors.
+
+        Args:
+            value: The input value
+            **kwargs: Unused keyword arguments
+
+        Returns:
+            The float value or the `UNCONVERTED` sentinel.
+        """
+        try:
+            return float(value)
+        except ValueError:
+            return UNCONVERTED
+
+    def try_deserialize_many(self, values: Sequence, **kwargs: Any) -> Any:
+        """Convert a list of values to float without raising errors.
+
+        Args:
+            values: The input values
+            **kwargs: Unused keyword arguments
+
+        Returns:
+            The list of float values or the `UNCONVERTED` sentinel.
+        """
+        try:
+            return list(map(float, values))
+        except ValueError:
+            return UNCONVERTED
+
     def serialize(self, value: float, **kwargs: Any) -> str:
         """Convert a float value sto string.
 
@@ -427,7 +856,7 @@ class BytesConverter(Converter):
                 return binascii.unhexlify(value)
 
             if fmt == "base64":
-                return base64.b64decode(value, validate=True)
+                return decode_base64(value)
 
             raise ConverterError(f"Unknown format '{fmt}'")
         except ValueError as e:
@@ -480,6 +909,36 @@ class DecimalConverter(Converter):
         except InvalidOperation:
             raise ConverterError()
 
+    def try_deserialize(self, value: Any, **kwargs: Any) -> Any:
+        """Convert a value to decimal without raising errors.
+
+        Args:
+            value: The input value
+            **kwargs: Unused keyword arguments
+
+        Returns:
+            The decimal value or the `UNCONVERTED` sentinel.
+        """
+        try:
+            return Decimal(value)
+        except InvalidOperation:
+            return UNCONVERTED
+
+    def try_deserialize_many(self, values: Sequence, **kwargs: Any) -> Any:
+        """Convert a list of values to decimal without raising errors.
+
+        Args:
+            values: The input values
+            **kwargs: Unused keyword arguments
+
+        Returns:
+            The list of decimal values or the `UNCONVERTED` sentinel.
+        """
+        try:
+            return list(map(Decimal, values))
+        except InvalidOperation:
+            return UNCONVERTED
+
     def serialize(self, value: Decimal, **kwargs: Any) -> str:
         """Convert a decimal value sto string.
 
@@ -693,9 +1152,9 @@ class EnumConverter(Converter):
 
     @classmethod
     def _match_atomic(cls, raw: Any, real: Any, **kwargs: Any) -> bool:
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore")
-            cmp = converter.deserialize(raw, [type(real)], **kwargs)
+        cmp = converter.try_deserialize(raw, [type(real)], **kwargs)
+        if cmp is UNCONVERTED:
+            cmp = raw
 
         if isinstance(real, float):
             return cmp == real or repr(cmp) == repr(real)
@@ -824,12 +1283,14 @@ class ProxyConverter(Converter):
 
     Args:
         factory: The callable factory
+        many_factory: The optional callable factory of value lists
     """
 
-    __slots__ = "factory"
+    __slots__ = ("factory", "many_factory")
 
-    def __init__(self, factory: Callable):
+    def __init__(self, factory: Callable, many_factory: Optional[Callable] = None):
         self.factory = factory
+        self.many_factory = many_factory
 
     def deserialize(self, value: Any, **kwargs: Any) -> Any:
         """Call the instance factory and return the result.
@@ -849,6 +1310,39 @@ class ProxyConverter(Converter):
         except ValueError as e:
             raise ConverterError(e)
 
+    def try_deserialize(self, value: Any, **kwargs: Any) -> Any:
+        """Call the instance factory without raising value errors.
+
+        Args:
+            value: The input value to convert
+            **kwargs: Unused keyword arguments
+
+        Returns:
+            The return result of the callable or the `UNCONVERTED` sentinel.
+        """
+        try:
+            return self.factory(value)
+        except ValueError:
+            return UNCONVERTED
+
+    def try_deserialize_many(self, values: Sequence, **kwargs: Any) -> Any:
+        """Call the list factory without raising value errors.
+
+        Args:
+            values: The input values to convert
+            **kwargs: Unused keyword arguments
+
+        Returns:
+            The list of converted values or the `UNCONVERTED` sentinel.
+        """
+        if self.many_factory is None:
+            return super().try_deserialize_many(values, **kwargs)
+
+        try:
+            return self.many_factory(values)
+        except ValueError:
+            return UNCONVERTED
+
     def serialize(self, value: Any, **kwargs: Any) -> str:
         """Cast value to str."""
         return str(value)
@@ -864,9 +1358,15 @@ converter.register_converter(object, converter.type_converter(str))
 converter.register_converter(time, TimeConverter())
 converter.register_converter(date, DateConverter())
 converter.register_converter(datetime, DateTimeConverter())
-converter.register_converter(XmlTime, ProxyConverter(XmlTime.from_string))
-converter.register_converter(XmlDate, ProxyConverter(XmlDate.from_string))
-converter.register_converter(XmlDateTime, ProxyConverter(XmlDateTime.from_string))
+converter.register_converter(
+    XmlTime, ProxyConverter(XmlTime.from_string, XmlTime.from_strings)
+)
+converter.register_converter(
+    XmlDate, ProxyConverter(XmlDate.from_string, XmlDate.from_strings)
+)
+converter.register_converter(
+    XmlDateTime, ProxyConverter(XmlDateTime.from_string, XmlDateTime.from_strings)
+)
 converter.register_converter(XmlDuration, ProxyConverter(XmlDuration))
 converter.register_converter(XmlPeriod, ProxyConverter(XmlPeriod))
 converter.register_converter(QName, QNameConverter())
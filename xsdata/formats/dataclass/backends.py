@@ -0,0 +1,169 @@
+import abc
+import json
+from typing import Any, BinaryIO, Dict, List, Optional, Union
+
+
+class JsonBackend(abc.ABC):
+    """Json library interface for the json parser and serializer.
+
+    The backends load the decoded dictionaries from json bytes or
+    text and dump the encoded dictionaries to utf-8 json bytes.
+    """
+
+    __slots__ = ()
+
+    @abc.abstractmethod
+    def loads(self, source: Union[bytes, str]) -> Union[Dict, List]:
+        """Load the given json document.
+
+        Args:
+            source: The json bytes or string
+
+        Returns:
+            The loaded dictionary or list of dictionaries.
+        """
+
+    @abc.abstractmethod
+    def dumps(self, obj: Any, indent: Optional[str] = None) -> bytes:
+        """Dump the given object to utf-8 json bytes.
+
+        Args:
+            obj: The encoded dictionary or list of dictionaries
+            indent: The indentation string, if pretty print is enabled
+
+        Returns:
+            The json bytes output.
+        """
+
+    def load(self, fp: BinaryIO) -> Union[Dict, List]:
+        """Load the json document from the given binary stream.
+
+        Args:
+            fp: The input binary stream
+
+        Returns:
+            The loaded dictionary or list of dictionaries.
+        """
+        return self.loads(fp.read())
+
+
+class StdlibJsonBackend(JsonBackend):
+    """The python standard library json backend."""
+
+    __slots__ = ()
+
+    def loads(self, source: Union[bytes, str]) -> Union[Dict, List]:
+        """Load the given json document.
+
+        Args:
+            source: The json bytes or string
+
+        Returns:
+            The loaded dictionary or list of dictionaries.
+        """
+        return json.loads(source)
+
+    def dumps(self, obj: Any, indent: Optional[str] = None) -> bytes:
+        """Dump the given object to utf-8 json bytes.
+
+        Args:
+            obj: The encoded dictionary or list of dictionaries
+            indent: The indentation string, if pretty print is enabled
+
+        Returns:
+            The json bytes output.
+        """
+        return json.dumps(obj, indent=indent).encode()
+
+    def load(self, fp: BinaryIO) -> Union[Dict, List]:
+        """Load the json document from the given binary stream.
+
+        Args:
+            fp: The input binary stream
+
+        Returns:
+            The loaded dictionary or list of dictionaries.
+        """
+        return json.load(fp)
+
+
+try:
+    import orjson
+
+    class OrjsonBackend(JsonBackend):
+        """The orjson library backend.
+
+        The orjson library only supports two spaces indentation,
+        any other indent value is rendered with two spaces. It
+        also writes compact json, dumps NaN and infinity as null
+        and raises a TypeError for integers beyond 64 bits.
+        """
+
+        __slots__ = ()
+
+        def loads(self, source: Union[bytes, str]) -> Union[Dict, List]:
+            """Load the given json document.
+
+            Args:
+                source: The json bytes or string
+
+            Returns:
+                The loaded dictionary or list of dictionaries.
+            """
+            return orjson.loads(source)
+
+        def dumps(self, obj: Any, indent: Optional[str] = None) -> bytes:
+            """Dump the given object to utf-8 json bytes.
+
+            Args:
+                obj: The encoded dictionary or list of dictionaries
+                indent: The indentation string, if pretty print is enabled
+
+            Returns:
+                The json bytes output.
+            """
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+
+except ImportError:  # pragma: no cover
+    pass
+
+
+try:
+    import ujson  # type: ignore
+
+    class UjsonBackend(JsonBackend):  # pragma: no cover
+        """The ujson library backend."""
+
+        __slots__ = ()
+
+        def loads(self, source: Union[bytes, str]) -> Union[Dict, List]:
+            """Load the given json document.
+
+            Args:
+                source: The json bytes or string
+
+            Returns:
+                The loaded dictionary or list of dictionaries.
+            """
+            return ujson.loads(source)
+
+        def dumps(self, obj: Any, indent: Optional[str] = None) -> bytes:
+            """Dump the given object to utf-8 json bytes.
+
+            Args:
+                obj: The encoded dictionary or list of dictionaries
+                indent: The indentation string, if pretty print is enabled
+
+            Returns:
+                The json bytes output.
+            """
+            value = ujson.dumps(
+                obj,
+                indent=len(indent) if indent else 0,
+                ensure_ascii=False,
+                escape_forward_slashes=False,
+            )
+            return value.encode()
+
+except ImportError:  # pragma: no cover
+    pass
@@ -1,10 +1,34 @@
-from typing import Any, Dict, NamedTuple, Optional, Type, Union
+import asyncio
+from collections import deque
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from dataclasses import replace
+from typing import (
+    Any,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Type,
+    TypeVar,
+    Union,
+)
 
 from xsdata.exceptions import ClientValueError
 from xsdata.formats.dataclass.context import XmlContext
 from xsdata.formats.dataclass.parsers import DictDecoder, XmlParser
 from xsdata.formats.dataclass.serializers import XmlSerializer
-from xsdata.formats.dataclass.transports import DefaultTransport, Transport
+from xsdata.formats.dataclass.transports import (
+    AsyncTransport,
+    DefaultTransport,
+    Transport,
+    default_async_transport,
+)
+
+T = TypeVar("T", bound="BaseClient")
+A = TypeVar("A", bound="AsyncClient")
 
 
 class Config(NamedTuple):
@@ -58,27 +82,28 @@ class TransportTypes:
     SOAP = "http://schemas.xmlsoap.org/soap/http"
 
 
-class Client:
-    """A wsdl client.
+class BaseClient:
+    """The wsdl client base class.
+
+    The base class prepares the request payload and headers
+    and leaves the transport and the send method to the
+    synchronous and asynchronous clients.
 
     Args:
         config: The service config instance
-        transport: The transport instance
         parser: The xml parser instance
         serializer: The xml serializer instance
     """
 
-    __slots__ = "config", "transport", "parser", "serializer"
+    __slots__ = "config", "parser", "serializer"
 
     def __init__(
         self,
         config: Config,
-        transport: Optional[Transport] = None,
         parser: Optional[XmlParser] = None,
         serializer: Optional[XmlSerializer] = None,
     ):
         self.config = config
-        self.transport = transport or DefaultTransport()
 
         if not serializer and not parser:
             context = XmlContext()
@@ -95,7 +120,7 @@ class Client:
         self.serializer = serializer
 
     @classmethod
-    def from_service(cls, obj: Type, **kwargs: Any) -> "Client":
+    def from_service(cls: Type[T], obj: Type, **kwargs: Any) -> T:
         """Instantiate client from a service class.
 
         Args:
@@ -113,33 +138,6 @@ class Client:
         """
         return cls(config=Config.from_service(obj, **kwargs))
 
-    def send(self, obj: Any, headers: Optional[Dict] = None) -> Any:
-        """Build and send a request for the input object.
-
-        ```py
-        params = {"body": {"add": {"int_a": 3, "int_b": 4}}}
-        res = client.send(params)
-        ```
-        Is equivalent with:
-
-        ```py
-        req = CalculatorSoapAddInput(
-        body=CalculatorSoapAddInput.Body(add=Add(3, 4)))
-        res = client.send(req)
-        ```
-
-        Args:
-            obj: The request model instance or a pure dictionary
-            headers: Additional headers to pass to the transport
-
-        Returns:
-            The response model instance.
-        """
-        data = self.prepare_payload(obj)
-        headers = self.prepare_headers(headers or {})
-        response = self.transport.post(self.config.location, data=data, headers=headers)
-        return self.parser.from_bytes(response, self.config.output)
-
     def prepare_headers(self, headers: Dict) -> Dict:
         """Prepare the request headers.
 
@@ -192,3 +190,248 @@ class Client:
             return result.encode(self.config.encoding)
 
         return result
+
+
+class Client(BaseClient):
+    """A wsdl client.
+
+    Args:
+        config: The service config instance
+        transport: The transport instance
+        parser: The xml parser instance
+        serializer: The xml serializer instance
+    """
+
+    __slots__ = ("transport",)
+
+    def __init__(
+        self,
+        config: Config,
+        transport: Optional[Transport] = None,
+        parser: Optional[XmlParser] = None,
+        serializer: Optional[XmlSerializer] = None,
+    ):
+        super().__init__(config, parser=parser, serializer=serializer)
+        self.transport = transport or DefaultTransport()
+
+    def send(
+        self, obj: Any, headers: Optional[Dict] = None, stream: bool = False
+    ) -> Any:
+        """Build and send a request for the input object.
+
+        ```py
+        params = {"body": {"add": {"int_a": 3, "int_b": 4}}}
+        res = client.send(params)
+        ```
+        Is equivalent with:
+
+        ```py
+        req = CalculatorSoapAddInput(
+        body=CalculatorSoapAddInput.Body(add=Add(3, 4)))
+        res = client.send(req)
+        ```
+
+        Args:
+            obj: The request model instance or a pure dictionary
+            headers: Additional headers to pass to the transport
+            stream: Parse the response incrementally from the
+                transport stream, instead of the full content
+
+        Returns:
+            The response model instance.
+        """
+        data = self.prepare_payload(obj)
+        headers = self.prepare_headers(headers or {})
+        location = self.config.location
+        if stream:
+            with self.transport.post_stream(location, data=data, headers=headers) as f:
+                return self.parser.parse(f, self.config.output)
+
+        response = self.transport.post(location, data=data, headers=headers)
+        return self.parser.from_bytes(response, self.config.output)
+
+    def send_iter(
+        self,
+        obj: Any,
+        path: Union[str, Sequence[str]],
+        headers: Optional[Dict] = None,
+    ) -> Iterator[Any]:
+        """Build and send a request and yield the response objects of the path.
+
+        The response is parsed incrementally from the transport stream,
+        and the objects are yielded as soon as their elements end.
+
+        ```py
+        path = ["Body", "GetReportResponse", "row"]
+        for row in client.send_iter(params, path):
+            print(row)
+        ```
+
+        Args:
+            obj: The request model instance or a pure dictionary
+            path: The element qualified name or names path to yield,
+                relative to the response root element
+            headers: Additional headers to pass to the transport
+
+        Yields:
+            The parsed objects of the response elements that match the path.
+        """
+        data = self.prepare_payload(obj)
+        headers = self.prepare_headers(headers or {})
+        location = self.config.location
+        with self.transport.post_stream(location, data=data, headers=headers) as f:
+            yield from self.parser.iterparse(f, self.config.output, path)
+
+    def send_many(
+        self,
+        objs: Iterable[Any],
+        headers: Optional[Dict] = None,
+        concurrency: int = 4,
+    ) -> Iterator[Any]:
+        """Build and send the requests for the input objects concurrently.
+
+        The payloads are serialized on the calling thread, the requests
+        are sent and their responses are parsed by the worker threads.
+        The transport should be able to send concurrent requests,
+        e.g. a `DefaultTransport` with a pool size of the concurrency.
+
+        ```py
+        config = Config.from_service(CalculatorSoapAdd)
+        client = Client(config, transport=DefaultTransport(pool_size=8))
+        results = list(client.send_many(requests, concurrency=8))
+        ```
+
+        Args:
+            objs: The request model instances or pure dictionaries
+            headers: Additional headers to pass to the transport
+            concurrency: The maximum number of concurrent requests
+
+        Yields:
+            The response model instances in the order of the input objects.
+        """
+        headers = self.prepare_headers(headers or {})
+        pending: Deque[Future] = deque()
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            for obj in objs:
+                data = self.prepare_payload(obj)
+                pending.append(executor.submit(self.request, data, headers))
+
+                if len(pending) > concurrency:
+                    yield pending.popleft().result()
+
+            while pending:
+                yield pending.popleft().result()
+
+    def request(self, data: Union[str, bytes], headers: Dict) -> Any:
+        """Send a prepared payload and parse the response.
+
+        The response is parsed by a new copy of the parser, with the
+        same config and context, like the `NodeParser.parse_many` workers,
+        in order to avoid sharing the parser state between threads.
+
+        Args:
+            data: The serialized request body content
+            headers: The prepared request headers
+
+        Returns:
+            The response model instance.
+        """
+        response = self.transport.post(self.config.location, data=data, headers=headers)
+        parser = replace(self.parser)
+        return parser.from_bytes(response, self.config.output)
+
+
+class AsyncClient(BaseClient):
+    """An asyncio wsdl client.
+
+    The responses are parsed on the event loop, unless they are larger
+    than the offload size, in which case they are parsed in the executor
+    to keep the event loop responsive.
+
+    Use the client as an async context manager or call the aclose
+    method, to close the transport the client created.
+
+    Args:
+        config: The service config instance
+        transport: The async transport instance
+        parser: The xml parser instance
+        serializer: The xml serializer instance
+        executor: The executor to parse the large responses,
+            defaults to the event loop default executor
+        offload_size: The minimum response size in bytes to parse
+            in the executor, None to always parse on the event loop
+
+    Attributes:
+        owns_transport: Whether the client created the transport
+    """
+
+    __slots__ = "transport", "owns_transport", "executor", "offload_size"
+
+    def __init__(
+        self,
+        config: Config,
+        transport: Optional[AsyncTransport] = None,
+        parser: Optional[XmlParser] = None,
+        serializer: Optional[XmlSerializer] = None,
+        executor: Optional[Executor] = None,
+        offload_size: Optional[int] = 65536,
+    ):
+        super().__init__(config, parser=parser, serializer=serializer)
+        self.owns_transport = transport is None
+        self.transport = transport or default_async_transport()
+        self.executor = executor
+        self.offload_size = offload_size
+
+    async def aclose(self):
+        """Close the transport, if the client created it."""
+        if self.owns_transport:
+            await self.transport.aclose()
+
+    async def __aenter__(self: A) -> A:
+        """Enter the async context."""
+        return self
+
+    async def __aexit__(self, *args: Any):
+        """Exit the async context and close the client."""
+        await self.aclose()
+
+    async def send(self, obj: Any, headers: Optional[Dict] = None) -> Any:
+        """Build and send a request for the input object.
+
+        Args:
+            obj: The request model instance or a pure dictionary
+            headers: Additional headers to pass to the transport
+
+        Returns:
+            The response model instance.
+        """
+        data = self.prepare_payload(obj)
+        headers = self.prepare_headers(headers or {})
+        response = await self.transport.post(
+            self.config.location, data=data, headers=headers
+        )
+        return await self.parse_response(response)
+
+    async def parse_response(self, response: bytes) -> Any:
+        """Parse the response content to the config output type.
+
+        The executor parses with a new copy of the parser, with the
+        same config and context, in order to avoid sharing the parser
+        state between threads.
+
+        Args:
+            response: The response content
+
+        Returns:
+            The response model instance.
+        """
+        output = self.config.output
+        if self.offload_size is None or len(response) < self.offload_size:
+            return self.parser.from_bytes(response, output)
+
+        loop = asyncio.get_running_loop()
+        parser = replace(self.parser)
+        return await loop.run_in_executor(
+            self.executor, parser.from_bytes, response, output
+        )
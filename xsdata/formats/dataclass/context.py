@@ -1,14 +1,35 @@
+import hashlib
+import importlib.util
+import pickle
 import sys
 from collections import defaultdict
-from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Type
-
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
+
+from xsdata import __version__
 from xsdata.exceptions import XmlContextError
 from xsdata.formats.dataclass.compat import class_types
 from xsdata.formats.dataclass.models.builders import XmlMetaBuilder
 from xsdata.formats.dataclass.models.elements import XmlMeta
 from xsdata.formats.types import T
 from xsdata.models.enums import DataType
-from xsdata.utils.constants import return_input
+from xsdata.utils.constants import EMPTY_MAP, return_input
+
+if TYPE_CHECKING:
+    from xsdata.formats.dataclass.parsers.plans import BindingPlan
 
 
 class XmlContext:
@@ -22,11 +43,20 @@ class XmlContext:
         attribute_name_generator: Default attribute name generator
         class_type: Default class type `dataclasses`
         models_package: Restrict auto locate to a specific package
+        compile_plans: Compile and cache parser binding plans per class
 
     Attributes:
         cache: Internal cache for binding metadata instances
+        plans: Internal cache for compiled parser binding plans
         xsi_cache: Internal cache for xsi types to class locations
-        sys_modules: The number of loaded sys modules
+        xsi_modules: The names of the modules indexed in the xsi cache
+        xsi_classes: The binding models that have been inspected for the xsi cache
+        xsi_misses: The xsi:type qualified names that were not found since the
+            last time a class was added to the xsi cache
+        sys_modules: The number of loaded sys modules at the last index update
+        fields_index: Internal index of field local names to xsi cache classes
+        fields_count: Internal cache of the indexed classes number of fields
+        fields_pending: The xsi cache classes waiting to be indexed by fields
     """
 
     __slots__ = (
@@ -34,9 +64,17 @@ class XmlContext:
         "attribute_name_generator",
         "class_type",
         "models_package",
+        "compile_plans",
         "cache",
+        "plans",
         "xsi_cache",
+        "xsi_modules",
+        "xsi_classes",
+        "xsi_misses",
         "sys_modules",
+        "fields_index",
+        "fields_count",
+        "fields_pending",
     )
 
     def __init__(
@@ -45,21 +83,37 @@ class XmlContext:
         attribute_name_generator: Callable = return_input,
         class_type: str = "dataclasses",
         models_package: Optional[str] = None,
+        compile_plans: bool = False,
     ):
         self.element_name_generator = element_name_generator
         self.attribute_name_generator = attribute_name_generator
         self.class_type = class_types.get_type(class_type)
+        self.compile_plans = compile_plans
 
         self.cache: Dict[Type, XmlMeta] = {}
+        self.plans: Dict[Type, "BindingPlan"] = {}
         self.xsi_cache: Dict[str, List[Type]] = defaultdict(list)
+        self.xsi_modules: Set[str] = set()
+        self.xsi_classes: Set[Type] = set()
+        self.xsi_misses: Set[str] = set()
         self.models_package = models_package
         self.sys_modules = 0
+        self.fields_index: Dict[str, Dict[Type, None]] = defaultdict(dict)
+        self.fields_count: Dict[Type, int] = {}
+        self.fields_pending: List[Type] = []
 
     def reset(self):
         """Reset all internal caches."""
         self.cache.clear()
+        self.plans.clear()
         self.xsi_cache.clear()
+        self.xsi_modules.clear()
+        self.xsi_classes.clear()
+        self.xsi_misses.clear()
         self.sys_modules = 0
+        self.fields_index.clear()
+        self.fields_count.clear()
+        self.fields_pending.clear()
 
     def get_builder(
         self,
@@ -99,21 +153,83 @@ class XmlContext:
         return self.build(subclass, parent_ns) if subclass else meta
 
     def build_xsi_cache(self):
-        """Index all imported data classes by their xsi:type qualified name."""
+        """Index the classes of the new imported modules by their xsi:type.
+
+        Only the modules that have been imported since the last
+        run are scanned for their own classes.
+        """
         if len(sys.modules) == self.sys_modules:
             return
 
-        self.xsi_cache.clear()
         builder = self.get_builder()
-        for clazz in self.get_subclasses(object):
-            if self.is_binding_model(clazz):
-                meta = builder.build_class_meta(clazz)
+        for name, module in list(sys.modules.items()):
+            if name in self.xsi_modules:
+                continue
 
-                if meta.target_qname:
-                    self.xsi_cache[meta.target_qname].append(clazz)
+            self.xsi_modules.add(name)
+            namespace = getattr(module, "__dict__", None)
+            if not namespace or (
+                self.models_package and not name.startswith(self.models_package)
+            ):
+                continue
+
+            for clazz in self.get_module_classes(name, namespace):
+                self.add_xsi_type(builder, clazz)
 
         self.sys_modules = len(sys.modules)
 
+    def walk_xsi_cache(self):
+        """Add to the xsi:type index the classes not reachable from modules.
+
+        The walk over all the subclasses of object finds the classes
+        that were created dynamically. The module classes are indexed
+        first and never added twice, the new classes are appended in
+        the walk order, so the index order is always the same.
+        """
+        self.build_xsi_cache()
+
+        builder = self.get_builder()
+        for clazz in self.get_subclasses(object):
+            if clazz not in self.xsi_classes:
+                self.add_xsi_type(builder, clazz)
+
+    def add_xsi_type(self, builder: XmlMetaBuilder, clazz: Type):
+        """Index the binding model by its xsi:type qualified name.
+
+        Args:
+            builder: The xml meta builder instance
+            clazz: The class type to index
+        """
+        if self.is_binding_model(clazz):
+            self.xsi_classes.add(clazz)
+            meta = builder.build_class_meta(clazz)
+
+            if meta.target_qname:
+                self.xsi_cache[meta.target_qname].append(clazz)
+                self.fields_pending.append(clazz)
+                self.xsi_misses.clear()
+
+    def remove_xsi_type(self, clazz: Type):
+        """Remove the class from the xsi:type and the fields indexes.
+
+        The class is still marked as inspected, the subclasses walk
+        will not add it back.
+
+        Args:
+            clazz: The class type to remove
+        """
+        target_qname = self.get_builder().build_class_meta(clazz).target_qname
+        types = self.xsi_cache.get(target_qname) if target_qname else None
+        if types and clazz in types:
+            types.remove(clazz)
+
+        if clazz in self.fields_pending:
+            self.fields_pending.remove(clazz)
+
+        if self.fields_count.pop(clazz, None) is not None:
+            for posting in self.fields_index.values():
+                posting.pop(clazz, None)
+
     def is_binding_model(self, clazz: Type[T]) -> bool:
         """Return whether the clazz is a binding model.
 
@@ -139,7 +255,9 @@ class XmlContext:
         """Find all classes that match the given xsi:type qname.
 
         - Ignores native schema types, xs:string, xs:float, xs:int, ...
-        - Rebuild cache if new modules were imported since last run
+        - Index the new modules that were imported since last run
+        - Walk all subclasses if the qname is still unknown, only
+          once per qname until a new class is indexed
 
         Args:
             qname: A namespace qualified name
@@ -149,13 +267,21 @@ class XmlContext:
         """
         if not DataType.from_qname(qname):
             self.build_xsi_cache()
+            if qname not in self.xsi_cache and qname not in self.xsi_misses:
+                self.walk_xsi_cache()
+                if qname not in self.xsi_cache:
+                    self.xsi_misses.add(qname)
+
             if qname in self.xsi_cache:
                 return self.xsi_cache[qname]
 
         return []
 
     def find_type(self, qname: str) -> Optional[Type[T]]:
-        """Return the last imported class that matches the given xsi:type qname.
+        """Return the last indexed class that matches the given xsi:type qname.
+
+        The classes are indexed in the modules import order, followed
+        by the dynamic classes found by the subclasses walk.
 
         Args:
             qname: A namespace qualified name
@@ -177,22 +303,64 @@ class XmlContext:
             have all the fields. If more than one classes have all the given
             fields, return the one with the least extra fields.
         """
+        self.build_xsi_cache()
+        self.build_fields_index()
+        candidates = self.find_fields_candidates(field_names)
+        if not candidates:
+            # The dynamic classes are only reachable by the subclasses walk
+            self.walk_xsi_cache()
+            self.build_fields_index()
+            candidates = self.find_fields_candidates(field_names)
 
-        def get_field_diff(clazz: Type) -> int:
-            meta = self.cache[clazz]
-            local_names = {var.local_name for var in meta.get_all_vars()}
-            return len(local_names - field_names)
+        if not candidates:
+            return None
 
-        self.build_xsi_cache()
-        choices = [
-            (clazz, get_field_diff(clazz))
-            for types in self.xsi_cache.values()
-            for clazz in types
-            if self.local_names_match(field_names, clazz)
+        return min(candidates, key=lambda x: (self.fields_count[x], x.__name__))
+
+    def find_fields_candidates(self, field_names: Set[str]) -> List[Type]:
+        """Return the indexed classes that have all the given field names.
+
+        Args:
+            field_names: A set of field names
+
+        Returns:
+            The list of the matched classes.
+        """
+        if not field_names:
+            return list(self.fields_count)
+
+        postings = sorted(
+            (self.fields_index.get(name, EMPTY_MAP) for name in field_names),
+            key=len,
+        )
+        return [
+            clazz
+            for clazz in postings[0]
+            if all(clazz in posting for posting in postings[1:])
         ]
 
-        choices.sort(key=lambda x: (x[1], x[0].__name__))
-        return choices[0][0] if len(choices) > 0 else None
+    def build_fields_index(self):
+        """Index the pending xsi cache classes by their fields local names.
+
+        The classes with unsupported typing annotations are removed
+        from the xsi cache, like in the `local_names_match` method.
+        """
+        pending, self.fields_pending = self.fields_pending, []
+        for clazz in pending:
+            if clazz in self.fields_count:
+                continue
+
+            try:
+                meta = self.build(clazz)
+            except (XmlContextError, NameError, TypeError):
+                self.remove_xsi_type(clazz)
+                continue
+
+            local_names = meta.local_names
+            for name in local_names:
+                self.fields_index[name][clazz] = None
+
+            self.fields_count[clazz] = len(local_names)
 
     def find_subclass(self, clazz: Type, qname: str) -> Optional[Type]:
         """Find a subclass for the given clazz and xsi:type qname.
@@ -243,6 +411,163 @@ class XmlContext:
             self.cache[clazz] = builder.build(clazz, parent_ns)
         return self.cache[clazz]
 
+    def compile(self, meta: XmlMeta) -> "BindingPlan":
+        """Fetch or compile the parser binding plan for the given metadata.
+
+        Args:
+            meta: The class binding metadata instance
+
+        Returns:
+            The compiled binding plan instance.
+        """
+        from xsdata.formats.dataclass.parsers.plans import BindingPlan
+
+        plan = self.plans.get(meta.clazz)
+        if plan is None or plan.meta is not meta:
+            plan = BindingPlan(meta)
+            self.plans[meta.clazz] = plan
+
+        return plan
+
+    def save_cache(self, path: Union[str, Path]) -> int:
+        """Save a snapshot of the binding metadata cache to the given path.
+
+        The metadata instances are pickled per module, along with the
+        md5 digests of the source files of the modules they depend on.
+        Modules without source files or with metadata that can't be
+        pickled, e.g. local classes, are skipped. The metadata built
+        with a namespace inherited from a parent class are skipped as
+        well, they depend on the module of the parent class.
+
+        Args:
+            path: The snapshot file path
+
+        Returns:
+            The number of the saved metadata instances.
+        """
+        builder = self.get_builder()
+        groups: Dict[str, List[XmlMeta]] = defaultdict(list)
+        for clazz, meta in self.cache.items():
+            if builder.build_class_meta(clazz).namespace == meta.namespace:
+                groups[clazz.__module__].append(meta)
+
+        count = 0
+        modules = {}
+        for name, metas in groups.items():
+            digests = self.module_digests(name, metas)
+            if digests[name] is None:
+                continue
+
+            try:
+                data = pickle.dumps(metas)
+            except (pickle.PicklingError, AttributeError, TypeError):
+                continue
+
+            modules[name] = (digests, data)
+            count += len(metas)
+
+        snapshot = (__version__, self.cache_settings(), modules)
+        Path(path).write_bytes(pickle.dumps(snapshot))
+        return count
+
+    def load_cache(self, path: Union[str, Path]) -> int:
+        """Load a snapshot of the binding metadata cache from the given path.
+
+        The snapshot is ignored if it was saved by another xsdata
+        version or by a context with different settings. The modules
+        are skipped if any of their dependencies source files changed.
+
+        Only load snapshots you have saved yourself, unpickling
+        data from untrusted sources is not safe!
+
+        Args:
+            path: The snapshot file path
+
+        Returns:
+            The number of the loaded metadata instances.
+        """
+        try:
+            version, settings, modules = pickle.loads(Path(path).read_bytes())  # nosec
+        except (OSError, EOFError, ValueError, TypeError, pickle.UnpicklingError):
+            return 0
+
+        if version != __version__ or settings != self.cache_settings():
+            return 0
+
+        count = 0
+        for name, (digests, data) in modules.items():
+            if any(self.module_digest(dep) != dg for dep, dg in digests.items()):
+                continue
+
+            try:
+                metas = pickle.loads(data)  # nosec
+            except (AttributeError, ImportError, pickle.UnpicklingError):
+                continue
+
+            for meta in metas:
+                if meta.clazz not in self.cache:
+                    self.cache[meta.clazz] = meta
+                    count += 1
+
+        return count
+
+    def cache_settings(self) -> Tuple[str, ...]:
+        """Return the context settings that affect the binding metadata."""
+
+        def qualname(obj: Any) -> str:
+            return f"{obj.__module__}.{obj.__qualname__}"
+
+        return (
+            qualname(type(self.class_type)),
+            qualname(self.element_name_generator),
+            qualname(self.attribute_name_generator),
+        )
+
+    @classmethod
+    def module_digests(
+        cls, name: str, metas: List[XmlMeta]
+    ) -> Dict[str, Optional[str]]:
+        """Return the source digests of the module and its metadata dependencies.
+
+        The dependencies include the modules of all the base classes,
+        inherited fields are part of the metadata.
+
+        Args:
+            name: The module name
+            metas: The module metadata instances
+
+        Returns:
+            A module name-digest map.
+        """
+        names = {name}
+        for meta in metas:
+            names.update(tp.__module__ for tp in meta.clazz.__mro__)
+
+        return {dep: cls.module_digest(dep) for dep in sorted(names)}
+
+    @classmethod
+    def module_digest(cls, name: str) -> Optional[str]:
+        """Return the md5 digest of the module source file.
+
+        Args:
+            name: The module name
+
+        Returns:
+            The hex digest or None if the module has no source file.
+        """
+        try:
+            spec = importlib.util.find_spec(name)
+        except (ImportError, ValueError):
+            return None
+
+        if spec is None or not spec.has_location or not spec.origin:
+            return None
+
+        try:
+            return hashlib.md5(Path(spec.origin).read_bytes()).hexdigest()  # nosec
+        except OSError:
+            return None
+
     def build_recursive(self, clazz: Type, parent_ns: Optional[str] = None):
         """Build the binding metadata for the given class and all of its dependencies.
 
@@ -254,7 +579,7 @@ class XmlContext:
         """
         if clazz not in self.cache:
             meta = self.build(clazz, parent_ns)
-            for var in meta.get_all_vars():
+            for var in meta.all_vars:
                 types = var.element_types if var.elements else var.types
                 for tp in types:
                     if self.class_type.is_model(tp):
@@ -275,16 +600,12 @@ class XmlContext:
         """
         try:
             meta = self.build(clazz)
-            local_names = {var.local_name for var in meta.get_all_vars()}
+            local_names = meta.local_names
             return not names.difference(local_names)
         except (XmlContextError, NameError, TypeError):
             # The dataclass includes unsupported typing annotations
-            # Let's remove it from xsi_cache
-            builder = self.get_builder()
-            target_qname = builder.build_class_meta(clazz).target_qname
-            if target_qname and target_qname in self.xsi_cache:
-                self.xsi_cache[target_qname].remove(clazz)
-
+            # Let's remove it from the xsi cache and the fields index
+            self.remove_xsi_type(clazz)
             return False
 
     @classmethod
@@ -298,6 +619,30 @@ class XmlContext:
 
         return any(x is not object and isinstance(obj, x) for x in clazz.__bases__)
 
+    @classmethod
+    def get_module_classes(
+        cls, module: str, namespace: Mapping[str, Any]
+    ) -> Iterator[Type]:
+        """Return an iterator of the classes defined in the given module.
+
+        Imported classes and aliases are skipped, and so are the inner
+        classes, they never have a xsi:type qualified name.
+
+        Args:
+            module: The module name
+            namespace: The module dictionary
+
+        Yields:
+            An iterator of class types.
+        """
+        for key, value in list(namespace.items()):
+            if (
+                isinstance(value, type)
+                and value.__module__ == module
+                and value.__qualname__ == key
+            ):
+                yield value
+
     @classmethod
     def get_subclasses(cls, clazz: Type) -> Iterator[Type]:
         """Return an iterator of the given class subclasses."""
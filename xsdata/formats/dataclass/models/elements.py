@@ -1,6 +1,7 @@
 import itertools
 import operator
 import sys
+from types import MappingProxyType
 from typing import (
     Any,
     Callable,
@@ -15,7 +16,7 @@ from typing import (
     Type,
 )
 
-from xsdata.formats.converter import converter
+from xsdata.formats.converter import ResolvedConverters, converter
 from xsdata.models.enums import NamespaceType
 from xsdata.utils import collections
 from xsdata.utils.namespaces import local_name, target_uri
@@ -93,6 +94,9 @@ class XmlVar(MetaMixin):
         is_wildcard: Indicates if the field represents a wildcard
         is_attribute: Indicates if the field represents an XML attribute
         is_attributes: Indicates if the field represents a sequence of XML attributes
+        element_types: The unique types of the compound field elements
+        converters: The resolved converters of the field types
+        converters_version: The converters registry version at resolution
     """
 
     __slots__ = (
@@ -129,6 +133,9 @@ class XmlVar(MetaMixin):
         "is_clazz_union",
         "local_name",
         "wrapper_local_name",
+        "element_types",
+        "converters",
+        "converters_version",
     )
 
     def __init__(
@@ -189,6 +196,13 @@ class XmlVar(MetaMixin):
         if wrapper:
             self.wrapper_local_name = local_name(wrapper)
 
+        self.element_types = frozenset(
+            tp for element in elements.values() for tp in element.types
+        )
+
+        self.converters = converter.resolve_converters(types)
+        self.converters_version = converter.version
+
         self.is_text = False
         self.is_element = False
         self.is_elements = False
@@ -209,10 +223,34 @@ class XmlVar(MetaMixin):
         else:
             self.is_text = True
 
-    @property
-    def element_types(self) -> Set[Type]:
-        """Return the unique element types."""
-        return {tp for element in self.elements.values() for tp in element.types}
+    def __getstate__(self) -> Dict[str, Any]:
+        """Return the pickle state without the resolved converters."""
+        state = {name: getattr(self, name) for name in self.__slots__}
+        del state["converters"], state["converters_version"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]):
+        """Restore the pickle state and resolve the converters again."""
+        for name, value in state.items():
+            setattr(self, name, value)
+
+        self.converters = converter.resolve_converters(self.types)
+        self.converters_version = converter.version
+
+    def get_converters(self) -> ResolvedConverters:
+        """Return the resolved converters of the field types.
+
+        The converters are resolved again only if the registry
+        has changed since the last resolution.
+
+        Returns:
+            A tuple of data type and converter instance pairs.
+        """
+        if self.converters_version != converter.version:
+            self.converters = converter.resolve_converters(self.types)
+            self.converters_version = converter.version
+
+        return self.converters
 
     def find_choice(self, qname: str) -> Optional["XmlVar"]:
         """Match and return a choice field by its qualified name.
@@ -391,6 +429,20 @@ class XmlMeta(MetaMixin):
     Attributes:
         namespace: The target namespace extracted from the qualified name
         mixed_content: Specifies if the class supports mixed content
+        element_vars: The sorted element variables
+        attribute_vars: The sorted attribute variables
+        all_vars: The sorted element and attribute variables
+        element_groups: The sorted element variables, grouped by
+            sequence, the variables without sequence are single groups
+        key_vars: A mapping of the local and wrapper names to the
+            matching scalar and list variables, for the dict binding
+        local_names: The unique local names of all the variables
+        element_types: The unique types of all the element variables
+        child_matches: A qualified name to matching child variables
+            table, filled as the declared element names are looked up
+
+    The variables containers are frozen, the calculated attributes
+    are derived once from them.
     """
 
     __slots__ = (
@@ -408,6 +460,14 @@ class XmlMeta(MetaMixin):
         # Calculated
         "namespace",
         "mixed_content",
+        "element_vars",
+        "attribute_vars",
+        "all_vars",
+        "element_groups",
+        "key_vars",
+        "local_names",
+        "element_types",
+        "child_matches",
     )
 
     def __init__(
@@ -431,54 +491,63 @@ class XmlMeta(MetaMixin):
         self.target_qname = target_qname
         self.nillable = nillable
         self.text = text
-        self.choices = choices
-        self.elements = elements
-        self.wildcards = wildcards
-        self.attributes = attributes
-        self.any_attributes = any_attributes
+        self.choices = tuple(choices)
+        self.elements: Mapping[str, Sequence[XmlVar]] = MappingProxyType(
+            {key: tuple(value) for key, value in elements.items()}
+        )
+        self.wildcards = tuple(wildcards)
+        self.attributes: Mapping[str, XmlVar] = MappingProxyType(dict(attributes))
+        self.any_attributes = tuple(any_attributes)
         self.mixed_content = any(wildcard.mixed for wildcard in self.wildcards)
-        self.wrappers = wrappers
+        self.wrappers: Mapping[str, str] = MappingProxyType(dict(wrappers))
+
+        element_vars = list(itertools.chain(wildcards, choices, *elements.values()))
+        if text:
+            element_vars.append(text)
+
+        attribute_vars = list(itertools.chain(any_attributes, attributes.values()))
+        self.element_vars = tuple(sorted(element_vars, key=get_index))
+        self.attribute_vars = tuple(sorted(attribute_vars, key=get_index))
+        self.all_vars = tuple(sorted(element_vars + attribute_vars, key=get_index))
+        self.element_groups = group_sequences(self.element_vars)
+        self.key_vars = index_keys(self.all_vars)
+        self.local_names = frozenset(var.local_name for var in self.all_vars)
+        self.element_types = frozenset(
+            tp for elements in elements.values() for var in elements for tp in var.types
+        )
+        self.child_matches: Dict[str, Tuple[XmlVar, ...]] = {}
 
-    @property
-    def element_types(self) -> Set[Type]:
-        """Return a unique list of all elements types."""
+    def __getstate__(self) -> Dict[str, Any]:
+        """Return the constructor arguments as the pickle state."""
         return {
-            tp
-            for elements in self.elements.values()
-            for element in elements
-            for tp in element.types
+            "clazz": self.clazz,
+            "qname": self.qname,
+            "target_qname": self.target_qname,
+            "nillable": self.nillable,
+            "text": self.text,
+            "choices": self.choices,
+            "elements": dict(self.elements),
+            "wildcards": self.wildcards,
+            "attributes": dict(self.attributes),
+            "any_attributes": self.any_attributes,
+            "wrappers": dict(self.wrappers),
         }
 
+    def __setstate__(self, state: Dict[str, Any]):
+        """Build the meta again from the pickled constructor arguments."""
+        XmlMeta.__init__(self, **state)
+
     def get_element_vars(self) -> List[XmlVar]:
         """Return a sorted list of the class element variables."""
-        result = list(
-            itertools.chain(self.wildcards, self.choices, *self.elements.values())
-        )
-        if self.text:
-            result.append(self.text)
-
-        return sorted(result, key=get_index)
+        return list(self.element_vars)
 
     def get_attribute_vars(self) -> List[XmlVar]:
         """Return a sorted list of the class attribute variables."""
-        result = itertools.chain(self.any_attributes, self.attributes.values())
-        return sorted(result, key=get_index)
+        return list(self.attribute_vars)
 
     def get_all_vars(self) -> List[XmlVar]:
         """Return a sorted list of all the class variables."""
-        result = list(
-            itertools.chain(
-                self.wildcards,
-                self.choices,
-                self.any_attributes,
-                self.attributes.values(),
-                *self.elements.values(),
-            )
-        )
-        if self.text:
-            result.append(self.text)
-
-        return sorted(result, key=get_index)
+        return list(self.all_vars)
 
     def find_attribute(self, qname: str) -> Optional[XmlVar]:
         """Find an attribute var with the given qname.
@@ -531,6 +600,22 @@ class XmlMeta(MetaMixin):
         """
         return self.wildcards[0] if self.wildcards else None
 
+    def find_key_vars(self, key: str, array: bool) -> Tuple[XmlVar, ...]:
+        """Find the class vars that might match the given dict key.
+
+        Args:
+            key: The dict key, a local or wrapper name
+            array: Specifies whether the key value is an array
+
+        Returns:
+            A tuple of the candidate class vars, in the fields order.
+        """
+        candidates = self.key_vars.get(key)
+        if candidates is None:
+            return ()
+
+        return candidates[array]
+
     def find_children(self, qname: str) -> Iterator[XmlVar]:
         """Find all class vars that match the given qname.
 
@@ -542,21 +627,44 @@ class XmlMeta(MetaMixin):
         Args:
             qname: The namespace qualified name
 
-        Yields:
+        Returns:
             An iterator of all the class vars that match the given qname.
         """
-        elements = self.elements.get(qname)
-        if elements:
-            yield from elements
+        return iter(self.match_children(qname))
+
+    def match_children(self, qname: str) -> Tuple[XmlVar, ...]:
+        """Match the class vars of the given qname.
+
+        Only the qualified names of declared elements or choices are
+        memoized, the wildcards accept an unbounded set of names.
+
+        Args:
+            qname: The namespace qualified name
+
+        Returns:
+            A tuple of all the class vars that match the given qname.
+        """
+        try:
+            return self.child_matches[qname]
+        except KeyError:
+            pass
 
+        result = list(self.elements.get(qname, ()))
         for choice in self.choices:
             match = choice.find_choice(qname)
             if match:
-                yield match
+                result.append(match)
 
+        declared = bool(result)
         chd = self.find_wildcard(qname)
         if chd:
-            yield chd
+            result.append(chd)
+
+        matches = tuple(result)
+        if declared:
+            self.child_matches[qname] = matches
+
+        return matches
 
 
 def find_by_namespace(vars: Sequence[XmlVar], qname: str) -> Optional[XmlVar]:
@@ -574,3 +682,65 @@ def find_by_namespace(vars: Sequence[XmlVar], qname: str) -> Optional[XmlVar]:
             return xml_var
 
     return None
+
+
+def group_sequences(xml_vars: Sequence[XmlVar]) -> Tuple[Tuple[XmlVar, ...], ...]:
+    """Group the sorted element vars by their sequence number.
+
+    A sequence group spans from the first to the last var with
+    the same sequence number. The vars without a sequence number,
+    outside of any sequence group, are single groups.
+
+    Args:
+        xml_vars: The sorted list of element vars
+
+    Returns:
+        A tuple of var groups.
+    """
+    groups = []
+    index = 0
+    stop = len(xml_vars)
+    while index < stop:
+        var = xml_vars[index]
+        end = index
+        if var.sequence is not None:
+            end = max(
+                i for i in range(index, stop) if xml_vars[i].sequence == var.sequence
+            )
+
+        groups.append(tuple(xml_vars[index : end + 1]))
+        index = end + 1
+
+    return tuple(groups)
+
+
+def index_keys(
+    xml_vars: Sequence[XmlVar],
+) -> Dict[str, Tuple[Tuple[XmlVar, ...], Tuple[XmlVar, ...]]]:
+    """Index the sorted vars by their local and wrapper names.
+
+    The vars are split by their value type, scalar or list. The
+    wrapper names values are always dictionaries with the actual
+    values, the wrapped vars are listed as scalars.
+
+    Args:
+        xml_vars: The sorted list of vars
+
+    Returns:
+        A mapping of the names to the scalar and list var tuples.
+    """
+    index: Dict[str, Tuple[List[XmlVar], List[XmlVar]]] = {}
+    for var in xml_vars:
+        scalars, arrays = index.setdefault(var.local_name, ([], []))
+        if var.list_element or var.tokens:
+            arrays.append(var)
+        else:
+            scalars.append(var)
+
+        if var.wrapper_local_name and var.wrapper_local_name != var.local_name:
+            scalars, _ = index.setdefault(var.wrapper_local_name, ([], []))
+            scalars.append(var)
+
+    return {
+        key: (tuple(scalars), tuple(arrays)) for key, (scalars, arrays) in index.items()
+    }
@@ -1,7 +1,23 @@
 import copy
+import functools
+import pathlib
 import warnings
-from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Tuple, Type, cast
+from concurrent import futures
+from dataclasses import dataclass, field, replace
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
 
 from xsdata.exceptions import ConverterWarning, ParserError
 from xsdata.formats.dataclass.context import XmlContext
@@ -14,6 +30,7 @@ from xsdata.formats.dataclass.parsers.mixins import (
 from xsdata.formats.dataclass.parsers.utils import ParserUtils
 from xsdata.formats.types import T
 from xsdata.models.enums import EventType
+from xsdata.utils.namespaces import local_name
 
 Parsed = Tuple[Optional[str], Any]
 
@@ -70,6 +87,185 @@ class NodeParser(PushParser):
         target_class = clazz.__name__ if clazz else ""
         raise ParserError(f"Failed to create target class `{target_class}`")
 
+    def iterparse(
+        self,
+        source: Any,
+        clazz: Type,
+        path: Union[str, Sequence[str]],
+        ns_map: Optional[Dict[Optional[str], str]] = None,
+    ) -> Iterator[Any]:
+        """Parse the input file or stream and yield the objects of the given path.
+
+        The objects are yielded as soon as their elements end, and
+        they are never bound to their ancestors, which makes this
+        method suitable for huge documents with repeating elements.
+
+        The path is relative to the root element, unqualified path
+        names match any element with the same local name.
+
+        The warnings filter of the converter warnings config is set once
+        for the whole iteration, it also applies to the consumer code
+        between the yielded objects.
+
+        Args:
+            source: The source file or stream object to parse
+            clazz: The root target class type
+            path: The element qualified name or names path to yield
+            ns_map: A namespace prefix-URI map to record prefixes during parsing
+
+        Yields:
+            The parsed objects of the elements that match the path.
+        """
+        from xsdata.formats.dataclass.parsers.nodes import StreamNode
+
+        names = (path,) if isinstance(path, str) else tuple(path)
+        if not names:
+            raise ParserError("Empty iterparse path")
+
+        depth = len(names)
+        handler = self.handler(clazz=clazz, parser=self)
+        queue = handler.queue
+        objects = handler.objects
+        events = handler.iterparse(source, self.ns_map if ns_map is None else ns_map)
+
+        with warnings.catch_warnings():
+            if self.config.fail_on_converter_warnings:
+                warnings.filterwarnings("error", category=ConverterWarning)
+
+            # Whether each open element is the root, an ancestor or a match
+            stack: List[bool] = []
+            position = 0
+            while True:
+                try:
+                    event, qname = next(events)
+                except StopIteration:
+                    return
+                except (ConverterWarning, SyntaxError) as e:
+                    raise ParserError(e)
+
+                if event == EventType.START:
+                    level = len(stack)
+                    on_path = level == 0 or (
+                        stack[-1]
+                        and level <= depth
+                        and self.match_path_name(names[level - 1], qname)
+                    )
+                    stack.append(on_path)
+
+                    if not on_path:
+                        continue
+
+                    if level < depth:
+                        queue[-1] = StreamNode(queue[-1], len(objects))
+                    else:
+                        position = len(objects)
+                elif stack.pop() and len(stack) == depth:
+                    if len(objects) > position:
+                        obj = objects[position][1]
+                        del objects[position:]
+                        yield obj
+
+    def parse_many(
+        self,
+        sources: Iterable[Any],
+        clazz: Optional[Type[T]] = None,
+        workers: Optional[int] = None,
+        executor: str = "thread",
+        ordered: bool = True,
+    ) -> Iterator[T]:
+        """Parse independent documents concurrently into the target class type.
+
+        The binding metadata of the target class are built once, before
+        the workers start. Every document is parsed by a new parser with
+        the same config, context and handler, exactly like the parse method.
+
+        The thread workers share the context, they only read the warm
+        metadata, and the lazy lookups, e.g. of unknown xsi types, fill
+        the context dicts and sets with single atomic operations, so a
+        race builds the same entry twice at worst. The handler must not
+        keep any parsing state between documents. The process workers
+        receive a copy of the parser through the pool initializer, and
+        the results are pickled back.
+
+        Args:
+            sources: The file paths, urls, bytes or stream objects to parse
+            clazz: The target class type to parse the sources into
+            workers: The maximum number of workers, defaults to the
+                executor default
+            executor: The executor type (thread|process)
+            ordered: Yield the results in the sources order, otherwise
+                as soon as they complete
+
+        Returns:
+            An iterator of the specified class instances, one for every source.
+
+        Raises:
+            ParserError: If the executor type is unknown.
+        """
+        if executor not in ("thread", "process"):
+            raise ParserError(f"Unknown executor `{executor}`")
+
+        self.warm_up(clazz)
+
+        def results() -> Iterator[T]:
+            pool: futures.Executor
+            func: Callable[[Any], T]
+            if executor == "thread":
+                pool = futures.ThreadPoolExecutor(workers)
+                func = functools.partial(parse_source, self, clazz)
+            else:
+                pool = futures.ProcessPoolExecutor(
+                    workers, initializer=init_worker, initargs=(self,)
+                )
+                func = functools.partial(parse_worker_source, clazz)
+
+            with pool:
+                if ordered:
+                    yield from pool.map(func, sources)
+                else:
+                    pending: List[futures.Future] = [
+                        pool.submit(func, source) for source in sources
+                    ]
+                    for future in futures.as_completed(pending):
+                        yield future.result()
+
+        return results()
+
+    def warm_up(self, clazz: Optional[Type]):
+        """Build the binding metadata needed to parse the given class type.
+
+        If no clazz is provided, build the xsi types index instead, which
+        is used to locate the target class from the root element.
+
+        Args:
+            clazz: The target class type
+        """
+        context = self.context
+        if clazz is None:
+            context.build_xsi_cache()
+            return
+
+        context.build_recursive(clazz)
+        if context.compile_plans:
+            for meta in list(context.cache.values()):
+                context.compile(meta)
+
+    @classmethod
+    def match_path_name(cls, name: str, qname: str) -> bool:
+        """Match an iterparse path name to an element qualified name.
+
+        Args:
+            name: The path name, qualified or just the local name
+            qname: The element qualified name
+
+        Returns:
+            The bool result.
+        """
+        if name == qname:
+            return True
+
+        return name[0] != "{" and local_name(qname) == name
+
     def start(
         self,
         clazz: Optional[Type],
@@ -231,3 +427,60 @@ class RecordParser(NodeParser):
         """
         self.events.append((EventType.START_NS, prefix, uri))
         super().register_namespace(ns_map, prefix, uri)
+
+
+# The parser of the current process worker, every process has its own
+worker_parser: Optional[NodeParser] = None
+
+
+def init_worker(parser: NodeParser):
+    """Set the parser instance of the current process worker.
+
+    It's the process pool initializer, it runs once in every worker
+    process before any task.
+
+    Args:
+        parser: The parser instance with the warm context
+    """
+    global worker_parser
+    worker_parser = parser
+
+
+def parse_worker_source(clazz: Optional[Type[T]], source: Any) -> T:
+    """Parse the source with the parser of the current process worker.
+
+    Args:
+        clazz: The target class type
+        source: The file path, url, bytes or stream object to parse
+
+    Returns:
+        An instance of the specified class representing the parsed content.
+
+    Raises:
+        ParserError: If the process worker has no parser.
+    """
+    if worker_parser is None:
+        raise ParserError("The process worker was not initialized with a parser")
+
+    return parse_source(worker_parser, clazz, source)
+
+
+def parse_source(parser: NodeParser, clazz: Optional[Type[T]], source: Any) -> T:
+    """Parse the source with a new copy of the given parser.
+
+    Args:
+        parser: The parser instance to copy
+        clazz: The target class type
+        source: The file path, url, bytes or stream object to parse
+
+    Returns:
+        An instance of the specified class representing the parsed content.
+    """
+    parser = replace(parser)
+    if isinstance(source, pathlib.Path):
+        return parser.from_path(source, clazz)
+
+    if isinstance(source, bytes):
+        return parser.from_bytes(source, clazz)
+
+    return parser.parse(source, clazz)
@@ -1,6 +1,7 @@
 from dataclasses import dataclass, field
 from typing import Any, Callable, Dict, Optional, Type
 
+from xsdata.formats.converter import ConverterCache
 from xsdata.formats.types import T
 
 
@@ -34,6 +35,8 @@ class ParserConfig:
         fail_on_unknown_properties: Skip unknown properties or fail with exception
         fail_on_unknown_attributes: Skip unknown XML attributes or fail with exception
         fail_on_converter_warnings: Turn converter warnings to exceptions
+        converter_cache: Memoize the conversions of repeated values to
+            immutable types, e.g. enums, numbers and dates
     """
 
     base_url: Optional[str] = None
@@ -45,3 +48,4 @@ class ParserConfig:
     fail_on_unknown_properties: bool = True
     fail_on_unknown_attributes: bool = False
     fail_on_converter_warnings: bool = False
+    converter_cache: Optional[ConverterCache] = None
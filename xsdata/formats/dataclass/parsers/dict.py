@@ -1,6 +1,6 @@
 import warnings
 from dataclasses import dataclass, field
-from typing import Any, Dict, Iterable, List, Optional, Type, Union
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Type, Union
 
 from xsdata.exceptions import ConverterWarning, ParserError
 from xsdata.formats.converter import converter
@@ -126,10 +126,10 @@ class DictDecoder:
             return self.bind_derived_dataclass(data, clazz)
 
         meta = self.context.build(clazz)
-        xml_vars = meta.get_all_vars()
 
         params = {}
         for key, value in data.items():
+            xml_vars = meta.find_key_vars(key, collections.is_array(value))
             var = self.find_var(xml_vars, key, value)
 
             if var is None and self.config.fail_on_unknown_properties:
@@ -325,6 +325,8 @@ class DictDecoder:
             ns_map=EMPTY_MAP,
             tokens_factory=var.tokens_factory,
             format=var.format,
+            cache=self.config.converter_cache,
+            converters=var.get_converters(),
         )
 
     def bind_complex_type(self, meta: XmlMeta, var: XmlVar, data: Dict) -> Any:
@@ -411,7 +413,7 @@ class DictDecoder:
     @classmethod
     def find_var(
         cls,
-        xml_vars: List[XmlVar],
+        xml_vars: Sequence[XmlVar],
         key: str,
         value: Any,
     ) -> Optional[XmlVar]:
@@ -1,4 +1,4 @@
-from typing import Any, Dict, Iterable, Optional, Tuple
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
 
 from lxml import etree
 
@@ -23,22 +23,61 @@ class LxmlEventHandler(XmlHandler):
         Returns:
             An instance of the class type representing the parsed content.
         """
+        return self.process_context(self.build_context(source), ns_map)
+
+    def iterparse(
+        self, source: Any, ns_map: Dict[Optional[str], str]
+    ) -> Iterator[Tuple[str, str]]:
+        """Parse the source XML document and yield the element events.
+
+        The cleared elements are also detached from the internal
+        tree, to keep the memory footprint flat for huge documents.
+
+        Args:
+            source: The xml source, can be a file resource or an input stream,
+                or a lxml tree/element.
+            ns_map: A namespace prefix-URI recorder map
+
+        Yields:
+            The event type and the element qualified name, after the
+            event has been pushed to the main parser.
+        """
+        context = self.build_context(source)
+        prune = isinstance(context, etree.iterparse)
+        for event, element in self.iterate_context(context, ns_map):
+            if prune and event == EventType.END:
+                parent = element.getparent()
+                if parent is not None:
+                    while element.getprevious() is not None:
+                        del parent[0]
+
+            yield event, element.tag
+
+    def build_context(self, source: Any) -> Iterable[Tuple[str, Any]]:
+        """Create the lxml events context for the source XML document.
+
+        Args:
+            source: The xml source, can be a file resource or an input stream,
+                or a lxml tree/element.
+
+        Returns:
+            An iterable of lxml events.
+        """
         if isinstance(source, (etree._ElementTree, etree._Element)):
-            ctx = etree.iterwalk(source, EVENTS)
-        elif self.parser.config.process_xinclude:
+            return etree.iterwalk(source, EVENTS)
+
+        if self.parser.config.process_xinclude:
             tree = etree.parse(source, base_url=self.parser.config.base_url)  # nosec
             tree.xinclude()
-            ctx = etree.iterwalk(tree, EVENTS)
-        else:
-            ctx = etree.iterparse(
-                source,
-                EVENTS,
-                recover=True,
-                remove_comments=True,
-                load_dtd=self.parser.config.load_dtd,
-            )
-
-        return self.process_context(ctx, ns_map)
+            return etree.iterwalk(tree, EVENTS)
+
+        return etree.iterparse(
+            source,
+            EVENTS,
+            recover=True,
+            remove_comments=True,
+            load_dtd=self.parser.config.load_dtd,
+        )
 
     def process_context(
         self,
@@ -54,6 +93,26 @@ class LxmlEventHandler(XmlHandler):
         Returns:
             An instance of the class type representing the parsed content.
         """
+        for _ in self.iterate_context(context, ns_map):
+            pass
+
+        return self.objects[-1][1] if self.objects else None
+
+    def iterate_context(
+        self,
+        context: Iterable[Tuple[str, Any]],
+        ns_map: Dict[Optional[str], str],
+    ) -> Iterator[Tuple[str, Any]]:
+        """Iterate context and push events to main parser.
+
+        Args:
+            context: The iterable lxml context
+            ns_map: A namespace prefix-URI recorder map
+
+        Yields:
+            The start and end events with their elements, after the
+            event has been pushed to the main parser.
+        """
         for event, element in context:
             if event == EventType.START:
                 self.parser.start(
@@ -64,6 +123,7 @@ class LxmlEventHandler(XmlHandler):
                     element.attrib,
                     element.nsmap,
                 )
+                yield event, element
             elif event == EventType.END:
                 self.parser.end(
                     self.queue,
@@ -73,10 +133,9 @@ class LxmlEventHandler(XmlHandler):
                     element.tail,
                 )
                 element.clear()
+                yield event, element
             elif event == EventType.START_NS:
                 prefix, uri = element
                 self.parser.register_namespace(ns_map, prefix or None, uri)
             else:
                 raise XmlHandlerError(f"Unhandled event: `{event}`.")
-
-        return self.objects[-1][1] if self.objects else None
@@ -1,5 +1,5 @@
 import functools
-from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 from urllib.parse import urljoin
 from xml.etree import ElementInclude as xinclude
 from xml.etree import ElementTree as etree
@@ -26,22 +26,65 @@ class XmlEventHandler(XmlHandler):
         Returns:
             An instance of the class type representing the parsed content.
         """
+        return self.process_context(self.build_context(source), ns_map)
+
+    def iterparse(
+        self, source: Any, ns_map: Dict[Optional[str], str]
+    ) -> Iterator[Tuple[str, str]]:
+        """Parse the source XML document and yield the element events.
+
+        The cleared elements are also detached from their parents,
+        to keep the memory footprint flat for huge documents. The
+        input trees/elements are left intact.
+
+        Args:
+            source: The xml source, can be a file resource or an input stream,
+                or a xml tree/element.
+            ns_map: A namespace prefix-URI recorder map
+
+        Yields:
+            The event type and the element qualified name, after the
+            event has been pushed to the main parser.
+        """
+        context = self.build_context(source)
+        prune = not isinstance(source, (etree.ElementTree, etree.Element))
+        parents: List[Any] = []
+        for event, element in self.iterate_context(context, ns_map):
+            if prune:
+                if event == EventType.START:
+                    parents.append(element)
+                else:
+                    parents.pop()
+                    if parents:
+                        parents[-1].remove(element)
+
+            yield event, element.tag
+
+    def build_context(self, source: Any) -> Iterable[Tuple[str, Any]]:
+        """Create the xml events context for the source XML document.
+
+        Args:
+            source: The xml source, can be a file resource or an input stream,
+                or a xml tree/element.
+
+        Returns:
+            An iterable of xml events.
+        """
         if isinstance(source, etree.ElementTree):
             source = source.getroot()
 
         if isinstance(source, etree.Element):
-            ctx = iterwalk(source, {})
-        elif self.parser.config.process_xinclude:
+            return iterwalk(source, {})
+
+        if self.parser.config.process_xinclude:
             root = etree.parse(source).getroot()  # nosec
             base_url = get_base_url(self.parser.config.base_url, source)
             loader = functools.partial(xinclude_loader, base_url=base_url)
 
             xinclude.include(root, loader=loader)
-            ctx = iterwalk(root, {})
-        else:
-            ctx = etree.iterparse(source, EVENTS)  # nosec
+            return iterwalk(root, {})
 
-        return self.process_context(ctx, ns_map)
+        return etree.iterparse(source, EVENTS)  # nosec
 
     def process_context(
         self, context: Iterable[Tuple[str, Any]], ns_map: Dict[Optional[str], str]
@@ -55,6 +98,24 @@ class XmlEventHandler(XmlHandler):
         Returns:
             An instance of the class type representing the parsed content.
         """
+        for _ in self.iterate_context(context, ns_map):
+            pass
+
+        return self.objects[-1][1] if self.objects else None
+
+    def iterate_context(
+        self, context: Iterable[Tuple[str, Any]], ns_map: Dict[Optional[str], str]
+    ) -> Iterator[Tuple[str, Any]]:
+        """Iterate context and push events to main parser.
+
+        Args:
+            context: The iterable xml context
+            ns_map: A namespace prefix-URI recorder map
+
+        Yields:
+            The start and end events with their elements, after the
+            event has been pushed to the main parser.
+        """
         element_ns_map: Dict = {}
         for event, element in context:
             if event == EventType.START:
@@ -67,6 +128,7 @@ class XmlEventHandler(XmlHandler):
                     self.merge_parent_namespaces(element_ns_map),
                 )
                 element_ns_map = {}
+                yield event, element
             elif event == EventType.END:
                 self.parser.end(
                     self.queue,
@@ -76,6 +138,7 @@ class XmlEventHandler(XmlHandler):
                     element.tail,
                 )
                 element.clear()
+                yield event, element
             elif event == EventType.START_NS:
                 prefix, uri = element
                 prefix = prefix or None
@@ -85,8 +148,6 @@ class XmlEventHandler(XmlHandler):
             else:
                 raise XmlHandlerError(f"Unhandled event: `{event}`.")
 
-        return self.objects[-1][1] if self.objects else None
-
     def merge_parent_namespaces(self, ns_map: Dict[Optional[str], str]) -> Dict:
         """Merge the given prefix-URI map with the parent node map.
 
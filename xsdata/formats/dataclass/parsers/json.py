@@ -4,6 +4,7 @@ import pathlib
 from dataclasses import dataclass, field
 from typing import Any, Callable, Dict, List, Optional, Type, Union
 
+from xsdata.formats.dataclass.backends import JsonBackend
 from xsdata.formats.dataclass.parsers import DictDecoder
 from xsdata.formats.types import T
 
@@ -16,9 +17,12 @@ class JsonParser(DictDecoder):
         config: Parser configuration
         context: The models context instance
         load_factory: Json loader factory
+        backend: Json library backend, it overrides the loader
+            factory and loads bytes and strings without a stream
     """
 
     load_factory: Callable = field(default=json.load)
+    backend: Optional[JsonBackend] = None
 
     def from_path(self, path: pathlib.Path, clazz: Optional[Type[T]] = None) -> T:
         """Parse the input file into the target class type.
@@ -48,6 +52,9 @@ class JsonParser(DictDecoder):
         Returns:
             An instance of the specified class representing the parsed content.
         """
+        if self.backend:
+            return self.decode(self.backend.loads(source), clazz)
+
         return self.from_bytes(source.encode(), clazz)
 
     def from_bytes(self, source: bytes, clazz: Optional[Type[T]] = None) -> T:
@@ -63,6 +70,9 @@ class JsonParser(DictDecoder):
         Returns:
             An instance of the specified class representing the parsed content.
         """
+        if self.backend:
+            return self.decode(self.backend.loads(source), clazz)
+
         return self.parse(io.BytesIO(source), clazz)
 
     def parse(self, source: Any, clazz: Optional[Type[T]] = None) -> T:
@@ -92,6 +102,20 @@ class JsonParser(DictDecoder):
         """
         if not hasattr(source, "read"):
             with open(source, "rb") as fp:
-                return self.load_factory(fp)
+                return self.load_stream(fp)
+
+        return self.load_stream(source)
+
+    def load_stream(self, fp: Any) -> Union[Dict, List]:
+        """Load the given json stream with the backend or the load factory.
+
+        Args:
+            fp: The input file stream
+
+        Returns:
+            The loaded dictionary or list of dictionaries.
+        """
+        if self.backend:
+            return self.backend.load(fp)
 
-        return self.load_factory(source)
+        return self.load_factory(fp)
@@ -2,7 +2,7 @@ import abc
 import io
 import pathlib
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Tuple, Type
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Type
 
 from xsdata.exceptions import XmlHandlerError
 from xsdata.formats.dataclass.parsers.config import ParserConfig
@@ -249,6 +249,21 @@ class XmlHandler:
         """
         raise NotImplementedError("This method must be implemented!")
 
+    def iterparse(
+        self, source: Any, ns_map: Dict[Optional[str], str]
+    ) -> Iterator[Tuple[str, str]]:
+        """Parse the source XML document and yield the element events.
+
+        Args:
+            source: The xml source, can be a file resource or an input stream.
+            ns_map: A dictionary to capture namespace prefixes.
+
+        Yields:
+            The event type and the element qualified name, after the
+            event has been pushed to the main parser.
+        """
+        raise NotImplementedError("This method must be implemented!")
+
 
 class EventsHandler(XmlHandler):
     """Sax content handler for pre-recorded events."""
@@ -2,6 +2,7 @@ from xsdata.formats.dataclass.parsers.nodes.element import ElementNode
 from xsdata.formats.dataclass.parsers.nodes.primitive import PrimitiveNode
 from xsdata.formats.dataclass.parsers.nodes.skip import SkipNode
 from xsdata.formats.dataclass.parsers.nodes.standard import StandardNode
+from xsdata.formats.dataclass.parsers.nodes.stream import StreamNode
 from xsdata.formats.dataclass.parsers.nodes.union import UnionNode
 from xsdata.formats.dataclass.parsers.nodes.wildcard import WildcardNode
 from xsdata.formats.dataclass.parsers.nodes.wrapper import WrapperNode
@@ -11,6 +12,7 @@ __all__ = [
     "PrimitiveNode",
     "SkipNode",
     "StandardNode",
+    "StreamNode",
     "UnionNode",
     "WildcardNode",
     "WrapperNode",
@@ -30,6 +30,7 @@ class ElementNode(XmlNode):
         xsi_nil: Specifies whether element has the xsi:nil attribute
 
     Attributes:
+        plan: The compiled class binding plan, if the context compiles plans
         assigned: A set to store the processed sub-nodes
         tail_processed: Whether the tail process is consumed
     """
@@ -45,6 +46,7 @@ class ElementNode(XmlNode):
         "derived_factory",
         "xsi_type",
         "xsi_nil",
+        "plan",
         "assigned",
         "tail_processed",
     )
@@ -72,6 +74,7 @@ class ElementNode(XmlNode):
         self.derived_factory = derived_factory
         self.xsi_type = xsi_type
         self.xsi_nil = xsi_nil
+        self.plan = context.compile(meta) if context.compile_plans else None
         self.assigned: Set[int] = set()
         self.tail_processed: bool = False
 
@@ -164,12 +167,13 @@ class ElementNode(XmlNode):
         if not self.attrs:
             return
 
+        lookup = self.plan or self.meta
         for qname, value in self.attrs.items():
-            var = self.meta.find_attribute(qname)
+            var = lookup.find_attribute(qname)
             if var and var.name not in params:
                 self.bind_attr(params, var, value)
             else:
-                var = self.meta.find_any_attributes(qname)
+                var = lookup.find_any_attributes(qname)
                 if var:
                     self.bind_any_attr(params, var, qname, value)
                 else:
@@ -192,14 +196,7 @@ class ElementNode(XmlNode):
             value: The attribute value
         """
         if var.init:
-            params[var.name] = ParserUtils.parse_value(
-                value=value,
-                types=var.types,
-                default=var.default,
-                ns_map=self.ns_map,
-                tokens_factory=var.tokens_factory,
-                format=var.format,
-            )
+            params[var.name] = self.parse_value(var, value)
 
     def bind_any_attr(self, params: Dict, var: XmlVar, qname: str, value: Any):
         """Parse an element attribute to a wildcard field.
@@ -244,7 +241,8 @@ class ElementNode(XmlNode):
             Whether the parsed object can fit in one of class
             parameters or not.
         """
-        for var in self.meta.find_children(qname):
+        lookup = self.plan or self.meta
+        for var in lookup.find_children(qname):
             if var.is_wildcard:
                 return self.bind_wild_var(params, var, qname, value)
 
@@ -368,16 +366,34 @@ class ElementNode(XmlNode):
             if self.xsi_nil and not text:
                 params[var.name] = None
             else:
-                params[var.name] = ParserUtils.parse_value(
-                    value=text,
-                    types=var.types,
-                    default=var.default,
-                    ns_map=self.ns_map,
-                    tokens_factory=var.tokens_factory,
-                    format=var.format,
-                )
+                params[var.name] = self.parse_value(var, text)
         return True
 
+    def parse_value(self, var: XmlVar, value: Any) -> Any:
+        """Convert an attribute or text value according to the given var.
+
+        Args:
+            var: The xml var instance
+            value: The attribute or text value
+
+        Returns:
+            The converted value.
+        """
+        cache = self.config.converter_cache
+        if self.plan:
+            return self.plan.parse_value(var, value, self.ns_map, cache)
+
+        return ParserUtils.parse_value(
+            value=value,
+            types=var.types,
+            default=var.default,
+            ns_map=self.ns_map,
+            tokens_factory=var.tokens_factory,
+            format=var.format,
+            cache=cache,
+            converters=var.get_converters(),
+        )
+
     def bind_wild_text(
         self,
         params: Dict,
@@ -447,7 +463,8 @@ class ElementNode(XmlNode):
         Raises:
             ParserError: If the child element is unknown
         """
-        for var in self.meta.find_children(qname):
+        lookup = self.plan or self.meta
+        for var in lookup.find_children(qname):
             unique = 0 if not var.is_element or var.list_element else var.index
             if not unique or unique not in self.assigned:
                 node = self.build_node(qname, var, attrs, ns_map, position)
@@ -494,6 +511,11 @@ class ElementNode(XmlNode):
                 position=position,
             )
 
+        if not var.clazz and not var.any_type and not var.is_wildcard:
+            return nodes.PrimitiveNode(
+                var, ns_map, self.meta.mixed_content, self.config.converter_cache
+            )
+
         xsi_type = ParserUtils.xsi_type(attrs, ns_map)
         xsi_nil = ParserUtils.xsi_nil(attrs)
         derived_factory = self.context.class_type.derived_element
@@ -511,9 +533,6 @@ class ElementNode(XmlNode):
                 xsi_nil,
             )
 
-        if not var.any_type and not var.is_wildcard:
-            return nodes.PrimitiveNode(var, ns_map, self.meta.mixed_content)
-
         datatype = DataType.from_qname(xsi_type) if xsi_type else None
         derived = var.is_wildcard
         if datatype:
@@ -1,6 +1,7 @@
 from typing import Dict, List, Optional
 
 from xsdata.exceptions import XmlContextError
+from xsdata.formats.converter import ConverterCache
 from xsdata.formats.dataclass.models.elements import XmlVar
 from xsdata.formats.dataclass.parsers.mixins import XmlNode
 from xsdata.formats.dataclass.parsers.utils import ParserUtils
@@ -13,14 +14,22 @@ class PrimitiveNode(XmlNode):
         var: The xml var instance
         ns_map: The element namespace prefix-URI map
         mixed: Specifies if this node supports mixed content
+        cache: The optional converter cache instance
     """
 
-    __slots__ = "var", "ns_map"
+    __slots__ = "var", "ns_map", "cache"
 
-    def __init__(self, var: XmlVar, ns_map: Dict, mixed: bool):
+    def __init__(
+        self,
+        var: XmlVar,
+        ns_map: Dict,
+        mixed: bool,
+        cache: Optional[ConverterCache] = None,
+    ):
         self.var = var
         self.ns_map = ns_map
         self.mixed = mixed
+        self.cache = cache
 
     def bind(
         self,
@@ -51,6 +60,8 @@ class PrimitiveNode(XmlNode):
             ns_map=self.ns_map,
             tokens_factory=self.var.tokens_factory,
             format=self.var.format,
+            cache=self.cache,
+            converters=self.var.get_converters(),
         )
 
         if obj is None and not self.var.nillable:
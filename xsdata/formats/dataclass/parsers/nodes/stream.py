@@ -0,0 +1,58 @@
+from typing import Dict, List, Optional
+
+from xsdata.formats.dataclass.parsers.mixins import XmlNode
+
+
+class StreamNode(XmlNode):
+    """XmlNode for the ancestors of streamed elements.
+
+    The node proxies the child requests to the original
+    node, but it never binds the ancestor object. The
+    children objects are discarded instead, the streamed
+    objects have already been handed over to the caller.
+
+    Args:
+        node: The original ancestor node
+        position: The current length of the intermediate objects
+
+    Attributes:
+        ns_map: The node namespace prefix-URI map
+    """
+
+    __slots__ = "node", "position", "ns_map"
+
+    def __init__(self, node: XmlNode, position: int):
+        self.node = node
+        self.position = position
+        self.ns_map = getattr(node, "ns_map", {})
+
+    def child(self, qname: str, attrs: Dict, ns_map: Dict, position: int) -> XmlNode:
+        """Proxy the next child node to the original node.
+
+        Args:
+            qname: The element qualified name
+            attrs: The element attributes
+            ns_map: The element namespace prefix-URI map
+            position: The current length of the intermediate objects
+
+        Returns:
+            The child xml node instance.
+        """
+        return self.node.child(qname, attrs, ns_map, position)
+
+    def bind(
+        self, qname: str, text: Optional[str], tail: Optional[str], objects: List
+    ) -> bool:
+        """Discard the children objects of the ancestor element.
+
+        Args:
+            qname: The element qualified name
+            text: The element text content
+            tail: The element tail content
+            objects: The list of intermediate parsed objects
+
+        Returns:
+            Always false because no binding takes place.
+        """
+        del objects[self.position :]
+        return False
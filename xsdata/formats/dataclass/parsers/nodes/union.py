@@ -1,15 +1,15 @@
-import copy
 import warnings
 from typing import Any, Dict, List, Optional, Tuple, Type
 
 from xsdata.exceptions import ConverterWarning, ParserError
+from xsdata.formats.converter import UNCONVERTED, converter
 from xsdata.formats.dataclass.context import XmlContext
-from xsdata.formats.dataclass.models.elements import XmlVar
+from xsdata.formats.dataclass.models.elements import XmlMeta, XmlVar
 from xsdata.formats.dataclass.parsers.bases import NodeParser
 from xsdata.formats.dataclass.parsers.config import ParserConfig
 from xsdata.formats.dataclass.parsers.mixins import EventsHandler, XmlNode
-from xsdata.formats.dataclass.parsers.utils import ParserUtils
 from xsdata.formats.types import T
+from xsdata.models.enums import Namespace, QNames
 from xsdata.utils.namespaces import target_uri
 
 
@@ -18,7 +18,10 @@ class UnionNode(XmlNode):
 
     The node will record all child events and in the end will replay
     them and try to build all possible objects and sort them by score
-    before deciding the winner.
+    before deciding the winner. Candidate classes that can't accept
+    the element attributes or the direct children are discarded before
+    the replay. If only one candidate is left, the events are replayed
+    directly into that class.
 
     Args:
         var: The xml var instance
@@ -39,6 +42,7 @@ class UnionNode(XmlNode):
         "context",
         "level",
         "events",
+        "children",
     )
 
     def __init__(
@@ -58,6 +62,7 @@ class UnionNode(XmlNode):
         self.context = context
         self.level = 0
         self.events: List[Tuple[str, str, Any, Any]] = []
+        self.children: Dict[str, None] = {}
 
     def child(self, qname: str, attrs: Dict, ns_map: Dict, position: int) -> XmlNode:
         """Record the event for the child element.
@@ -73,8 +78,11 @@ class UnionNode(XmlNode):
             ns_map: The element namespace prefix-URI map
             position: The current length of the intermediate objects
         """
+        if self.level == 0:
+            self.children[qname] = None
+
         self.level += 1
-        self.events.append(("start", qname, copy.deepcopy(attrs), ns_map))
+        self.events.append(("start", qname, dict(attrs), ns_map))
         return self
 
     def bind(
@@ -110,14 +118,17 @@ class UnionNode(XmlNode):
             self.level -= 1
             return False
 
-        self.events.insert(0, ("start", qname, copy.deepcopy(self.attrs), self.ns_map))
+        self.events.insert(0, ("start", qname, dict(self.attrs), self.ns_map))
+
+        candidates = self.find_candidates(qname)
+        if len(candidates) == 1 and self.context.class_type.is_model(candidates[0]):
+            objects.append((self.var.qname, self.bind_class(candidates[0])))
+            return True
 
         obj = None
         max_score = -1.0
-        parent_namespace = target_uri(qname)
-        for clazz in self.var.types:
+        for clazz in candidates:
             if self.context.class_type.is_model(clazz):
-                self.context.build(clazz, parent_ns=parent_namespace)
                 candidate = self.parse_class(clazz)
             else:
                 candidate = self.parse_value(text, [clazz])
@@ -134,6 +145,135 @@ class UnionNode(XmlNode):
 
         raise ParserError(f"Failed to parse union node: {self.var.qname}")
 
+    def find_candidates(self, qname: str) -> List[Type]:
+        """Return the union types that could fit the recorded element.
+
+        The classes that accept all the attributes and the direct
+        children are preferred. If there are none, fall back to the
+        classes that the parser config tolerates, the unknown names
+        are skipped during the replay. The simple types are always
+        candidates.
+
+        Args:
+            qname: The element qualified name
+
+        Returns:
+            The candidate types in the union order.
+        """
+        parent_namespace = target_uri(qname)
+        metas = {
+            clazz: self.context.build(clazz, parent_ns=parent_namespace)
+            for clazz in self.var.types
+            if self.context.class_type.is_model(clazz)
+        }
+
+        accepted = {clazz for clazz, meta in metas.items() if self.accepts(meta)}
+        if not accepted:
+            accepted = {clazz for clazz, meta in metas.items() if self.tolerates(meta)}
+
+        return [
+            clazz for clazz in self.var.types if clazz not in metas or clazz in accepted
+        ]
+
+    def accepts(self, meta: XmlMeta) -> bool:
+        """Return whether the recorded element fits the class meta.
+
+        The check is skipped if the element has a xsi:type attribute,
+        the replay might switch to a derived class. Otherwise, all the
+        attributes and the direct children qualified names must have a
+        matching class var.
+
+        Args:
+            meta: The candidate class meta instance
+
+        Returns:
+            The bool result.
+        """
+        if QNames.XSI_TYPE in self.attrs:
+            return True
+
+        return self.accepts_attributes(meta) and self.accepts_children(meta)
+
+    def tolerates(self, meta: XmlMeta) -> bool:
+        """Return whether the replay into the class meta would not fail.
+
+        The parser config decides whether the unknown attributes and
+        children raise errors, or they are skipped.
+
+        Args:
+            meta: The candidate class meta instance
+
+        Returns:
+            The bool result.
+        """
+        if QNames.XSI_TYPE in self.attrs:
+            return True
+
+        config = self.config
+        if config.fail_on_unknown_attributes and not self.accepts_attributes(meta):
+            return False
+
+        if config.fail_on_unknown_properties and not self.accepts_children(meta):
+            return False
+
+        return True
+
+    def accepts_attributes(self, meta: XmlMeta) -> bool:
+        """Return whether all the element attributes match a class var.
+
+        Args:
+            meta: The candidate class meta instance
+
+        Returns:
+            The bool result.
+        """
+        return all(
+            meta.find_attribute(qname)
+            or meta.find_any_attributes(qname)
+            or target_uri(qname) == Namespace.XSI.uri
+            for qname in self.attrs
+        )
+
+    def accepts_children(self, meta: XmlMeta) -> bool:
+        """Return whether all the direct children match a class var.
+
+        Args:
+            meta: The candidate class meta instance
+
+        Returns:
+            The bool result.
+        """
+        return all(meta.match_children(qname) for qname in self.children)
+
+    def bind_class(self, clazz: Type[T]) -> T:
+        """Replay the recorded events into the only candidate class.
+
+        Like the parse_class method, the converter warnings are errors,
+        but the parser errors are not suppressed.
+
+        Args:
+            clazz: The target class
+
+        Returns:
+            The target class instance.
+
+        Raises:
+            ParserError: If the recorded xml events didn't fit the class,
+                including the values the converters failed to convert.
+        """
+        with warnings.catch_warnings():
+            warnings.filterwarnings("error", category=ConverterWarning)
+
+            parser = NodeParser(
+                config=self.config, context=self.context, handler=EventsHandler
+            )
+            obj = parser.parse(self.events, clazz)
+
+        if obj is None:
+            raise ParserError(f"Failed to parse union node: {self.var.qname}")
+
+        return obj
+
     def parse_class(self, clazz: Type[T]) -> Optional[T]:
         """Replay the recorded events and attempt to build the target class.
 
@@ -166,11 +306,8 @@ class UnionNode(XmlNode):
             The parsed value or None if value didn't match
             with any of the given types.
         """
-        try:
-            with warnings.catch_warnings():
-                warnings.filterwarnings("error", category=ConverterWarning)
-                return ParserUtils.parse_value(
-                    value=value, types=types, ns_map=self.ns_map
-                )
-        except Exception:
+        if value is None:
             return None
+
+        result = converter.try_deserialize(value, types, ns_map=self.ns_map)
+        return None if result is UNCONVERTED else result
@@ -0,0 +1,208 @@
+import functools
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from xsdata.formats.converter import UNCONVERTED, ConverterCache
+from xsdata.formats.dataclass.models.elements import XmlMeta, XmlVar
+from xsdata.formats.dataclass.parsers.utils import ParserUtils
+from xsdata.utils import collections
+
+
+class BindingPlan:
+    """Compiled binding instructions for a class.
+
+    The xml parser resolves the same lookups for every element instance
+    of a class: the attribute vars and the value converters of each
+    var. The plan resolves them once per class and memoizes the results.
+    The child vars lookups are memoized by the class meta itself.
+
+    Args:
+        meta: The class binding metadata instance
+
+    Attributes:
+        attributes: A qualified name to attribute var table
+        any_attributes: A qualified name to wildcard attribute var table
+        values: A var index to value parser table
+    """
+
+    __slots__ = ("meta", "attributes", "any_attributes", "values")
+
+    def __init__(self, meta: XmlMeta):
+        self.meta = meta
+        self.attributes: Dict[str, XmlVar] = dict(meta.attributes)
+        self.any_attributes: Dict[str, Optional[XmlVar]] = {}
+        self.values: Dict[int, Callable] = {}
+
+        for var in meta.get_all_vars():
+            self.values[var.index] = self.build_value_parser(var)
+            for choice in var.elements.values():
+                self.values[choice.index] = self.build_value_parser(choice)
+
+    def find_children(self, qname: str) -> Tuple[XmlVar, ...]:
+        """Return all class vars that match the given qname.
+
+        Args:
+            qname: The namespace qualified name
+
+        Returns:
+            A tuple of the class vars that match the given qname.
+        """
+        return self.meta.match_children(qname)
+
+    def find_attribute(self, qname: str) -> Optional[XmlVar]:
+        """Find an attribute var with the given qname.
+
+        Args:
+            qname: The namespace qualified name
+
+        Returns:
+            The xml var instance or None if there is no match.
+        """
+        return self.attributes.get(qname)
+
+    def find_any_attributes(self, qname: str) -> Optional[XmlVar]:
+        """Find a wildcard attribute var that matches the given qname.
+
+        Args:
+            qname: The namespace qualified name
+
+        Returns:
+            The xml var instance or None if there is no match.
+        """
+        try:
+            return self.any_attributes[qname]
+        except KeyError:
+            result = self.meta.find_any_attributes(qname)
+            self.any_attributes[qname] = result
+            return result
+
+    def parse_value(
+        self,
+        var: XmlVar,
+        value: Any,
+        ns_map: Optional[Dict],
+        cache: Optional[ConverterCache] = None,
+    ) -> Any:
+        """Convert a value according to the given var.
+
+        Args:
+            var: The xml var instance
+            value: A primitive value or a list of primitive values
+            ns_map: The element namespace prefix-URI map
+            cache: The optional converter cache instance
+
+        Returns:
+            The converted value or values.
+        """
+        try:
+            parser = self.values[var.index]
+        except KeyError:
+            parser = self.values[var.index] = self.build_value_parser(var)
+
+        return parser(value, ns_map, cache)
+
+    @classmethod
+    def build_value_parser(cls, var: XmlVar) -> Callable:
+        """Build the value parser of the given var.
+
+        The vars with a single type call the resolved converter of
+        that type directly. The missing values, the converter cache
+        lookups, the conversion failures and the vars with multiple
+        types go through the generic parser utils method. The parsers
+        are partial objects of module functions, to stay picklable.
+
+        Args:
+            var: The xml var instance
+
+        Returns:
+            A callable that accepts the value, the namespace prefix-URI map
+            and the converter cache.
+        """
+        if len(var.types) != 1:
+            return functools.partial(parse_generic, var)
+
+        if var.tokens_factory is None:
+            return functools.partial(parse_single, var)
+
+        return functools.partial(parse_tokens, var)
+
+
+def parse_generic(
+    var: XmlVar, value: Any, ns_map: Optional[Dict], cache: Optional[ConverterCache]
+) -> Any:
+    """Parse the var value with the generic parser utils method.
+
+    Args:
+        var: The xml var instance
+        value: The input value
+        ns_map: The namespace prefix-URI map
+        cache: The converter cache instance
+
+    Returns:
+        The parsed value.
+    """
+    return ParserUtils.parse_value(
+        value,
+        var.types,
+        var.default,
+        ns_map,
+        var.tokens_factory,
+        var.format,
+        cache,
+        var.get_converters(),
+    )
+
+
+def parse_single(
+    var: XmlVar, value: Any, ns_map: Optional[Dict], cache: Optional[ConverterCache]
+) -> Any:
+    """Parse the value of a single type var with its resolved converter.
+
+    Args:
+        var: The xml var instance
+        value: The input value
+        ns_map: The namespace prefix-URI map
+        cache: The converter cache instance
+
+    Returns:
+        The parsed value.
+    """
+    data_type, instance = var.get_converters()[0]
+    if value is None or cache is not None or instance is None:
+        return parse_generic(var, value, ns_map, cache)
+
+    result = instance.try_deserialize(
+        value, data_type=data_type, ns_map=ns_map, format=var.format
+    )
+    if result is UNCONVERTED:
+        return parse_generic(var, value, ns_map, cache)
+
+    return result
+
+
+def parse_tokens(
+    var: XmlVar, value: Any, ns_map: Optional[Dict], cache: Optional[ConverterCache]
+) -> Any:
+    """Parse the tokens of a single type var with its resolved converter.
+
+    Args:
+        var: The xml var instance
+        value: The input value
+        ns_map: The namespace prefix-URI map
+        cache: The converter cache instance
+
+    Returns:
+        The parsed tokens.
+    """
+    data_type, instance = var.get_converters()[0]
+    if value is None or cache is not None or instance is None:
+        return parse_generic(var, value, ns_map, cache)
+
+    values = value if collections.is_array(value) else value.split()
+    result = instance.try_deserialize_many(
+        values, data_type=data_type, ns_map=ns_map, format=var.format
+    )
+    if result is UNCONVERTED:
+        return parse_generic(var, values, ns_map, cache)
+
+    factory = var.tokens_factory
+    return result if factory is list or factory is None else factory(result)
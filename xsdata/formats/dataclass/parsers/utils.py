@@ -1,7 +1,12 @@
 from collections import UserList
 from typing import Any, Callable, Dict, Iterable, Optional, Sequence, Type
 
-from xsdata.formats.converter import QNameConverter, converter
+from xsdata.formats.converter import (
+    ConverterCache,
+    QNameConverter,
+    ResolvedConverters,
+    converter,
+)
 from xsdata.models.enums import QNames
 from xsdata.utils import collections, constants, text
 from xsdata.utils.namespaces import build_qname
@@ -77,6 +82,8 @@ class ParserUtils:
         ns_map: Optional[Dict] = None,
         tokens_factory: Optional[Callable] = None,
         format: Optional[str] = None,
+        cache: Optional[ConverterCache] = None,
+        converters: Optional[ResolvedConverters] = None,
     ) -> Any:
         """Convert a value to a python primitive type.
 
@@ -88,6 +95,8 @@ class ParserUtils:
             tokens_factory: A callable factory for the converted values
                 if the element is derived from xs:NMTOKENS
             format: The format argument for base64/hex values or dates.
+            cache: The optional converter cache instance
+            converters: The pre-resolved converters of the given types
 
         Returns:
             The converted value or values.
@@ -100,12 +109,24 @@ class ParserUtils:
 
         if tokens_factory:
             value = value if collections.is_array(value) else value.split()
-            return tokens_factory(
-                converter.deserialize(val, types, ns_map=ns_map, format=format)
-                for val in value
-            )
+            if cache:
+                values = [
+                    cache.deserialize(val, types, ns_map=ns_map, format=format)
+                    for val in value
+                ]
+            else:
+                values = converter.deserialize_many(
+                    value, types, converters, ns_map=ns_map, format=format
+                )
 
-        return converter.deserialize(value, types, ns_map=ns_map, format=format)
+            return values if tokens_factory is list else tokens_factory(values)
+
+        if cache:
+            return cache.deserialize(value, types, ns_map=ns_map, format=format)
+
+        return converter.deserialize(
+            value, types, converters, ns_map=ns_map, format=format
+        )
 
     @classmethod
     def normalize_content(cls, value: Optional[str]) -> Optional[str]:
@@ -120,7 +141,7 @@ class ParserUtils:
         Returns:
             The normalized content
         """
-        if value and value.strip():
+        if value and not value.isspace():
             return value
 
         return None
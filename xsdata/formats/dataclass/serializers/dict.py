@@ -61,25 +61,57 @@ class DictEncoder:
             if collections.is_array(value):
                 return list(map(self.encode, value))
 
-            return self.dict_factory(self.next_value(value))
+            return self.encode_dataclass(value)
 
-        if var and var.wrapper and not wrapped:
+        if var.wrapper and not wrapped:
             return self.dict_factory(((var.local_name, self.encode(value, var, True)),))
 
+        if isinstance(value, (dict, int, float, str, bool)):
+            return value
+
         if self.context.class_type.is_model(value):
-            return self.dict_factory(self.next_value(value))
+            return self.encode_dataclass(value)
 
         if collections.is_array(value):
             return type(value)(self.encode(val, var, wrapped) for val in value)
 
-        if isinstance(value, (dict, int, float, str, bool)):
-            return value
-
         if isinstance(value, Enum):
             return self.encode(value.value, var, wrapped)
 
         return converter.serialize(value, format=var.format)
 
+    def encode_dataclass(self, obj: Any) -> Any:
+        """Convert a model instance to a dictionary object.
+
+        The plain dict factory skips the intermediate key-value
+        pairs and assigns the values directly.
+
+        Args:
+            obj: The input model instance
+
+        Returns:
+            The converted dictionary object.
+        """
+        if self.dict_factory is not dict:
+            return self.dict_factory(self.next_value(obj))
+
+        ignore_optionals = self.config.ignore_default_attributes
+        meta = self.context.build(obj.__class__, globalns=self.config.globalns)
+        encode = self.encode
+
+        result = {}
+        for var in meta.all_vars:
+            value = getattr(obj, var.name)
+            if ignore_optionals and var.is_attribute and var.is_optional(value):
+                continue
+
+            if var.wrapper:
+                result[var.wrapper_local_name] = encode(value, var)
+            else:
+                result[var.local_name] = encode(value, var)
+
+        return result
+
     def next_value(self, obj: Any) -> Iterator[Tuple[str, Any]]:
         """Fetch the next value of a model instance to convert.
 
@@ -92,7 +124,7 @@ class DictEncoder:
         ignore_optionals = self.config.ignore_default_attributes
         meta = self.context.build(obj.__class__, globalns=self.config.globalns)
 
-        for var in meta.get_all_vars():
+        for var in meta.all_vars:
             value = getattr(obj, var.name)
             if (
                 not var.is_attribute
@@ -1,8 +1,10 @@
+import codecs
 import json
 from dataclasses import dataclass, field
-from io import StringIO
-from typing import Any, Callable, TextIO
+from io import BytesIO, StringIO, TextIOWrapper
+from typing import Any, BinaryIO, Callable, Optional, TextIO
 
+from xsdata.formats.dataclass.backends import JsonBackend
 from xsdata.formats.dataclass.serializers import DictEncoder
 
 
@@ -15,9 +17,12 @@ class JsonSerializer(DictEncoder):
         context: The models context instance
         dict_factory: Dictionary factory
         dump_factory: Json dump factory e.g. json.dump
+        backend: Json library backend, it overrides the dump
+            factory and dumps bytes without a text stream
     """
 
     dump_factory: Callable = field(default=json.dump)
+    backend: Optional[JsonBackend] = None
 
     def render(self, obj: Any) -> str:
         """Serialize the input model instance to json string.
@@ -28,10 +33,36 @@ class JsonSerializer(DictEncoder):
         Returns:
             The serialized json string output.
         """
+        if self.backend:
+            return self.backend.dumps(self.encode(obj), self.config.indent).decode()
+
         output = StringIO()
         self.write(output, obj)
         return output.getvalue()
 
+    def render_bytes(self, obj: Any) -> bytes:
+        """Serialize the input model instance to json bytes.
+
+        The output is encoded with the config encoding.
+
+        Args:
+            obj: The input model instance
+
+        Returns:
+            The serialized json bytes output.
+        """
+        if self.backend:
+            result = self.backend.dumps(self.encode(obj), self.config.indent)
+            encoding = self.config.encoding
+            if codecs.lookup(encoding).name != "utf-8":
+                result = result.decode().encode(encoding)
+
+            return result
+
+        output = BytesIO()
+        self.write_binary(output, obj)
+        return output.getvalue()
+
     def write(self, out: TextIO, obj: Any):
         """Serialize the given object to the output text stream.
 
@@ -39,4 +70,32 @@ class JsonSerializer(DictEncoder):
             out: The output text stream
             obj: The input model instance to serialize
         """
-        self.dump_factory(self.encode(obj), out, indent=self.config.indent)
+        if self.backend:
+            out.write(self.render(obj))
+        else:
+            self.dump_factory(self.encode(obj), out, indent=self.config.indent)
+
+    def write_binary(self, out: BinaryIO, obj: Any):
+        """Serialize the given object to the output binary stream.
+
+        The json text is encoded with the config encoding
+        in chunks, as it's written.
+
+        Args:
+            out: The output binary stream
+            obj: The input model instance to serialize
+        """
+        if self.backend:
+            out.write(self.render_bytes(obj))
+            return
+
+        output = TextIOWrapper(
+            out,
+            encoding=self.config.encoding,
+            newline="",
+        )
+        try:
+            self.write(output, obj)
+            output.flush()
+        finally:
+            output.detach()
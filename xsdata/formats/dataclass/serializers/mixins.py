@@ -9,6 +9,7 @@ from typing import (
     Iterator,
     List,
     Literal,
+    Mapping,
     Optional,
     TextIO,
     Tuple,
@@ -373,6 +374,39 @@ class EventGenerator:
 
         yield from self.convert_dataclass(obj, qname=qname, xsi_type=xsi_type)
 
+    def generate_stream(self, obj: Any, name: str, values: Iterable) -> EventIterator:
+        """Convert a model instance to sax events, streaming a repeating field.
+
+        The given values override the field value of the input model
+        instance, which is never modified, frozen models are supported.
+        The values are consumed one by one, while the events are produced.
+
+        Args:
+            obj: The input model instance, the root envelope
+            name: The repeating element field name
+            values: An iterable of the field values
+
+        Returns:
+            An iterator of sax events.
+
+        Raises:
+            SerializerError: If the field is not a repeating element.
+        """
+        meta = self.context.build(obj.__class__, globalns=self.config.globalns)
+        var = next((var for var in meta.element_vars if var.name == name), None)
+        if (
+            var is None
+            or not var.list_element
+            or var.tokens
+            or var.mixed
+            or var.sequence is not None
+        ):
+            raise SerializerError(
+                f"{meta.clazz.__name__}.{name} is not a repeating element field"
+            )
+
+        return self.convert_dataclass(obj, overrides={name: iter(values)})
+
     def convert_dataclass(
         self,
         obj: Any,
@@ -380,6 +414,7 @@ class EventGenerator:
         qname: Optional[str] = None,
         nillable: bool = False,
         xsi_type: Optional[str] = None,
+        overrides: Mapping[str, Any] = EMPTY_MAP,
     ) -> EventIterator:
         """Convert a model instance to sax events.
 
@@ -392,6 +427,7 @@ class EventGenerator:
             qname: Override the field qualified name
             nillable: Specifies whether the field is nillable
             xsi_type: Override the field xsi type
+            overrides: Override the element field values by name
 
         Yields:
             An iterator of sax events.
@@ -401,9 +437,13 @@ class EventGenerator:
             namespace,
             globalns=self.config.globalns,
         )
-        qname = qname or meta.qname
+        if qname:
+            namespace = namespaces.target_uri(qname)
+        else:
+            qname = meta.qname
+            namespace = meta.namespace
+
         nillable = nillable or meta.nillable
-        namespace, tag = namespaces.split_qname(qname)
 
         yield XmlWriterEvent.START, qname
 
@@ -412,7 +452,7 @@ class EventGenerator:
         ):
             yield XmlWriterEvent.ATTR, key, value
 
-        for var, value in self.next_value(obj, meta):
+        for var, value in self.next_value(obj, meta, overrides):
             if var.wrapper:
                 yield XmlWriterEvent.START, var.wrapper
 
@@ -485,7 +525,9 @@ class EventGenerator:
             yield from self.convert_tokens(value, var, namespace)
         elif var.is_elements:
             yield from self.convert_elements(value, var, namespace)
-        elif var.list_element and collections.is_array(value):
+        elif var.list_element and (
+            collections.is_array(value) or isinstance(value, Iterator)
+        ):
             yield from self.convert_list(value, var, namespace)
         else:
             yield from self.convert_any_type(value, var, namespace)
@@ -673,7 +715,7 @@ class EventGenerator:
         Yields:
             An iterator of sax events.
         """
-        if collections.is_array(value):
+        if collections.is_array(value) or isinstance(value, Iterator):
             for val in value:
                 yield from self.convert_choice(val, var, namespace)
         else:
@@ -766,7 +808,9 @@ class EventGenerator:
         yield XmlWriterEvent.DATA, cls.encode_primitive(value, var)
 
     @classmethod
-    def next_value(cls, obj: Any, meta: XmlMeta) -> Iterator[Tuple[XmlVar, Any]]:
+    def next_value(
+        cls, obj: Any, meta: XmlMeta, overrides: Mapping[str, Any] = EMPTY_MAP
+    ) -> Iterator[Tuple[XmlVar, Any]]:
         """Produce the next non attribute value of a model instance to convert.
 
         The generator will produce the values in the order the fields
@@ -778,29 +822,22 @@ class EventGenerator:
         Args:
             obj: The input model instance
             meta: The model metadata instance
+            overrides: Override the non sequential field values by name
 
         Yields:
             An iterator of field metadata instance and value tuples.
         """
-        index = 0
-        attrs = meta.get_element_vars()
-        stop = len(attrs)
-        while index < stop:
-            var = attrs[index]
-
+        for sequence in meta.element_groups:
+            var = sequence[0]
             if var.sequence is None:
-                value = getattr(obj, var.name)
+                if overrides and var.name in overrides:
+                    value = overrides[var.name]
+                else:
+                    value = getattr(obj, var.name)
                 if value is not None or var.nillable:
                     yield var, value
-                index += 1
                 continue
 
-            indices = range(index, stop)
-            end = next(
-                i for i in indices[::-1] if attrs[i].sequence == var.sequence
-            )  # pragma: no cover
-            sequence = attrs[index : end + 1]
-            index = end + 1
             j = 0
 
             rolling = True
@@ -843,7 +880,7 @@ class EventGenerator:
         Yields:
             An iterator of attribute name-value pairs.
         """
-        for var in meta.get_attribute_vars():
+        for var in meta.attribute_vars:
             if var.is_attribute:
                 value = getattr(obj, var.name)
                 if (
@@ -1,6 +1,7 @@
 from typing import Type
 
 from xsdata.formats.dataclass.serializers.mixins import XmlWriter
+from xsdata.formats.dataclass.serializers.writers.fast import FastXmlWriter
 from xsdata.formats.dataclass.serializers.writers.native import XmlEventWriter
 
 try:
@@ -18,6 +19,7 @@ except ImportError:  # pragma: no cover
 
 
 __all__ = [
+    "FastXmlWriter",
     "LxmlEventWriter",
     "XmlEventWriter",
     "default_writer",
@@ -0,0 +1,415 @@
+import re
+from typing import Any, Dict, List, Optional, TextIO, Tuple
+from xml.sax.handler import ContentHandler
+from xml.sax.saxutils import escape, quoteattr
+
+from xsdata.formats.dataclass.serializers.config import SerializerConfig
+from xsdata.formats.dataclass.serializers.mixins import (
+    XSI_NIL,
+    EventIterator,
+    XmlWriter,
+)
+from xsdata.models.enums import Namespace
+from xsdata.utils.constants import EMPTY_MAP
+from xsdata.utils.namespaces import generate_prefix, prefix_exists, split_qname
+
+needs_escape = re.compile(r"[&<>]").search
+needs_quoting = re.compile(r'[&<>"\n\r\t]').search
+
+
+class FastXmlWriter(XmlWriter):
+    """Xml writer that renders the output text directly.
+
+    The writer produces the same output as the `XmlEventWriter`,
+    without a sax content handler in between. The elements share
+    the namespace prefix-URI map of their parent, until they need
+    to add a prefix, and the output is written in chunks.
+
+    Args:
+        config: The serializer config instance
+        output: The output stream to write the result
+        ns_map: A user defined namespace prefix-URI map
+
+    Attributes:
+        handler: The content handler instance, unused
+        in_tail: Specifies whether the text content has been written
+        tail: The current element tail content
+        attrs: The current element attributes
+        ns_context: The namespace context queue, the first item
+            is the user defined namespace prefix-URI map
+        pending_tag: The pending element namespace, name tuple
+        pending_prefixes: The pending element namespace prefixes, unused
+        buffer: The rendered output chunks, not written yet
+        contexts: The namespace URI-prefix maps queue, used to
+            render the qualified names
+        names: The split qualified names cache
+        indents: The new line and indentation strings per level
+        current_level: The current element depth, if pretty print is enabled
+        pending_end_element: Specifies whether an element ended last
+        pending_start: Specifies whether the last start tag is still open
+    """
+
+    __slots__ = (
+        "buffer",
+        "contexts",
+        "names",
+        "indents",
+        "current_level",
+        "pending_end_element",
+        "pending_start",
+    )
+
+    FLUSH_SIZE = 4096
+
+    def __init__(self, config: SerializerConfig, output: TextIO, ns_map: Dict):
+        super().__init__(config, output, ns_map)
+
+        self.ns_context.append(ns_map)
+        self.buffer: List[str] = []
+        self.contexts: List[Dict] = [{}]
+        self.names: Dict[str, Tuple] = {}
+        self.indents: List[str] = []
+        self.current_level = 0
+        self.pending_end_element = False
+        self.pending_start = False
+
+    def build_handler(self) -> ContentHandler:
+        """Build the content handler instance.
+
+        The writer renders the output itself, the handler
+        is only a placeholder for the base class.
+
+        Returns:
+            A content handler instance.
+        """
+        return ContentHandler()
+
+    def write(self, events: EventIterator):
+        """Render the events and write the remaining output chunks.
+
+        Args:
+            events: An iterator of sax events
+
+        Raises:
+            XmlWriterError: On unknown events.
+        """
+        super().write(events)
+        self.flush_buffer()
+        self.output.flush()
+
+    def start_tag(self, qname: str):
+        """Start tag notification receiver.
+
+        The receiver will flush the start of any pending element, create
+        new namespaces context and queue the current tag for generation.
+
+        The receiver will also write the necessary whitespace if
+        pretty print is enabled.
+
+        Args:
+            qname: The qualified name of the starting element
+        """
+        self.flush_start(False)
+
+        self.ns_context.append(self.ns_map)
+        self.pending_tag = self.split_name(qname)
+        self.add_namespace(self.pending_tag[0])
+
+        if self.config.indent:
+            if self.current_level:
+                self.write_whitespace(self.indentation(self.current_level))
+
+            self.current_level += 1
+            self.pending_end_element = False
+
+    def add_namespace(self, uri: Optional[str]):
+        """Add the given uri to the current namespace context.
+
+         If the uri empty or a prefix already exists, skip silently.
+
+        Args:
+            uri: The namespace URI
+        """
+        if uri and not prefix_exists(uri, self.ns_map):
+            self.copy_ns_map()
+            generate_prefix(uri, self.ns_map)
+
+    def set_data(self, data: Any):
+        """Set data notification receiver.
+
+        The receiver will convert the data to string, flush any previous
+        pending start element and render it.
+
+        If the text content of the tag has already been generated then
+        treat the current data as element tail content and queue it to
+        be generated when the tag ends.
+
+        Args:
+            data: The element text or tail content
+        """
+        value = self.encode_data(data)
+        self.flush_start(is_nil=value is None)
+
+        if value:
+            if not self.in_tail:
+                self.write_characters(value)
+            else:
+                self.tail = value
+
+        self.in_tail = True
+
+    def end_tag(self, qname: str):
+        """End tag notification receiver.
+
+        The receiver will flush if pending the start of the element, end
+        the element, its tail content and its namespaces contexts.
+
+        The receiver will also write the necessary whitespace if
+        pretty print is enabled.
+
+        Args:
+            qname: The qualified name of the element
+        """
+        indent = self.config.indent
+        if indent:
+            self.current_level -= 1
+            if self.pending_end_element:
+                self.write_whitespace(self.indentation(self.current_level))
+
+        self.flush_start(True)
+
+        if self.pending_start:
+            self.buffer.append("/>")
+            self.pending_start = False
+        else:
+            self.buffer.append(f"</{self.render_name(self.split_name(qname))}>")
+
+        if self.tail:
+            self.write_characters(self.tail)
+
+        self.tail = None
+        self.in_tail = False
+        self.ns_context.pop()
+        self.ns_map = self.ns_context[-1]
+        self.contexts.pop()
+
+        if indent:
+            self.pending_end_element = True
+            if not self.current_level:
+                self.write_whitespace("\n")
+
+        if len(self.buffer) > self.FLUSH_SIZE:
+            self.flush_buffer()
+
+    def flush_start(self, is_nil: bool = True):
+        """Flush start notification receiver.
+
+        The receiver will pop the xsi:nil attribute if the element is
+        not empty, prepare the namespace prefix-URI map and render the
+        element with its attributes and namespace declarations.
+
+        Args:
+            is_nil: Specify if the element requires `xsi:nil="true"`
+                when content is empty
+        """
+        if not self.pending_tag:
+            return
+
+        if not is_nil:
+            self.attrs.pop(XSI_NIL, None)
+
+        for uri, _ in self.attrs:
+            if uri and not prefix_exists(uri, self.ns_map):
+                self.add_namespace(uri)
+
+        self.reset_default_namespace()
+        declarations = self.start_namespaces()
+
+        self.close_start()
+        buffer = self.buffer
+        buffer.append(f"<{self.render_name(self.pending_tag)}")
+
+        for prefix, uri in declarations:
+            if prefix:
+                buffer.append(f' xmlns:{prefix}="{uri}"')
+            else:
+                buffer.append(f' xmlns="{uri}"')
+
+        for name, value in self.attrs.items():
+            if needs_quoting(value):
+                value = quoteattr(value)
+            else:
+                value = f'"{value}"'
+
+            buffer.append(f" {self.render_name(name)}={value}")
+
+        self.pending_start = True
+        self.attrs = {}
+        self.in_tail = False
+        self.pending_tag = None
+
+    def start_namespaces(self) -> List[Tuple[Optional[str], str]]:
+        """Create the namespace URI-prefix map of the pending element.
+
+        The root element declares all the prefixes, the rest
+        only the prefixes that differ from their parent element.
+
+        Returns:
+            The list of the namespace prefix-URI declarations.
+        """
+        ns_map = self.ns_map
+        context = self.contexts[-1]
+
+        if len(self.ns_context) == 2:
+            parent_ns_map = EMPTY_MAP
+        else:
+            parent_ns_map = self.ns_context[-2]
+            if ns_map is parent_ns_map:
+                self.contexts.append(context)
+                return []
+
+        declarations = [
+            (prefix, uri)
+            for prefix, uri in ns_map.items()
+            if parent_ns_map.get(prefix) != uri
+        ]
+        if declarations:
+            context = context.copy()
+            for prefix, uri in declarations:
+                context[uri] = prefix
+
+        self.contexts.append(context)
+        return declarations
+
+    def reset_default_namespace(self):
+        """Reset the default namespace if the pending element is not qualified."""
+        if (
+            self.pending_tag
+            and not self.pending_tag[0]
+            and self.ns_map.get(None, "") != ""
+        ):
+            self.copy_ns_map()
+            self.ns_map[None] = ""
+
+    def encode_data(self, data: Any) -> Optional[str]:
+        """Encode data for xml rendering.
+
+        The converters might add new prefixes for qualified
+        name values, they are moved to a copy of the current
+        namespace prefix-URI map, if it's shared.
+
+        Args:
+            data: The content to encode/serialize
+
+        Returns:
+            The xml encoded data
+        """
+        if data is None or isinstance(data, str):
+            return data
+
+        ns_map = self.ns_map
+        size = len(ns_map)
+        value = super().encode_data(data)
+
+        if len(ns_map) != size and self.is_shared_ns_map():
+            added = list(ns_map.items())[size:]
+            for prefix, _ in added:
+                del ns_map[prefix]
+
+            self.copy_ns_map()
+            self.ns_map.update(added)
+
+        return value
+
+    def is_shared_ns_map(self) -> bool:
+        """Return whether the current namespace map belongs to an ancestor."""
+        return len(self.ns_context) < 2 or self.ns_map is self.ns_context[-2]
+
+    def copy_ns_map(self):
+        """Copy the current namespace prefix-URI map, if it's shared."""
+        if self.is_shared_ns_map():
+            self.ns_map = self.ns_map.copy()
+            self.ns_context[-1] = self.ns_map
+
+    def split_name(self, qname: str) -> Tuple:
+        """Split and cache the given qualified name.
+
+        Args:
+            qname: The namespace qualified name
+
+        Returns:
+            A tuple of the namespace and the local name.
+        """
+        try:
+            return self.names[qname]
+        except KeyError:
+            name = self.names[qname] = split_qname(qname)
+            return name
+
+    def render_name(self, name: Tuple) -> str:
+        """Render the namespace, local name tuple with its prefix.
+
+        Args:
+            name: The namespace, local name tuple
+
+        Returns:
+            The prefixed name or the local name.
+        """
+        uri, local = name
+        if uri:
+            if uri == Namespace.XML.uri:
+                return f"xml:{local}"
+
+            prefix = self.contexts[-1][uri]
+            if prefix:
+                return f"{prefix}:{local}"
+
+        return local
+
+    def close_start(self):
+        """Close the last start tag, if it's still open."""
+        if self.pending_start:
+            self.buffer.append(">")
+            self.pending_start = False
+
+    def write_characters(self, content: str):
+        """Render the escaped text content.
+
+        Args:
+            content: The text content
+        """
+        if content:
+            self.close_start()
+            self.buffer.append(escape(content) if needs_escape(content) else content)
+
+    def indentation(self, level: int) -> str:
+        """Return the new line and indentation whitespace for the given level.
+
+        Args:
+            level: The element depth
+
+        Returns:
+            The whitespace string.
+        """
+        indent = self.config.indent or ""
+        indents = self.indents
+        while len(indents) <= level:
+            indents.append(f"\n{indent * len(indents)}")
+
+        return indents[level]
+
+    def write_whitespace(self, content: str):
+        """Render the ignorable whitespace content.
+
+        Args:
+            content: The whitespace content
+        """
+        if content:
+            self.close_start()
+            self.buffer.append(content)
+
+    def flush_buffer(self):
+        """Write the rendered chunks to the output stream."""
+        if self.buffer:
+            self.output.write("".join(self.buffer))
+            self.buffer.clear()
@@ -1,8 +1,10 @@
 from dataclasses import dataclass, field
-from io import StringIO
+from io import BytesIO, StringIO, TextIOWrapper
 from typing import (
     Any,
+    BinaryIO,
     Dict,
+    Iterable,
     Optional,
     TextIO,
     Type,
@@ -42,6 +44,22 @@ class XmlSerializer(EventGenerator):
         self.write(output, obj, ns_map)
         return output.getvalue()
 
+    def render_bytes(self, obj: Any, ns_map: Optional[Dict] = None) -> bytes:
+        """Serialize the input model instance to xml bytes.
+
+        The output is encoded with the config encoding.
+
+        Args:
+            obj: The input model instance to serialize
+            ns_map: A user defined namespace prefix-URI map
+
+        Returns:
+            The serialized xml bytes output.
+        """
+        output = BytesIO()
+        self.write_binary(output, obj, ns_map)
+        return output.getvalue()
+
     def write(self, out: TextIO, obj: Any, ns_map: Optional[Dict] = None):
         """Serialize the given object to the output text stream.
 
@@ -57,3 +75,59 @@ class XmlSerializer(EventGenerator):
             ns_map=namespaces.clean_prefixes(ns_map) if ns_map else {},
         )
         handler.write(events)
+
+    def write_binary(self, out: BinaryIO, obj: Any, ns_map: Optional[Dict] = None):
+        """Serialize the given object to the output binary stream.
+
+        The xml text is encoded with the config encoding in chunks,
+        as it's written, characters the encoding doesn't support
+        are replaced with character references.
+
+        Args:
+            out: The output binary stream
+            obj: The input model instance to serialize
+            ns_map: A user defined namespace prefix-URI map
+        """
+        output = TextIOWrapper(
+            out,
+            encoding=self.config.encoding,
+            errors="xmlcharrefreplace",
+            newline="",
+        )
+        try:
+            self.write(output, obj, ns_map)
+            output.flush()
+        finally:
+            output.detach()
+
+    def write_stream(
+        self,
+        out: TextIO,
+        obj: Any,
+        name: str,
+        values: Iterable,
+        ns_map: Optional[Dict] = None,
+    ):
+        """Serialize the given object to the output text stream.
+
+        The values of the repeating element field are streamed
+        instead, as they are produced by the given iterable.
+        The :class:`XmlEventWriter` and the :class:`FastXmlWriter`
+        write the events straight to the output stream, the
+        :class:`LxmlEventWriter` still needs to build the whole
+        tree in memory.
+
+        Args:
+            out: The output text stream
+            obj: The input model instance, the root envelope
+            name: The repeating element field name
+            values: An iterable of the field values
+            ns_map: A user defined namespace prefix-URI map
+        """
+        events = self.generate_stream(obj, name, values)
+        handler = self.writer(
+            config=self.config,
+            output=out,
+            ns_map=namespaces.clean_prefixes(ns_map) if ns_map else {},
+        )
+        handler.write(events)
@@ -1,7 +1,29 @@
 import abc
-from typing import Any, Dict, Optional
+import asyncio
+import functools
+import io
+from concurrent.futures import Executor
+from typing import Any, BinaryIO, Dict, Optional, TypeVar, cast
 
-from requests import Response, Session
+from requests import HTTPError, Response, Session
+from requests.adapters import HTTPAdapter
+
+T = TypeVar("T", bound="AsyncTransport")
+
+
+def is_valid_status(status_code: int) -> bool:
+    """Return whether the response content can be unmarshalled.
+
+    The successful responses and the 500 responses, that carry
+    the soap faults, are valid for every transport and method.
+
+    Args:
+        status_code: The response status code
+
+    Returns:
+        The bool result.
+    """
+    return 200 <= status_code < 300 or status_code == 500
 
 
 class Transport(abc.ABC):
@@ -17,20 +39,52 @@ class Transport(abc.ABC):
     def post(self, url: str, data: Any, headers: Dict) -> bytes:
         """Send a POST request."""
 
+    def post_stream(self, url: str, data: Any, headers: Dict) -> BinaryIO:
+        """Send a POST request and return the response content stream.
+
+        Transports should override this method to return the response
+        body without reading it in memory first.
+
+        Args:
+            url: The base URL
+            data: The request body payload
+            headers: A key-value map of HTTP headers
+
+        Returns:
+            The response content binary stream.
+        """
+        return io.BytesIO(self.post(url, data=data, headers=headers))
+
 
 class DefaultTransport(Transport):
     """Default transport based on the `requests` library.
 
+    The session keeps the connections alive and reuses them between
+    requests, the pool size is the maximum number of connections
+    per host, set it to the number of concurrent requests.
+
     Args:
         timeout: Read timeout in seconds
+        session: The requests session instance
+        pool_size: The connection pool size, defaults to the requests default
     """
 
     __slots__ = "timeout", "session"
 
-    def __init__(self, timeout: float = 2.0, session: Optional[Session] = None):
+    def __init__(
+        self,
+        timeout: float = 2.0,
+        session: Optional[Session] = None,
+        pool_size: Optional[int] = None,
+    ):
         self.timeout = timeout
         self.session = session or Session()
 
+        if pool_size:
+            adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+            self.session.mount("http://", adapter)
+            self.session.mount("https://", adapter)
+
     def get(self, url: str, params: Dict, headers: Dict) -> bytes:
         """Send a GET request.
 
@@ -70,11 +124,34 @@ class DefaultTransport(Transport):
         res = self.session.post(url, data=data, headers=headers, timeout=self.timeout)
         return self.handle_response(res)
 
+    def post_stream(self, url: str, data: Any, headers: Dict) -> BinaryIO:
+        """Send a POST request and return the response content stream.
+
+        The stream reads the decoded response body from the connection,
+        close it to close the response and release the connection.
+
+        Args:
+            url: The base URL
+            data: The request body payload
+            headers: A key-value map of HTTP headers
+
+        Returns:
+            The response content binary stream.
+
+        Raises:
+            HTTPError: if status code is not valid for content unmarshalling.
+        """
+        res = self.session.post(
+            url, data=data, headers=headers, timeout=self.timeout, stream=True
+        )
+        return self.handle_stream(res)
+
     @classmethod
     def handle_response(cls, response: Response) -> bytes:
         """Return the response content or raise an exception.
 
-        Status codes 200 or 500 means that we can unmarshall the response.
+        The successful and the 500 status codes mean that we can
+        unmarshall the response.
 
         Args:
             response: The response instance
@@ -83,9 +160,276 @@ class DefaultTransport(Transport):
             The encoded response content.
 
         Raises:
-            HTTPError: If the response status code is not 200 or 500
+            HTTPError: If the response status code is not valid
         """
-        if response.status_code not in (200, 500):
-            response.raise_for_status()
-
+        cls.check_status(response)
         return response.content
+
+    @classmethod
+    def handle_stream(cls, response: Response) -> BinaryIO:
+        """Return the response content stream or raise an exception.
+
+        The successful and the 500 status codes mean that we can
+        unmarshall the response.
+
+        Args:
+            response: The streamed response instance
+
+        Returns:
+            The response content binary stream.
+
+        Raises:
+            HTTPError: If the response status code is not valid
+        """
+        try:
+            cls.check_status(response)
+        except HTTPError:
+            response.close()
+            raise
+
+        response.raw.decode_content = True
+        return cast(BinaryIO, ResponseStream(response))
+
+    @classmethod
+    def check_status(cls, response: Response):
+        """Raise an exception if the response status code is not valid.
+
+        Args:
+            response: The response instance
+
+        Raises:
+            HTTPError: If the response status code is not valid
+        """
+        if is_valid_status(response.status_code):
+            return
+
+        response.raise_for_status()
+        raise HTTPError(
+            f"{response.status_code} Unexpected Status: "
+            f"{response.reason} for url: {response.url}",
+            response=response,
+        )
+
+
+class ResponseStream(io.RawIOBase):
+    """The binary stream of a streamed response body.
+
+    Closing the stream closes the response, which returns the
+    connection to the pool once the body has been read.
+
+    Args:
+        response: The streamed response instance
+    """
+
+    def __init__(self, response: Response):
+        super().__init__()
+        self.response = response
+
+    def readable(self) -> bool:
+        """Return whether the stream is readable."""
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        """Read the response body bytes into the given buffer.
+
+        Args:
+            buffer: The writable buffer
+
+        Returns:
+            The number of bytes read, zero on the end of the body.
+        """
+        data = self.response.raw.read(len(buffer))
+        size = len(data)
+        buffer[:size] = data
+        return size
+
+    def close(self):
+        """Close the stream and the response."""
+        if not self.closed:
+            self.response.close()
+
+        super().close()
+
+
+class AsyncTransport(abc.ABC):
+    """An asynchronous HTTP transport interface.
+
+    The transports are async context managers, exiting the context
+    closes the transport.
+    """
+
+    __slots__ = ()
+
+    @abc.abstractmethod
+    async def get(self, url: str, params: Dict, headers: Dict) -> bytes:
+        """Send a GET request."""
+
+    @abc.abstractmethod
+    async def post(self, url: str, data: Any, headers: Dict) -> bytes:
+        """Send a POST request."""
+
+    async def aclose(self):
+        """Release the transport resources."""
+
+    async def __aenter__(self: T) -> T:
+        """Enter the async context."""
+        return self
+
+    async def __aexit__(self, *args: Any):
+        """Exit the async context and close the transport."""
+        await self.aclose()
+
+
+class ExecutorTransport(AsyncTransport):
+    """Asyncio transport that runs a blocking transport in an executor.
+
+    Args:
+        transport: The blocking transport instance
+        executor: The executor instance, defaults to the
+            event loop default executor
+    """
+
+    __slots__ = "transport", "executor"
+
+    def __init__(
+        self,
+        transport: Optional[Transport] = None,
+        executor: Optional[Executor] = None,
+    ):
+        self.transport = transport or DefaultTransport()
+        self.executor = executor
+
+    async def get(self, url: str, params: Dict, headers: Dict) -> bytes:
+        """Send a GET request.
+
+        Args:
+            url: The base URL
+            params: The query parameters
+            headers: A key-value map of HTTP headers
+
+        Returns:
+            The encoded response content.
+        """
+        func = functools.partial(self.transport.get, url, params, headers)
+        return await asyncio.get_running_loop().run_in_executor(self.executor, func)
+
+    async def post(self, url: str, data: Any, headers: Dict) -> bytes:
+        """Send a POST request.
+
+        Args:
+            url: The base URL
+            data: The request body payload
+            headers: A key-value map of HTTP headers
+
+        Returns:
+            The encoded response content.
+        """
+        func = functools.partial(self.transport.post, url, data=data, headers=headers)
+        return await asyncio.get_running_loop().run_in_executor(self.executor, func)
+
+
+try:
+    import httpx
+
+    class HttpxTransport(AsyncTransport):
+        """Asyncio transport based on the `httpx` library.
+
+        The transport only closes the httpx client it created,
+        the given clients are closed by their owners.
+
+        Args:
+            timeout: Read timeout in seconds
+            client: The httpx async client instance
+
+        Attributes:
+            owns_client: Whether the transport created the client
+        """
+
+        __slots__ = "timeout", "client", "owns_client"
+
+        def __init__(
+            self, timeout: float = 2.0, client: Optional[httpx.AsyncClient] = None
+        ):
+            self.timeout = timeout
+            self.owns_client = client is None
+            self.client = client or httpx.AsyncClient()
+
+        async def aclose(self):
+            """Close the httpx client, if the transport created it."""
+            if self.owns_client:
+                await self.client.aclose()
+
+        async def get(self, url: str, params: Dict, headers: Dict) -> bytes:
+            """Send a GET request.
+
+            Args:
+                url: The base URL
+                params: The query parameters
+                headers: A key-value map of HTTP headers
+
+            Returns:
+                The encoded response content.
+
+            Raises:
+                HTTPStatusError: if status code is not valid for content unmarshalling.
+            """
+            res = await self.client.get(
+                url, params=params, headers=headers, timeout=self.timeout
+            )
+            return self.handle_response(res)
+
+        async def post(self, url: str, data: Any, headers: Dict) -> bytes:
+            """Send a POST request.
+
+            Args:
+                url: The base URL
+                data: The request body payload
+                headers: A key-value map of HTTP headers
+
+            Returns:
+                The encoded response content.
+
+            Raises:
+                HTTPStatusError: if status code is not valid for content unmarshalling.
+            """
+            res = await self.client.post(
+                url, content=data, headers=headers, timeout=self.timeout
+            )
+            return self.handle_response(res)
+
+        @classmethod
+        def handle_response(cls, response: httpx.Response) -> bytes:
+            """Return the response content or raise an exception.
+
+            The successful and the 500 status codes mean that we can
+            unmarshall the response.
+
+            Args:
+                response: The response instance
+
+            Returns:
+                The encoded response content.
+
+            Raises:
+                HTTPStatusError: If the response status code is not valid
+            """
+            if not is_valid_status(response.status_code):
+                response.raise_for_status()
+                raise httpx.HTTPStatusError(
+                    f"{response.status_code} Unexpected Status: "
+                    f"{response.reason_phrase} for url: {response.url}",
+                    request=response.request,
+                    response=response,
+                )
+
+            return response.content
+
+    def default_async_transport() -> AsyncTransport:
+        """Return the default async transport."""
+        return HttpxTransport()
+
+except ImportError:
+
+    def default_async_transport() -> AsyncTransport:
+        """Return the default async transport."""
+        return ExecutorTransport()
@@ -2,7 +2,7 @@ import datetime
 import operator
 import re
 from collections import UserString
-from typing import Any, Callable, Dict, NamedTuple, Optional, Union
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Union
 
 from xsdata.utils.dates import (
     calculate_offset,
@@ -11,6 +11,7 @@ from xsdata.utils.dates import (
     format_offset,
     format_time,
     parse_date_args,
+    parse_many_date_args,
     validate_date,
     validate_time,
 )
@@ -85,6 +86,11 @@ class XmlDate(NamedTuple):
         """Initialize from string with format `%Y-%m-%dT%z`."""
         return cls(*parse_date_args(string, DateFormat.DATE))
 
+    @classmethod
+    def from_strings(cls, strings: Iterable[str]) -> List["XmlDate"]:
+        """Initialize a list from strings with format `%Y-%m-%dT%z`."""
+        return [cls(*args) for args in parse_many_date_args(strings, DateFormat.DATE)]
+
     @classmethod
     def from_date(cls, obj: datetime.date) -> "XmlDate":
         """Initialize from a `datetime.date` instance."""
@@ -202,6 +208,17 @@ class XmlDateTime(NamedTuple):
 
         return cls(year, month, day, hour, minute, second, fractional_second, offset)
 
+    @classmethod
+    def from_strings(cls, strings: Iterable[str]) -> List["XmlDateTime"]:
+        """Initialize a list from strings with format `%Y-%m-%dT%H:%M:%S%z`."""
+        result = []
+        for args in parse_many_date_args(strings, DateFormat.DATE_TIME):
+            validate_date(*args[:3])
+            validate_time(*args[3:7])
+            result.append(cls(*args))
+
+        return result
+
     @classmethod
     def from_datetime(cls, obj: datetime.datetime) -> "XmlDateTime":
         """Initialize from `datetime.datetime` instance."""
@@ -390,6 +407,16 @@ class XmlTime(NamedTuple):
         validate_time(hour, minute, second, fractional_second)
         return cls(hour, minute, second, fractional_second, offset)
 
+    @classmethod
+    def from_strings(cls, strings: Iterable[str]) -> List["XmlTime"]:
+        """Initialize a list from strings with format `%H:%M:%S%z`."""
+        result = []
+        for args in parse_many_date_args(strings, DateFormat.TIME):
+            validate_time(*args[:4])
+            result.append(cls(*args))
+
+        return result
+
     @classmethod
     def from_time(cls, obj: datetime.time) -> "XmlTime":
         """Initialize from `datetime.time` instance."""
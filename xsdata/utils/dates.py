@@ -1,6 +1,20 @@
 import datetime
+import re
 from calendar import isleap
-from typing import Any, Iterator, Optional, Union
+from typing import Any, Iterable, Iterator, List, Optional, Tuple, Union
+
+CANONICAL_DATE = r"([0-9]{4})-([0-9]{2})-([0-9]{2})"
+CANONICAL_TIME = r"([0-9]{2}):([0-9]{2}):([0-9]{2})(\.[0-9]{1,9})?"
+CANONICAL_OFFSET = r"(Z|[+-][0-9]{2}:[0-9]{2})?"
+
+# Canonical lexical forms per format, the rest go through the DateTimeParser
+CANONICAL_PATTERNS = {
+    "%Y-%m-%d%z": re.compile(CANONICAL_DATE + CANONICAL_OFFSET),
+    "%H:%M:%S%z": re.compile(CANONICAL_TIME + CANONICAL_OFFSET),
+    "%Y-%m-%dT%H:%M:%S%z": re.compile(
+        f"{CANONICAL_DATE}T{CANONICAL_TIME}{CANONICAL_OFFSET}"
+    ),
+}
 
 
 def parse_date_args(value: Any, fmt: str) -> Iterator[int]:
@@ -8,10 +22,80 @@ def parse_date_args(value: Any, fmt: str) -> Iterator[int]:
     if not isinstance(value, str):
         raise ValueError("")
 
-    parser = DateTimeParser(value.strip(), fmt)
+    value = value.strip()
+    pattern = CANONICAL_PATTERNS.get(fmt)
+    if pattern:
+        match = pattern.fullmatch(value)
+        if match:
+            return iter(canonical_args(match.groups()))
+
+    parser = DateTimeParser(value, fmt)
     return parser.parse()
 
 
+def parse_many_date_args(values: Iterable[Any], fmt: str) -> List[Tuple]:
+    """Parse the fmt args from each value.
+
+    The canonical pattern is resolved once for all the values,
+    the unusual inputs still go through the datetime parser.
+
+    Args:
+        values: The datetime strings
+        fmt: The target format string
+
+    Returns:
+        A list of the parsed arguments tuples.
+
+    Raises:
+        ValueError: If any value doesn't match the format.
+    """
+    pattern = CANONICAL_PATTERNS.get(fmt)
+    if not pattern:
+        return [tuple(parse_date_args(value, fmt)) for value in values]
+
+    fullmatch = pattern.fullmatch
+    result = []
+    for value in values:
+        match = fullmatch(value.strip()) if isinstance(value, str) else None
+        if match:
+            result.append(canonical_args(match.groups()))
+        else:
+            result.append(tuple(parse_date_args(value, fmt)))
+
+    return result
+
+
+def canonical_args(groups: Tuple[Optional[str], ...]) -> Tuple:
+    """Convert the groups of a canonical pattern match to the format args.
+
+    Args:
+        groups: The matched digits, the optional fractional second
+            with its leading dot and the optional offset last
+
+    Returns:
+        The same arguments the datetime parser would yield.
+    """
+    *fields, offset = groups
+    args: List[Optional[int]] = []
+    for field in fields:
+        if field is None:
+            args.append(0)
+        elif field[0] == ".":
+            args.append(int(field[1:].ljust(9, "0")))
+        else:
+            args.append(int(field))
+
+    if offset is None:
+        args.append(None)
+    elif offset == "Z":
+        args.append(0)
+    else:
+        minutes = int(offset[1:3]) * 60 + int(offset[4:6])
+        args.append(-minutes if offset[0] == "-" else minutes)
+
+    return tuple(args)
+
+
 def calculate_timezone(offset: Optional[int]) -> Optional[datetime.timezone]:
     """Return a timezone instance by the given hours offset."""
     if offset is None: